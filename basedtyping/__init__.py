@@ -4,8 +4,20 @@ both type-time and at runtime.
 
 from __future__ import annotations
 
+import abc
 import ast
+import collections.abc
+import contextlib
+import copyreg
+import enum
+import functools
+import importlib
+import inspect
+import operator
+import os
+import re
 import sys
+import threading
 import types
 import typing
 import warnings
@@ -13,10 +25,13 @@ from typing import (  # type: ignore[attr-defined]
     TYPE_CHECKING,
     Any,
     Callable,
+    Dict,
     Final,
     Generic,
+    Iterable,
     Mapping,
     NoReturn,
+    Protocol,
     Sequence,
     Tuple,
     Type,
@@ -28,12 +43,19 @@ from typing import (  # type: ignore[attr-defined]
     _tp_cache,
     cast,
 )
+from weakref import WeakKeyDictionary, WeakValueDictionary, ref
 
 import typing_extensions
-from typing_extensions import Never, ParamSpec, Self, TypeAlias, TypeGuard, TypeVarTuple, override
-
-from basedtyping import transformer
-from basedtyping.runtime_only import OldUnionType
+from typing_extensions import ParamSpec, Self, TypeAlias, TypeGuard, TypeVarTuple, override
+
+from basedtyping.runtime_only import (
+    FormKind,
+    OldUnionType,
+    _identity_kinds,
+    _origin_kinds,
+    _type_kinds,
+    kind_of,
+)
 
 # TODO: `Final[Literal[False]]` basedmypy will still whinge on usages
 #  https://github.com/KotlinIsland/basedmypy/issues/782
@@ -75,6 +97,19 @@ __all__ = (
     "ForwardRef",
     "BASEDMYPY_TYPE_CHECKING",
     "get_type_hints",
+    "dispatch",
+    "literal_values",
+    "is_literal_member",
+    "are_literal_members",
+    "compile_validator",
+    "checked",
+    "validate_iter",
+    "validate_aiter",
+    "instance_mask",
+    "filter_instances",
+    "partition",
+    "warmup",
+    "awarmup",
 )
 
 if TYPE_CHECKING:
@@ -144,11 +179,44 @@ a bound in a ``TypeVar``.
 """
 
 
+# `_CallableGenericAlias` and `_CallableType` aren't in the stubs, so mypy can't check the
+#  overrides of them
+class _FunctionTypeGenericAlias(typing._CallableGenericAlias, _root=True):  # type: ignore[name-defined, call-arg, no-subclass-any]
+    """``FunctionType[[int], str]``, instances are checked against their signatures"""
+
+    def copy_with(self, params: tuple[object, ...]) -> _FunctionTypeGenericAlias:
+        return _as_function_type_alias(super().copy_with(params))  # type: ignore[no-any-expr]
+
+    @override
+    def __repr__(self) -> str:
+        args = cast(Tuple[object, ...], self.__args__)
+        if _has_unknown_parameters(args):
+            params = "..." if args[0] is ... else typing._type_repr(args[0])
+        else:
+            params = f"[{', '.join(typing._type_repr(arg) for arg in args[:-1])}]"
+        return f"basedtyping.FunctionType[{params}, {typing._type_repr(args[-1])}]"
+
+    def __instancecheck__(self, obj: object) -> bool:
+        return _is_callable_instance(obj, self)
+
+
+def _as_function_type_alias(alias: object) -> _FunctionTypeGenericAlias:
+    # the `copy_with` of `_CallableGenericAlias` doesn't use the class of `self` in some
+    #  versions, so the class is swapped instead
+    object.__setattr__(alias, "__class__", _FunctionTypeGenericAlias)
+    return cast(_FunctionTypeGenericAlias, alias)
+
+
+class _FunctionTypeForm(typing._CallableType, _root=True):  # type: ignore[name-defined, call-arg, no-subclass-any]
+    def copy_with(self, params: tuple[object, ...]) -> _FunctionTypeGenericAlias:
+        return _as_function_type_alias(super().copy_with(params))  # type: ignore[no-any-expr]
+
+
 if not BASEDMYPY_TYPE_CHECKING and TYPE_CHECKING:
     FunctionType: TypeAlias = Callable[P, T]
 else:
     # TODO: BasedSpecialGenericAlias  # noqa: TD003
-    FunctionType: _SpecialForm = typing._CallableType(types.FunctionType, 2)  # type: ignore[attr-defined]
+    FunctionType: _SpecialForm = _FunctionTypeForm(types.FunctionType, 2)
 
 AnyFunction = FunctionType[..., object]  # type: ignore[no-any-explicit]
 
@@ -170,6 +238,117 @@ def _type_convert(arg: object) -> object:
     return arg
 
 
+def _substitute(generic: object, substitutions: Mapping[TypeVar, object]) -> object:
+    """Replaces the ``TypeVar``s in ``generic`` with the types in ``substitutions``"""
+    if isinstance(generic, TypeVar):
+        return substitutions.get(generic, generic)
+    if isinstance(generic, type):
+        return generic
+    parameters = cast(Tuple[TypeVar, ...], getattr(generic, "__parameters__", ()))
+    if not parameters:
+        return generic
+    return generic[tuple(substitutions.get(parameter, parameter) for parameter in parameters)]  # type: ignore[index]
+
+
+def _has_forward_refs(form: object) -> bool:
+    """Whether there are forward references in ``form``, including the ones nested in other
+    forms (like the ``"Bar"`` in ``list["Bar"]``)"""
+    kind = kind_of(form)
+    if kind is FormKind.FORWARD_REF:
+        return True
+    if kind is FormKind.LITERAL:
+        return False
+    args = cast(object, getattr(form, "__args__", None))
+    return isinstance(args, tuple) and any(
+        _has_forward_refs(arg) for arg in cast(Tuple[object, ...], args)
+    )
+
+
+def _as_based_forward_refs(form: object) -> object:
+    """Replaces the strings and ``typing.ForwardRef``s in ``form`` (including the nested ones)
+    with ``ForwardRef``s, so that ``typing._eval_type`` evaluates all of them with the based
+    transformer"""
+    kind = kind_of(form)
+    if kind is FormKind.FORWARD_REF:
+        if isinstance(form, ForwardRef):
+            return form
+        return ForwardRef(
+            form if isinstance(form, str) else cast(typing.ForwardRef, form).__forward_arg__
+        )
+    if kind is FormKind.LITERAL:
+        return form
+    args = cast(object, getattr(form, "__args__", None))
+    if not isinstance(args, tuple):
+        return form
+    args = cast(Tuple[object, ...], args)
+    converted = tuple(_as_based_forward_refs(arg) for arg in args)
+    if all(arg is converted_arg for arg, converted_arg in zip(args, converted)):
+        return form
+    if type(form) is types.GenericAlias:  # noqa: E721 (not its subclasses)
+        return types.GenericAlias(form.__origin__, converted)
+    if isinstance(form, _GenericAlias):
+        return form.copy_with(converted)  # type: ignore[arg-type]
+    return form
+
+
+def _caller_namespace() -> tuple[dict[str, object], dict[str, object]]:
+    """The globals and locals of the code that is specializing a ``ReifiedGeneric``, which
+    its forward references are evaluated in. the frames of ``basedtyping`` and ``typing``
+    (``_tp_cache``) are skipped, and the locals are copied, as they change when the frame
+    finishes
+    """
+    frame = sys._getframe(1)
+    while True:
+        globalns = cast(Dict[str, object], frame.f_globals)
+        if globalns.get("__name__") not in {__name__, "typing"}:
+            break
+        if frame.f_back is None:
+            return {}, {}
+        frame = frame.f_back
+    localns = cast(Mapping[str, object], frame.f_locals)
+    if localns is globalns:
+        return globalns, {}
+    return globalns, dict(localns)
+
+
+def _compile_type_var_check(
+    parameters: tuple[TypeVar, ...], generics: tuple[object, ...]
+) -> Callable[[tuple[object, ...]], bool]:
+    """Creates the check for ``_ReifiedGenericMetaclass._type_var_check``, it's done once
+    when the class is created instead of on every ``isinstance``/``issubclass``.
+
+    The invariant generics are compared all at once, only the variant ones need
+    ``issubform``.
+    """
+    variant = tuple(
+        (index, parameter.__covariant__, generic)
+        for index, (parameter, generic) in enumerate(zip(parameters, generics))
+        if parameter.__covariant__ or parameter.__contravariant__
+    )
+    if not variant:
+        return generics.__eq__
+    variant_indexes = {index for index, _, _ in variant}
+    invariant_indexes = tuple(
+        index for index in range(len(generics)) if index not in variant_indexes
+    )
+    invariant_generics = tuple(generics[index] for index in invariant_indexes)
+
+    def check(args: tuple[object, ...]) -> bool:
+        if len(args) != len(generics):
+            return False
+        if tuple(args[index] for index in invariant_indexes) != invariant_generics:
+            return False
+        for index, covariant, generic in variant:
+            if covariant:
+                if not issubform(args[index], generic):  # type: ignore[arg-type]
+                    return False
+            elif not issubform(generic, args[index]):  # type: ignore[arg-type]
+                return False
+        return True
+
+    return check
+
+
 class ReifiedGenericError(TypeError):
     pass
 
@@ -199,6 +378,65 @@ class NotEnoughTypeParametersError(ReifiedGenericError):
     """
 
 
+_specialization_lock = threading.RLock()
+"""held while creating or resolving a ``ReifiedGeneric`` specialization. it's reentrant
+because specializing a class can specialize others (``Foo[Bar[T]][int]``)"""
+
+_specializations: WeakValueDictionary[tuple[type, object], type] = WeakValueDictionary()
+"""the canonical specializations, so that when multiple threads miss the ``_tp_cache`` at
+the same time they all get the same class"""
+
+
+class _SubclassCheckCache:
+    """Caches the results of a ``__subclasscheck__`` for each class, like the ``_abc_cache``
+    and ``_abc_negative_cache`` of ``abc.ABCMeta``.
+
+    The negative results are invalidated whenever a new virtual subclass is registered
+    to any ABC, as that can make a check that failed pass.
+
+    Lookups don't take the lock, only writes do.
+    """
+
+    __slots__ = ("results", "negative_version", "lock", "__weakref__")
+
+    def __init__(self):
+        # keyed by weak references so that the classes aren't kept alive by the cache
+        self.results: dict[ref[type], bool] = {}
+        self.negative_version = abc.get_cache_token()
+        self.lock = threading.Lock()
+
+    def get(self, subclass: type) -> bool | None:
+        """``None`` if there is no cached result for ``subclass``"""
+        # read the version before the results, invalidating replaces the results first
+        version = self.negative_version
+        result = self.results.get(ref(subclass))
+        if result is False and version != abc.get_cache_token():
+            with self.lock:
+                version = abc.get_cache_token()
+                # the weakref callbacks can remove entries from another thread, so iterate
+                #  over a copy
+                self.results = {key: value for key, value in self.results.copy().items() if value}
+                self.negative_version = version
+            return None
+        return result
+
+    def set(self, subclass: type, result: bool, version: object) -> None:  # noqa: FBT001
+        """``version`` is the ``abc.get_cache_token()`` from before ``result`` was computed"""
+        self_ref = ref(self)
+
+        def remove(key: ref[type]):
+            cache = self_ref()
+            if cache is not None:
+                cache.results.pop(key, None)
+
+        with self.lock:
+            if not result and version != abc.get_cache_token():
+                # a virtual subclass was registered while it was being computed, so it
+                #  could already be out of date
+                return
+            self.results[ref(subclass, remove)] = result
+
+
 class _ReifiedGenericMetaclass(type):
     # these should really only be on the class not the metaclass,
     #  but since it needs to be accessible from both instances and the class itself,
@@ -216,10 +454,46 @@ class _ReifiedGenericMetaclass(type):
      against the original one it was copied from
      in ``ReifiedGeneric.__class_getitem__``"""
 
+    _reified_parameters: tuple[TypeVar, ...]
+    """the ``TypeVar`` of the original generic class for each of the
+     ``__reified_generics__``, they determine the variance of each one"""
+
+    _compiled_type_var_check: Callable[[tuple[object, ...]], bool]
+    """checks the reified generics of a subclass against the ``__reified_generics__`` of
+     this class, created by ``_compile_type_var_check`` when the class is created"""
+
+    _generics_resolved: bool
+    """``False`` when the ``__reified_generics__`` contain forward references that
+     haven't been evaluated by ``_resolve_generics`` yet"""
+
+    _forward_ref_namespace: tuple[dict[str, object], dict[str, object]] | None
+    """the globals and locals of where the class was specialized, that the forward
+     references are evaluated in. it's cleared once they have been"""
+
+    _reified_args: tuple[object, ...]
+    """used internally to flatten chained specializations, the items that were passed
+     to ``ReifiedGeneric.__class_getitem__`` for each of the ``_orig_type_vars``"""
+
     _can_do_instance_and_subclass_checks_without_generics: bool
     """Used internally for ``isinstance`` and ``issubclass`` checks, ``True``
      when the class can currenty be used in said checks without generics in them"""
 
+    _instantiable: bool
+    """Used internally by ``__call__``, ``True`` when all of the generics of the class
+     have been reified, so that it can be instantiated"""
+
+    _subclass_check_cache: _SubclassCheckCache
+    """Used internally for ``isinstance`` and ``issubclass`` checks, each class has
+     its own"""
+
+    def __init__(cls, *args: object, **kwargs: object):
+        super().__init__(*args, **kwargs)
+        cls._subclass_check_cache = _SubclassCheckCache()
+
+    def _is_specialization(cls) -> bool:
+        """Whether this class was created by ``ReifiedGeneric.__class_getitem__``"""
+        return "__reified_generics__" in cast(Mapping[str, object], cls.__dict__)
+
     def _orig_class(cls) -> _ReifiedGenericMetaclass:
         """Gets the original class that ``ReifiedGeneric.__class_getitem__`` copied from"""
         result = cls.__bases__[0]
@@ -227,33 +501,51 @@ class _ReifiedGenericMetaclass(type):
             return cls
         return result  # type: ignore[return-value]
 
-    def _type_var_check(cls, args: tuple[type, ...]) -> bool:
-        if not cls._generics_are_reified():
-            if cls._has_non_reified_type_vars():
-                cls._raise_generics_not_reified()
-            return True
-        if len(cls._orig_class().__parameters__) != len(cls.__reified_generics__) == len(args):  # type: ignore[attr-defined]
-            raise RuntimeError
-        for parameter, self_arg, subclass_arg in zip(
-            # normal generics use __parameters__, we use __type_vars__ because the
-            #  Generic base class deletes properties named __parameters__ when copying
-            #  to a new class
-            cast(
-                Tuple[TypeVar, ...],
-                cls._orig_class().__parameters__,  # type: ignore[attr-defined]
+    def _resolve_generics(cls) -> None:
+        """Evaluates the forward references in the ``__reified_generics__`` (from
+        ``Foo["Bar"]``, ``Foo[list["Bar"]]`` or ``Foo["1 | 2"]``) with the based transformer,
+        in the namespace of where the class was specialized. This is done once, the first
+        time they are needed, and the results are stored on the specialization.
+        """
+        owner = cast(
+            _ReifiedGenericMetaclass,
+            next(
+                base
+                for base in cls.__mro__
+                if "__reified_generics__" in cast(Mapping[str, object], base.__dict__)
             ),
-            cls.__reified_generics__,
-            args,
-        ):
-            if parameter.__contravariant__:
-                if not issubform(self_arg, subclass_arg):
-                    return False
-            elif parameter.__covariant__:
-                if not issubform(subclass_arg, self_arg):
-                    return False
-            elif subclass_arg != self_arg:
-                return False
-        return True
+        )
+        with _specialization_lock:
+            # another thread could have resolved them while this one was waiting
+            if owner._generics_resolved:
+                return
+            origin = owner._orig_class()
+            globalns, localns = owner._forward_ref_namespace or ({}, {})
+            # the class can refer to itself, like `Foo["Foo[int]"]`
+            localns = {origin.__name__: origin, **localns}
+            generics = tuple(
+                _eval_type(generic, globalns, localns) for generic in owner.__reified_generics__
+            )
+            type_vars = _collect_parameters(generics)  # type: ignore[name-defined]
+            owner.__reified_generics__ = cast(Tuple[type, ...], generics)
+            owner.__type_vars__ = type_vars
+            # `staticmethod` is only callable from 3.10
+            owner._compiled_type_var_check = staticmethod(  # type: ignore[unused-ignore, assignment]
+                _compile_type_var_check(owner._reified_parameters, generics)
+            )
+            owner._instantiable = owner._orig_type_vars != type_vars and not type_vars
+            if owner._instantiable and type(owner) is _ReifiedGenericMetaclass:
+                owner.__class__ = _InstantiableReifiedGenericMetaclass
+            owner._forward_ref_namespace = None
+            # this goes last, the other threads don't take the lock before checking it
+            owner._generics_resolved = True
+
+    def _type_var_check(cls, args: tuple[type, ...]) -> bool:
+        if not cls._generics_resolved:
+            cls._resolve_generics()
+        if cls.__type_vars__:
+            cls._raise_generics_not_reified()
+        return cls._compiled_type_var_check(args)
 
     def _generics_are_reified(cls) -> bool:
         return hasattr(cls, "__type_vars__") and not bool(cls.__type_vars__)
@@ -288,6 +580,18 @@ class _ReifiedGenericMetaclass(type):
 
     @override
     def __subclasscheck__(cls, subclass: object) -> bool:
+        # could be any random object, check it's a reified generic first:
+        if not type.__instancecheck__(_ReifiedGenericMetaclass, subclass):
+            return False
+        subclass = cast(_ReifiedGenericMetaclass, subclass)
+        result = cls._subclass_check_cache.get(subclass)
+        if result is None:
+            version = abc.get_cache_token()
+            result = cls._uncached_subclasscheck(subclass)
+            cls._subclass_check_cache.set(subclass, result, version)
+        return result
+
+    def _uncached_subclasscheck(cls, subclass: object) -> bool:
         if not cls._is_subclass(subclass):
             return False
         if cls._can_do_instance_and_subclass_checks_without_generics:
@@ -304,42 +608,64 @@ class _ReifiedGenericMetaclass(type):
         if not hasattr(cls, "__reified_generics__"):
             # subclass would be narrower, so we can safely return True
             return True
+        if not subclass._generics_resolved:
+            subclass._resolve_generics()
         subclass._check_generics_reified()
         return cls._type_var_check(subclass.__reified_generics__)
 
     @override
     def __instancecheck__(cls, instance: object) -> bool:
-        if not cls._is_subclass(type(instance)):
-            return False
-        if cls._can_do_instance_and_subclass_checks_without_generics:
-            return True
-        return cls._type_var_check(cast(ReifiedGeneric[object], instance).__reified_generics__)
-
-    # need the generic here for pyright. see https://github.com/microsoft/pyright/issues/5488
-    @override
-    def __call__(cls: type[T], *args: object, **kwargs: object) -> T:
-        """A placeholder ``__call__`` method that gets called when the class is
-        instantiated directly, instead of first supplying the type parameters.
-        """
-        cls_narrowed = cast(Type[ReifiedGeneric[object]], cls)
+        # the generics of an instance are the ones on its class, so the result can be
+        #  cached for the class
+        return cls.__subclasscheck__(type(instance))
+
+    def _check_instantiable(cls) -> None:
+        if not cls._generics_resolved:
+            cls._resolve_generics()
+        # also when they were resolved by another thread since `__call__` checked
+        if cls._instantiable:
+            return
         if (
             # instantiating a ReifiedGeneric without specifying any TypeVars
-            not hasattr(cls_narrowed, "_orig_type_vars")
+            not hasattr(cls, "_orig_type_vars")
             # instantiating a subtype of a ReifiedGeneric without specifying any TypeVars
-            or cls_narrowed._orig_type_vars == cls_narrowed.__type_vars__
+            or cls._orig_type_vars == cls.__type_vars__
         ):
             raise NotReifiedError(
-                f"Cannot instantiate ReifiedGeneric {cls_narrowed.__name__!r} because"
+                f"Cannot instantiate ReifiedGeneric {cls.__name__!r} because"
                 " its type parameters were not supplied. The type parameters must be"
                 " explicitly specified in the instantiation so that the type data can"
                 " be made available at runtime.\n\nFor example:\n\nfoo: Foo[int] ="
                 " Foo()  #wrong\nfoo = Foo[T]()  #wrong\nfoo = Foo[int]()  # correct"
             )
-        cls_narrowed._check_generics_reified()
+        cls._raise_generics_not_reified()
+
+    # need the generic here for pyright. see https://github.com/microsoft/pyright/issues/5488
+    @override
+    def __call__(cls: type[T], *args: object, **kwargs: object) -> T:
+        """A placeholder ``__call__`` method that gets called when the class is
+        instantiated directly, instead of first supplying the type parameters.
+        """
+        # the specializations that can be instantiated have `_InstantiableReifiedGenericMetaclass`
+        #  instead, so this is only called when something could be wrong
+        cls_narrowed = cast(Type[ReifiedGeneric[object]], cls)
+        if not cls_narrowed._instantiable:
+            cls_narrowed._check_instantiable()
         # see comment about cls above
         return cast(T, super().__call__(*args, **kwargs))  # type:ignore[misc]
 
 
+class _InstantiableReifiedGenericMetaclass(_ReifiedGenericMetaclass):
+    """The metaclass of ``ReifiedGeneric`` specializations that have all of their generics
+    reified. Nothing needs to be checked when these are instantiated, so this uses the
+    plain ``type.__call__`` instead of ``_ReifiedGenericMetaclass.__call__``
+    """
+
+    if not TYPE_CHECKING:
+        # the signature is the same as the one from `_ReifiedGenericMetaclass`
+        __call__ = type.__call__
+
+
 GenericItems: TypeAlias = Union[type, TypeVar, Tuple[Union[type, TypeVar], ...]]
 """The ``items`` argument passed to ``__class_getitem__`` when creating or using a ``Generic``"""
 
@@ -383,6 +709,12 @@ class ReifiedGeneric(Generic[T], metaclass=_ReifiedGenericMetaclass):
     """``TypeVar``\\s that have not yet been reified. so this Tuple should always be\
     empty by the time the ``ReifiedGeneric`` is instantiated"""
 
+    _instantiable = False
+    _generics_resolved = True
+    _forward_ref_namespace: tuple[dict[str, object], dict[str, object]] | None = None
+
+    __slots__ = ()
+
     @_tp_cache  # type: ignore[no-any-expr, misc]
     def __class_getitem__(  # type: ignore[no-any-decorated]
         cls, item: GenericItems
@@ -393,18 +725,24 @@ class ReifiedGeneric(Generic[T], metaclass=_ReifiedGenericMetaclass):
             # https://github.com/KotlinIsland/basedtypeshed/issues/7
             return super().__class_getitem__(item)  # type: ignore[misc, no-any-return]
 
+        key = (cls, item)
+        try:
+            hash(key)
+        except TypeError:
+            # `_tp_cache` calls us directly with unhashable items
+            with _specialization_lock:
+                return cls._specialize(item)
+        with _specialization_lock:
+            # another thread could have created it while this one was waiting
+            specialization = _specializations.get(key)
+            if specialization is None:
+                specialization = _specializations[key] = cls._specialize(item)
+            return specialization
+
+    @classmethod
+    def _specialize(cls, item: GenericItems) -> type[ReifiedGeneric[T]]:
         items = item if isinstance(item, tuple) else (item,)
 
-        # if we're subtyping a class that already has reified generics:
-        superclass_reified_generics = tuple(
-            generic
-            for generic in (
-                cls.__reified_generics__ if hasattr(cls, "__reified_generics__") else ()
-            )
-            # TODO: investigate this unreachable, redundant-expr  # noqa: TD003
-            if not isinstance(generic, TypeVar)  # type: ignore[unused-ignore, unreachable, redundant-expr, no-any-expr]
-        )
-
         # normal generics use __parameters__, we use __type_vars__ because the
         #  Generic base class deletes properties named __parameters__ when copying
         #  to a new class
@@ -416,41 +754,95 @@ class ReifiedGeneric(Generic[T], metaclass=_ReifiedGenericMetaclass):
                 cls.__parameters__,  # type:ignore[attr-defined]
             )
         )
-
-        # add any reified generics from the superclass if there is one
-        items = superclass_reified_generics + items
         expected_length = len(orig_type_vars)
-        actual_length = len(items) - len(superclass_reified_generics)
-        if expected_length != len(items) - len(superclass_reified_generics):
+        actual_length = len(items)
+        if expected_length != actual_length:
             raise NotEnoughTypeParametersError(
                 "Incorrect number of type parameters specified. expected length:"
                 f" {expected_length}, actual length {actual_length}"
             )
-        reified_generic_copy: type[ReifiedGeneric[T]] = type(
+
+        if cls._is_specialization():
+            # specialize the original class instead of this copy of it, so that
+            #  `Foo[int, T][str]` is `Foo[int, str]`, and the MRO doesn't grow
+            substitutions = dict(zip(orig_type_vars, items))
+            args = tuple(_substitute(arg, substitutions) for arg in cls._reified_args)
+            specialization = cls._orig_class()[args if len(args) != 1 else args[0]]  # type: ignore[index]
+            return cast(Type[ReifiedGeneric[T]], specialization)
+
+        generics: tuple[object, ...] = items
+        parameters = orig_type_vars
+        # if we're subtyping a class that already has reified generics, the items replace
+        #  the ones that are still `TypeVar`s:
+        if hasattr(cls, "__reified_generics__"):
+            substitutions = dict(zip(orig_type_vars, items))
+            generics = tuple(
+                _substitute(generic, substitutions) for generic in cls.__reified_generics__
+            )
+            parameters = cls._reified_parameters
+        generics = tuple(_as_based_forward_refs(_type_convert(generic)) for generic in generics)
+        # forward references are resolved lazily by `_resolve_generics`
+        resolved = not any(_has_forward_refs(generic) for generic in generics)
+
+        type_vars = _collect_parameters(generics)  # type: ignore[name-defined]
+        instantiable = resolved and orig_type_vars != type_vars and not type_vars
+        metaclass = cast(Type[_ReifiedGenericMetaclass], type(cls))
+        if instantiable and metaclass in _reified_generic_metaclasses:
+            # not for a user defined metaclass, it can't do the fast path
+            metaclass = _InstantiableReifiedGenericMetaclass
+        reified_generic_copy = metaclass(
             cls.__name__,
             (
                 cls,  # make the copied class extend the original so normal instance checks work
             ),
-            # TODO: proper type  # noqa: TD003
-            {  # type: ignore[no-any-expr]
-                "__reified_generics__": tuple(  # type: ignore[no-any-expr]
-                    _type_convert(t)
-                    for t in items  # type: ignore[unused-ignore, no-any-expr]
+            {
+                # don't give instances a `__dict__` if the original class doesn't
+                "__slots__": (),
+                "__reified_generics__": generics,
+                "_reified_parameters": parameters,
+                "_compiled_type_var_check": staticmethod(
+                    _compile_type_var_check(parameters, generics)
                 ),
+                "_generics_resolved": resolved,
+                "_forward_ref_namespace": None if resolved else _caller_namespace(),
                 "_orig_type_vars": orig_type_vars,
-                "__type_vars__": _collect_parameters(items),  # type: ignore[name-defined]
+                "_reified_args": items,
+                "__type_vars__": type_vars,
+                "_instantiable": instantiable,
             },
         )
         # can't set it in the dict above otherwise __init_subclass__ overwrites it
         reified_generic_copy._can_do_instance_and_subclass_checks_without_generics = False
-        return reified_generic_copy
+        return cast(Type[ReifiedGeneric[T]], reified_generic_copy)
 
     @override
     def __init_subclass__(cls):
         cls._can_do_instance_and_subclass_checks_without_generics = True
+        if type(cls) is _InstantiableReifiedGenericMetaclass and not cls._instantiable:
+            # the metaclass was inherited from a specialization, but another base has
+            #  generics that haven't been reified yet
+            type.__setattr__(cls, "__class__", _ReifiedGenericMetaclass)
         super().__init_subclass__()
 
 
+_reified_generic_metaclasses = (_ReifiedGenericMetaclass, _InstantiableReifiedGenericMetaclass)
+
+
+def _reduce_reified_generic(cls: _ReifiedGenericMetaclass) -> str | tuple[object, ...]:
+    """Specializations are created dynamically, so they can't be pickled by reference,
+    instead they are pickled as the original class and the items they were created with
+    and are recreated (or taken from the cache) when unpickled.
+    """
+    if not cls._is_specialization():
+        return cls.__qualname__
+    items = cls._reified_args
+    return operator.getitem, (cls._orig_class(), items if len(items) != 1 else items[0])
+
+
+for _metaclass in _reified_generic_metaclasses:
+    copyreg.pickle(_metaclass, _reduce_reified_generic)  # type: ignore[arg-type]
+
+
 if sys.version_info >= (3, 10):
     from types import UnionType
 
@@ -461,11 +853,289 @@ else:
     _Forms: TypeAlias = Union[type, _SpecialForm, typing_extensions._SpecialForm]
 
 
-# TODO: make this work with any "form", not just unions  # noqa: TD003
-#  should be (form: TypeForm, forminfo: TypeForm)
-# TODO: form/forminfo can include _UnionGenericAlias  # noqa: TD003
+_COVARIANT, _CONTRAVARIANT, _INVARIANT = 1, -1, 0
+
+_stdlib_variance: Final[Mapping[type, tuple[int, ...]]] = {
+    **{
+        origin: (_COVARIANT,)
+        for origin in (
+            collections.abc.Iterable,
+            collections.abc.Iterator,
+            collections.abc.Reversible,
+            collections.abc.Container,
+            collections.abc.Collection,
+            collections.abc.Sequence,
+            collections.abc.Set,
+            collections.abc.KeysView,
+            collections.abc.ValuesView,
+            collections.abc.Awaitable,
+            collections.abc.AsyncIterable,
+            collections.abc.AsyncIterator,
+            contextlib.AbstractContextManager,
+            contextlib.AbstractAsyncContextManager,
+            frozenset,
+            type,
+        )
+    },
+    collections.abc.Mapping: (_INVARIANT, _COVARIANT),
+    collections.abc.ItemsView: (_COVARIANT, _COVARIANT),
+    collections.abc.Generator: (_COVARIANT, _CONTRAVARIANT, _COVARIANT),
+    collections.abc.Coroutine: (_COVARIANT, _CONTRAVARIANT, _COVARIANT),
+    collections.abc.AsyncGenerator: (_COVARIANT, _CONTRAVARIANT),
+}
+"""the variance of the parameters of the generics from the standard library that aren't
+invariant, as they don't have ``TypeVar``s at runtime"""
+
+_stdlib_arity: Final[Mapping[type, int]] = {
+    cast(type, alias.__origin__): cast(int, alias._nparams)
+    for alias in cast(Mapping[str, object], vars(typing)).values()
+    if isinstance(alias, typing._SpecialGenericAlias)  # type: ignore[attr-defined]
+}
+
+_stdlib_bases: Final[Mapping[type, tuple[tuple[TypeVar, ...], tuple[object, ...]]]] = {
+    str: ((), (typing.Sequence[str],)),
+    bytes: ((), (typing.Sequence[int],)),
+    bytearray: ((), (typing.MutableSequence[int],)),
+    range: ((), (typing.Sequence[int],)),
+    collections.Counter: ((T,), (typing.Dict[T, int],)),  # type: ignore[valid-type]
+}
+"""the parameters and generic bases of the classes from the standard library that don't pass
+their arguments on in order, as they don't have ``__orig_bases__``"""
+
+_promotions: Final[Mapping[type, tuple[type, ...]]] = {float: (int,), complex: (int, float)}
+"""the numeric tower, an ``int`` is a ``float`` even though it isn't a subclass of it"""
+
+_class_kinds: Final = (FormKind.CLASS, FormKind.REIFIED)
+
+
+def _variance(origin: type) -> tuple[int, ...] | None:
+    if origin in _stdlib_variance:
+        return _stdlib_variance[origin]
+    parameters = cast(Tuple[object, ...], getattr(origin, "__parameters__", ()))
+    if parameters and all(isinstance(parameter, TypeVar) for parameter in parameters):
+        return tuple(
+            _COVARIANT
+            if cast(TypeVar, parameter).__covariant__
+            else _CONTRAVARIANT
+            if cast(TypeVar, parameter).__contravariant__
+            else _INVARIANT
+            for parameter in parameters
+        )
+    if origin in _stdlib_arity:
+        return (_INVARIANT,) * _stdlib_arity[origin]
+    return None
+
+
+def _get_args(form: object) -> tuple[object, ...]:
+    return cast(Tuple[object, ...], typing_extensions.get_args(form))
+
+
+def _get_origin(form: object) -> object:
+    return cast(object, typing_extensions.get_origin(form))
+
+
+def _args_as(origin: type, args: tuple[object, ...], target: type) -> tuple[object, ...] | None:
+    """The ``args`` of ``origin`` as the arguments of its base ``target``, for example
+    ``dict[str, int]`` as a ``Mapping`` is ``(str, int)``
+
+    ``None`` if they can't be worked out
+    """
+    if origin is target:
+        return args
+    if origin is tuple:
+        # `tuple[int, str]` is a `Sequence[int | str]`
+        return (cast(object, Union[tuple(arg for arg in args if arg is not ...)]),)
+    if origin in _stdlib_bases:
+        parameters, orig_bases = _stdlib_bases[origin]
+    else:
+        parameters = cast(Tuple[TypeVar, ...], getattr(origin, "__parameters__", ()))
+        orig_bases = cast(
+            Tuple[object, ...],
+            cast(Mapping[str, object], origin.__dict__).get("__orig_bases__", ()),
+        )
+    if orig_bases:
+        # a user defined generic, the arguments come from the bases
+        substitutions = dict(zip(parameters, args))
+        for base in orig_bases:
+            base_origin = _get_origin(base) or base
+            if isinstance(base_origin, type) and issubclass(base_origin, target):
+                base_args = tuple(_substitute(arg, substitutions) for arg in _get_args(base))
+                return _args_as(base_origin, base_args, target)
+        return None
+    if origin is collections.abc.Coroutine and target is collections.abc.Awaitable:
+        return args[2:]
+    # the generics in the standard library pass their arguments on in order, `dict[K, V]`
+    #  is a `Mapping[K, V]`, `Iterable[K]` etc
+    arity = len(_variance(target) or ())
+    return args[:arity] if arity and len(args) >= arity else None
+
+
+def _is_equivalent(form: object, other: object) -> bool:
+    return form == other or (_issubform(form, other) and _issubform(other, form))
+
+
+def _args_are_subforms(
+    args: tuple[object, ...], info_args: tuple[object, ...], variance: tuple[int, ...]
+) -> bool:
+    if len(args) != len(info_args):
+        return False
+    for arg, info_arg, parameter_variance in zip(args, info_args, variance):
+        if parameter_variance == _COVARIANT:
+            if not _issubform(arg, info_arg):
+                return False
+        elif parameter_variance == _CONTRAVARIANT:
+            if not _issubform(info_arg, arg):
+                return False
+        elif not _is_equivalent(arg, info_arg):
+            return False
+    return True
+
+
+def _tuple_is_subform(args: tuple[object, ...], info_args: tuple[object, ...]) -> bool:
+    if len(info_args) == 2 and info_args[1] is ...:
+        # `tuple[int, ...]`
+        return all(_issubform(arg, info_args[0]) for arg in args if arg is not ...)
+    if len(args) == 2 and args[1] is ...:
+        return False
+    return len(args) == len(info_args) and all(map(_issubform, args, info_args))
+
+
+def _callable_is_subform(args: tuple[object, ...], info_args: tuple[object, ...]) -> bool:
+    *parameters, result = args
+    *info_parameters, info_result = info_args
+    if not _issubform(result, info_result):
+        return False
+    if info_parameters == [...] or parameters == [...]:
+        return True
+    if any(
+        not isinstance(parameter, type) and _get_origin(parameter) is None
+        for parameter in (*parameters, *info_parameters)
+    ):
+        # `ParamSpec`s and `Concatenate`s
+        return parameters == info_parameters
+    # the parameters are contravariant
+    return len(parameters) == len(info_parameters) and all(
+        map(_issubform, info_parameters, parameters)
+    )
+
+
+def _literal_value_is_subform(value: object, forminfo: object) -> bool:
+    info_kind = kind_of(forminfo)
+    if info_kind is FormKind.LITERAL:
+        return any(
+            type(value) is type(info_value) and value == info_value
+            for info_value in cast(Tuple[object, ...], forminfo.__args__)  # type: ignore[attr-defined]
+        )
+    if info_kind is FormKind.UNION:
+        # the value can be in any of them, like `Literal[1, 2]` in `1 | 2`
+        return any(
+            _literal_value_is_subform(value, arg)
+            for arg in cast(Tuple[object, ...], forminfo.__args__)  # type: ignore[attr-defined]
+        )
+    return _issubform(type(value), forminfo)
+
+
+def _is_subform_of_literal(form: object, forminfo: object) -> bool:
+    """only a ``bool`` or an ``Enum`` can be a subform of a ``Literal``, when all of its
+    values are in it"""
+    values: tuple[object, ...]
+    if form is bool:
+        values = (True, False)
+    elif isinstance(form, enum.EnumMeta):
+        values = tuple(form)
+    else:
+        return False
+    return bool(values) and all(_literal_value_is_subform(value, forminfo) for value in values)
+
+
+def _uncached_issubform(form: object, forminfo: object) -> bool:
+    if form is None:
+        form = type(None)
+    if forminfo is None:
+        forminfo = type(None)
+    kind, info_kind = kind_of(form), kind_of(forminfo)
+    if form is forminfo or forminfo is object or info_kind is FormKind.ANY:
+        return True
+    if kind is FormKind.NEVER:
+        return True
+    if info_kind is FormKind.NEVER or kind is FormKind.ANY:
+        return False
+    if kind is FormKind.ANNOTATED:
+        return _issubform(_get_args(form)[0], forminfo)
+    if info_kind is FormKind.ANNOTATED:
+        return _issubform(form, _get_args(forminfo)[0])
+    # the forms that are subforms when all of their parts are first, so that the others
+    #  can check their parts one at a time
+    if kind is FormKind.UNION:
+        return all(_issubform(arg, forminfo) for arg in _get_args(form))
+    if info_kind is FormKind.INTERSECTION:
+        return all(_issubform(form, arg) for arg in _get_args(forminfo))
+    if kind is FormKind.LITERAL:
+        return all(_literal_value_is_subform(value, forminfo) for value in _get_args(form))
+    if info_kind is FormKind.UNION:
+        return any(_issubform(form, arg) for arg in _get_args(forminfo))
+    if kind is FormKind.INTERSECTION:
+        return any(_issubform(arg, forminfo) for arg in _get_args(form))
+    if info_kind is FormKind.LITERAL:
+        return _is_subform_of_literal(form, forminfo)
+    if kind is FormKind.TYPEVAR:
+        constraints = cast(Tuple[object, ...], cast(TypeVar, form).__constraints__)
+        if constraints:
+            return all(_issubform(arg, forminfo) for arg in constraints)
+        return _issubform(cast(object, cast(TypeVar, form).__bound__), forminfo)
+    if kind is FormKind.NEW_TYPE:
+        return _issubform(cast(object, form.__supertype__), forminfo)  # type: ignore[attr-defined]
+    if info_kind in (FormKind.TYPEVAR, FormKind.NEW_TYPE):
+        return False
+    origin = _get_origin(form)
+    if info_kind is FormKind.TYPE_FORM:
+        # a `type[X]` is also a `TypeForm[X]`
+        if kind is not FormKind.TYPE_FORM and origin is not type and form is not type:
+            return False
+        if forminfo is TypeForm:
+            return True
+        type_args = _get_args(form) or (object,)
+        return _issubform(type_args[0], _get_args(forminfo)[0])
+    if kind is FormKind.TYPE_FORM:
+        return False
+    if kind in _class_kinds and info_kind in _class_kinds:
+        form, forminfo = cast(type, form), cast(type, forminfo)
+        return issubclass(form, forminfo) or any(
+            issubclass(form, promoted) for promoted in _promotions.get(forminfo, ())
+        )
+    # generics
+    origin = cast(type, origin or form)
+    info_origin = cast(type, _get_origin(forminfo) or forminfo)
+    if not issubclass(origin, info_origin):
+        return False
+    info_args = _get_args(forminfo)
+    if not info_args:
+        return True
+    args = _get_args(form)
+    if info_origin is tuple:
+        return _tuple_is_subform(args, info_args)
+    if info_kind is FormKind.CALLABLE:
+        return bool(args) and _callable_is_subform(
+            cast(Tuple[object, ...], form.__args__),  # type: ignore[attr-defined]
+            cast(Tuple[object, ...], forminfo.__args__),  # type: ignore[attr-defined]
+        )
+    variance = _variance(info_origin)
+    # a bare generic, like `list`, has unknown arguments, but a class that isn't generic,
+    #  like `str`, gets them from its bases
+    if (not args and _variance(origin) is not None) or variance is None:
+        return all(kind_of(arg) is FormKind.ANY or arg is object for arg in info_args)
+    args_as_info = _args_as(origin, args, info_origin)
+    return args_as_info is not None and _args_are_subforms(args_as_info, info_args, variance)
+
+
+@functools.lru_cache(maxsize=4096)  # type: ignore[no-any-expr]
+def _cached_issubform(form: object, forminfo: object, version: object) -> bool:  # noqa: ARG001
+    return _uncached_issubform(form, forminfo)
+
+
+# TODO: should be (form: TypeForm, forminfo: TypeForm)  # noqa: TD003
 def issubform(form: _Forms, forminfo: _Forms) -> bool:
-    """EXPERIMENTAL: Warning, this function currently only supports unions and ``Never``.
+    """EXPERIMENTAL: Warning, not every form is supported yet.
 
     Returns ``True`` if ``form`` is a subform (specialform or subclass) of ``forminfo``.
 
@@ -481,23 +1151,31 @@ def issubform(form: _Forms, forminfo: _Forms) -> bool:
 
     >>> issubform(int | str, object)
     True
+
+    >>> issubform(Literal[1, 2], int & SupportsIndex)
+    True
+
+    >>> issubform(list[bool], Sequence[int])
+    True
+
+    >>> issubform(Callable[[object], bool], Callable[[int], int])
+    True
+
+    It understands unions, ``Literal``, ``Intersection``, ``Annotated``, ``Never``,
+    ``TypeForm``, ``tuple`` and ``Callable``, and the arguments of generics by their
+    variance. Anything else is checked with ``issubclass``.
+
+    The results are memoized, until a virtual subclass is registered to an ABC.
     """
-    if isinstance(form, _UnionTypes):
-        # Morally, form is an instance of "UnionType | _UnionGenericAlias"
-        #  But _UnionGenericAlias doesn't have any representation at type time.
-        return all(
-            issubform(t, forminfo)
-            for t in cast(Sequence[type], form.__args__)  # type: ignore[union-attr]
-        )
-    if sys.version_info < (3, 10) and isinstance(forminfo, OldUnionType):
-        # Morally, forminfo is an instance of "_UnionGenericAlias"
-        #  But _UnionGenericAlias doesn't have any representation at type time.
-        return any(issubform(form, t) for t in cast(Sequence[type], forminfo.__args__))  # type: ignore[union-attr]
-    if form is Never:
-        return True
-    if forminfo is Never:
-        return False
-    return issubclass(form, forminfo)  # type: ignore[arg-type]
+    return _issubform(form, forminfo)
+
+
+def _issubform(form: object, forminfo: object) -> bool:
+    try:
+        hash((form, forminfo))
+    except TypeError:
+        return _uncached_issubform(form, forminfo)
+    return _cached_issubform(form, forminfo, abc.get_cache_token())
 
 
 if BASEDMYPY_TYPE_CHECKING or not TYPE_CHECKING:
@@ -518,7 +1196,84 @@ else:
     Untyped: TypeAlias = Any  # type: ignore[no-any-explicit]
 
 
+def _runtime_protocol_members(form: object) -> frozenset[str] | None:
+    """The members of a ``runtime_checkable`` ``Protocol`` that ``issubclass`` would look
+    for, ``None`` if it isn't one, or if ``issubclass`` does anything else for it
+    """
+    if not (
+        isinstance(form, type)
+        and cast(Mapping[str, object], form.__dict__).get("_is_protocol", False)
+        and cast(object, getattr(form, "_is_runtime_protocol", False))
+        # a custom `__subclasshook__` could do anything
+        and cast(str, getattr(form.__subclasshook__, "__qualname__", "")).endswith("_proto_hook")
+    ):
+        return None
+    members = typing_extensions.get_protocol_members(form)
+    if not all(callable(cast(object, getattr(form, member, None))) for member in members):
+        # `issubclass` raises an error for these
+        return None
+    return members
+
+
+def _has_members(cls: type, members: frozenset[str]) -> bool:
+    """Whether ``cls`` has all of the ``members``, and they aren't set to ``None``. Like
+    the ``__subclasshook__`` of a ``Protocol``, but for many at once in a single pass over
+    the MRO.
+    """
+    remaining = set(members)
+    for base in cls.__mro__:
+        namespace = cast(Mapping[str, object], base.__dict__)
+        found = [member for member in remaining if member in namespace]
+        if found:
+            if any(namespace[member] is None for member in found):
+                return False
+            remaining.difference_update(found)
+            if not remaining:
+                return True
+    return not remaining
+
+
 class _IntersectionGenericAlias(_BasedGenericAlias, _root=True):
+    __slots__ = (
+        "_subclass_check_cache",
+        "_arg_set",
+        "_hash",
+        "_protocol_members",
+        "_non_protocols",
+    )
+
+    _subclass_check_cache: _SubclassCheckCache
+    """the results of ``__subclasscheck__`` for each class, like on a ``ReifiedGeneric``"""
+
+    _arg_set: frozenset[object]
+    """the ``__args__``, as the order doesn't matter when comparing intersections"""
+
+    _hash: int
+
+    _protocol_members: frozenset[str] | None
+    """all of the members of the ``runtime_checkable`` ``Protocol``s in the ``__args__``,
+    so they can be checked at once, ``None`` when there aren't multiple"""
+
+    _non_protocols: tuple[type, ...]
+    """the ``__args__`` that aren't covered by the ``_protocol_members``"""
+
+    def __init__(self, origin: object, args: object, **kwargs: object):
+        # the stubs say that the origin is a class, but it's the `Intersection` special form
+        super().__init__(origin, args, **kwargs)  # type: ignore[arg-type]
+        arg_set = frozenset(self.__args__)
+        protocol_members = [_runtime_protocol_members(arg) for arg in self.__args__]
+        protocols = [members for members in protocol_members if members is not None]
+        all_protocol_members = protocols[0].union(*protocols[1:]) if len(protocols) > 1 else None
+        non_protocols = tuple(
+            arg for arg, members in zip(self.__args__, protocol_members) if members is None
+        )
+        # `_GenericAlias.__setattr__` would set them on the origin
+        object.__setattr__(self, "_subclass_check_cache", _SubclassCheckCache())
+        object.__setattr__(self, "_arg_set", arg_set)
+        object.__setattr__(self, "_hash", hash(arg_set))
+        object.__setattr__(self, "_protocol_members", all_protocol_members)
+        object.__setattr__(self, "_non_protocols", non_protocols)
+
     @override
     def copy_with(self, args: object) -> Self:  # type: ignore[override] # TODO: put in the overloads  # noqa: TD003
         return cast(Self, Intersection[args])
@@ -527,16 +1282,29 @@ class _IntersectionGenericAlias(_BasedGenericAlias, _root=True):
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, _IntersectionGenericAlias):
             return NotImplemented
-        return set(self.__args__) == set(other.__args__)
+        return self._hash == other._hash and self._arg_set == other._arg_set
 
     @override
     def __hash__(self) -> int:
-        return hash(frozenset(self.__args__))
+        return self._hash
 
     def __instancecheck__(self, obj: object) -> bool:
         return self.__subclasscheck__(type(obj))
 
-    def __subclasscheck__(self, cls: type[object]) -> bool:
+    def __subclasscheck__(self, cls: object) -> bool:
+        if not isinstance(cls, type):
+            raise TypeError("issubclass() arg 1 must be a class")
+        result = self._subclass_check_cache.get(cls)
+        if result is None:
+            version = abc.get_cache_token()
+            result = self._uncached_subclasscheck(cls)
+            self._subclass_check_cache.set(cls, result, version)
+        return result
+
+    def _uncached_subclasscheck(self, cls: type[object]) -> bool:
+        if self._protocol_members is not None and _has_members(cls, self._protocol_members):
+            return all(issubclass(cls, arg) for arg in self._non_protocols)
+        # it could still be a nominal or registered subclass of the protocols
         return all(issubclass(cls, arg) for arg in self.__args__)
 
     @override
@@ -584,7 +1352,7 @@ def Intersection(self: _BasedSpecialForm, parameters: object) -> object:  # noqa
     parameters = _remove_dups_flatten(parameters)  # type: ignore[no-any-expr]
     if len(parameters) == 1:  # type: ignore[no-any-expr]
         return parameters[0]  # type: ignore[no-any-expr]
-    return _IntersectionGenericAlias(self, parameters)  # type: ignore[arg-type, no-any-expr]
+    return _IntersectionGenericAlias(self, parameters)  # type: ignore[no-any-expr]
 
 
 class _TypeFormForm(_BasedSpecialForm, _root=True):  # type: ignore[misc]
@@ -612,6 +1380,12 @@ TypeForm = _TypeFormForm(
          """
 )
 
+# the kinds of the forms that are defined here, for `runtime_only.kind_of`
+_type_kinds[_ReifiedGenericMetaclass] = FormKind.REIFIED
+_type_kinds[_IntersectionGenericAlias] = FormKind.INTERSECTION
+_origin_kinds[TypeForm] = FormKind.TYPE_FORM
+_identity_kinds[id(TypeForm)] = FormKind.TYPE_FORM
+
 
 def as_functiontype(fn: Callable[P, T]) -> FunctionType[P, T]:
     """Asserts that a ``Callable`` is a ``FunctionType`` and returns it
@@ -629,6 +1403,262 @@ def as_functiontype(fn: Callable[P, T]) -> FunctionType[P, T]:
     return cast(FunctionType[P, T], fn)
 
 
+def _has_unknown_parameters(args: tuple[object, ...]) -> bool:
+    """whether the ``__args__`` of a ``Callable`` are ``...``, a ``ParamSpec`` or a
+    ``Concatenate``"""
+    return len(args) == 2 and (
+        args[0] is ... or kind_of(args[0]) in (FormKind.PARAM_SPEC, FormKind.SPECIAL_FORM)
+    )
+
+
+def _accepts(annotation: object, form: object) -> bool:
+    """whether a ``form`` can be used where ``annotation`` is expected, when it can't be
+    known (the annotation is missing, or generic) it's ``True``"""
+    if annotation is _missing_annotation or cast(
+        object, getattr(annotation, "__parameters__", None)
+    ):
+        return True
+    if kind_of(annotation) is FormKind.TYPEVAR:
+        return True
+    try:
+        return issubform(form, annotation)  # type: ignore[arg-type]
+    except TypeError:
+        return True
+
+
+_missing_annotation: Final = object()
+
+
+class _Function(Protocol):
+    """a ``FunctionType``, without the ``Any``s of it"""
+
+    __code__: types.CodeType
+    __annotations__: dict[str, object]
+
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        ...
+
+
+class _FunctionSignature:
+    """The parts of the signature of a function that are needed to check it against a
+    ``Callable``, it's cached on the code of the function"""
+
+    __slots__ = (
+        "annotations",
+        "positional",
+        "required_positional",
+        "var_positional",
+        "required_keyword",
+        "returns",
+        "verdicts",
+        "version",
+    )
+
+    def __init__(self, func: _Function):
+        self.annotations = func.__annotations__
+        """the ``__annotations__`` that it was created from, functions that share the
+        same code can still have different ones (from closures)"""
+        try:
+            hints: dict[str, object] = get_type_hints(func)
+        except Exception:  # noqa: BLE001
+            # the annotations can't be resolved, so nothing is known about them
+            hints = {}
+        parameters = inspect.signature(func).parameters.values()
+        positional = [
+            parameter
+            for parameter in parameters
+            if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+        ]
+        self.positional = tuple(
+            hints.get(parameter.name, _missing_annotation) for parameter in positional
+        )
+        self.required_positional = sum(
+            cast(object, parameter.default) is parameter.empty for parameter in positional
+        )
+        self.var_positional = next(
+            (
+                hints.get(parameter.name, _missing_annotation)
+                for parameter in parameters
+                if parameter.kind is parameter.VAR_POSITIONAL
+            ),
+            None,
+        )
+        """the annotation of the ``*args``, or ``None`` when there aren't any"""
+        self.required_keyword = any(
+            parameter.kind is parameter.KEYWORD_ONLY
+            and cast(object, parameter.default) is parameter.empty
+            for parameter in parameters
+        )
+        self.returns = hints.get("return", _missing_annotation)
+        self.verdicts: dict[tuple[object, int], bool] = {}
+        self.version = abc.get_cache_token()
+
+    def accepts(self, form: object, skip: int) -> bool:
+        """whether the function is an instance of the ``Callable`` ``form``, with the first
+        ``skip`` parameters already bound"""
+        if self.version != abc.get_cache_token():
+            # an ABC has a new virtual subclass, which could change the results
+            self.verdicts = {}
+            self.version = abc.get_cache_token()
+        key = (form, skip)
+        result = self.verdicts.get(key)
+        if result is None:
+            result = self.verdicts[key] = self._accepts(_get_args(form), skip)
+        return result
+
+    def _accepts(self, args: tuple[object, ...], skip: int) -> bool:
+        if not _accepts(args[-1], self.returns):
+            return False
+        if _has_unknown_parameters(args):
+            return True
+        params = args[:-1]
+        positional = self.positional[skip:]
+        if self.required_keyword or self.required_positional - skip > len(params):
+            return False
+        if len(params) > len(positional) and self.var_positional is None:
+            return False
+        return all(
+            _accepts(positional[index] if index < len(positional) else self.var_positional, param)
+            for index, param in enumerate(params)
+        )
+
+
+_function_signatures: WeakKeyDictionary[types.CodeType, _FunctionSignature] = WeakKeyDictionary()
+
+
+def _function_signature(func: _Function) -> _FunctionSignature:
+    signature = _function_signatures.get(func.__code__)
+    if signature is None or signature.annotations != func.__annotations__:
+        signature = _function_signatures[func.__code__] = _FunctionSignature(func)
+    return signature
+
+
+def _is_callable_instance(obj: object, form: object) -> bool:
+    """``isinstance`` for the ``Callable``s and ``FunctionType``s with arguments, the
+    parameters and return type of functions and methods are checked with ``issubform``,
+    other callables can't be checked, so only their type is."""
+    origin = _get_origin(form)
+    if origin is collections.abc.Callable:
+        if isinstance(obj, types.MethodType):
+            func = cast(object, obj.__func__)
+            if isinstance(func, types.FunctionType):
+                return _function_signature(func).accepts(form, 1)
+        elif not callable(obj):
+            return False
+    elif not isinstance(obj, cast(type, origin)):
+        return False
+    if isinstance(obj, types.FunctionType):
+        return _function_signature(obj).accepts(form, 0)
+    return True
+
+
+def _flatten_literal(form: object) -> tuple[object, ...]:
+    kind = kind_of(form)
+    if kind is FormKind.LITERAL:
+        return cast(Tuple[object, ...], form.__args__)  # type: ignore[attr-defined]
+    if kind is FormKind.UNION:
+        return tuple(
+            value
+            for arg in cast(Tuple[object, ...], form.__args__)  # type: ignore[attr-defined]
+            for value in _flatten_literal(arg)
+        )
+    if kind is FormKind.ANNOTATED:
+        return _flatten_literal(form.__origin__)  # type: ignore[attr-defined]
+    if form is None or form is type(None):
+        return (None,)
+    if form is bool:
+        return (True, False)
+    if isinstance(form, enum.EnumMeta):
+        return tuple(form)
+    raise TypeError(f"{form!r} is not a Literal, or a union of them")
+
+
+@functools.lru_cache(maxsize=1024)  # type: ignore[no-any-expr]
+def _literal_index(form: object) -> frozenset[tuple[type, object]]:
+    # keyed by the type as well, as `1 == True`, but `True` isn't a `Literal[1]`
+    return frozenset((type(value), value) for value in _flatten_literal(form))
+
+
+@functools.lru_cache(maxsize=1024)  # type: ignore[no-any-expr]
+def literal_values(form: object) -> frozenset[object]:
+    """All of the values that are allowed by ``form``, a ``Literal`` or a union of them (
+    like the ones that are made from ``1 | 2 | "a"``). ``bool``, ``None`` and ``Enum``
+    classes count as a ``Literal`` of all their values:
+
+    >>> literal_values(Literal[1, 2] | Literal["a"] | None)
+    frozenset({1, 2, 'a', None})
+
+    The result is cached.
+    """
+    return frozenset(value for _, value in _literal_index(form))
+
+
+def _in_literal_index(value: object, index: frozenset[tuple[type, object]]) -> bool:
+    try:
+        return (type(value), value) in index
+    except TypeError:
+        # it's unhashable, so it can't be a `Literal` value
+        return False
+
+
+def is_literal_member(value: object, form: object) -> bool:
+    """Whether ``value`` is one of the ``literal_values`` of ``form``, it has to be the same
+    type as well, so ``True`` isn't a member of ``Literal[1]``"""
+    return _in_literal_index(value, _literal_index(form))
+
+
+def are_literal_members(values: Iterable[object], form: object) -> Sequence[bool]:
+    """``is_literal_member`` for each of the ``values``.
+
+    When ``values`` is a NumPy ``ndarray``, a boolean ``ndarray`` of the same shape is
+    returned, and it's done with ``numpy.isin``.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray):  # type: ignore[no-any-expr]
+        return cast(Sequence[bool], _are_literal_members_ndarray(numpy, values, form))  # type: ignore[no-any-expr]
+    index = _literal_index(form)
+    return [_in_literal_index(value, index) for value in values]
+
+
+_ndarray_literal_types: Final[Mapping[str, type]] = {
+    "b": bool,
+    "i": int,
+    "u": int,
+    "f": float,
+    "U": str,
+    "S": bytes,
+}
+"""the types of the literal values that can be in an ``ndarray``, by ``dtype.kind``"""
+
+
+def _are_literal_members_ndarray(numpy: Any, values: Any, form: object) -> Any:  # type: ignore[no-any-explicit]
+    index = _literal_index(form)
+    literal_type = _ndarray_literal_types.get(values.dtype.kind)  # type: ignore[no-any-expr]
+    if literal_type is None:
+        # object arrays etc, the values are python objects
+        return numpy.fromiter(  # type: ignore[no-any-expr]
+            (_in_literal_index(value, index) for value in values.flat),  # type: ignore[no-any-expr]
+            dtype=bool,
+            count=values.size,  # type: ignore[no-any-expr]
+        ).reshape(values.shape)  # type: ignore[no-any-expr]
+    # only the values of the same type could be in it, so `True` doesn't match `1`
+    candidates = [value for value_type, value in index if value_type is literal_type]
+    return numpy.isin(values, candidates)  # type: ignore[no-any-expr]
+
+
+# a slot, even though typeshed says it's a `CodeType`
+_forward_code_slot = cast(
+    types.MemberDescriptorType, cast(object, typing.ForwardRef.__forward_code__)
+)
+
+_FORWARD_CODE_FILENAME = "<ForwardRef>"
+"""the compiler emits a ``SyntaxWarning`` for some based syntax (``1[2]``), it's filtered here
+once, by the filename that we compile with, because ``warnings.catch_warnings``
+changes the filters of the whole process, so it isn't thread-safe"""
+
+warnings.filterwarnings("ignore", category=SyntaxWarning, module=re.escape(_FORWARD_CODE_FILENAME))
+
+
 class ForwardRef(typing.ForwardRef, _root=True):  # type: ignore[call-arg,misc]
     """
     Like `typing.ForwardRef`, but lets older Python versions use newer typing features.
@@ -647,35 +1677,56 @@ class ForwardRef(typing.ForwardRef, _root=True):  # type: ignore[call-arg,misc]
         if not isinstance(arg, str):  # type: ignore[redundant-expr]
             raise TypeError(f"Forward reference must be a string -- got {arg!r}")
 
-        # If we do `def f(*args: *Ts)`, then we'll have `arg = '*Ts'`.
-        # Unfortunately, this isn't a valid expression on its own, so we
-        # do the unpacking manually.
-        arg_to_compile = (
-            f"({arg},)[0]"  # E.g. (*Ts,)[0] or (*tuple[int, int],)[0]
-            if arg.startswith("*")
-            else arg
-        )
+        # validate it here, but only compile `__forward_code__` if something asks for it
         try:
-            with warnings.catch_warnings():
-                # warnings come from some based syntax, i can't remember what
-                warnings.simplefilter("ignore", category=SyntaxWarning)
-                code = compile(arg_to_compile, "<string>", "eval")
+            ast.parse(self._arg_to_compile(arg), mode="eval")
         except SyntaxError:
             try:
-                ast.parse(arg_to_compile.removeprefix("def "), mode="func_type")
+                ast.parse(self._arg_to_compile(arg).removeprefix("def "), mode="func_type")
             except SyntaxError:
-                raise SyntaxError(f"invalid syntax in ForwardRef: {arg_to_compile}?") from None
-            else:
-                code = compile("'un-representable callable type'", "<string>", "eval")
+                raise SyntaxError(
+                    f"invalid syntax in ForwardRef: {self._arg_to_compile(arg)}?"
+                ) from None
 
         self.__forward_arg__ = arg
-        self.__forward_code__ = code
         self.__forward_evaluated__ = False
         self.__forward_value__ = None
         self.__forward_is_argument__ = is_argument
         self.__forward_is_class__ = is_class
         self.__forward_module__ = module
 
+    @staticmethod
+    def _arg_to_compile(arg: str) -> str:
+        # If we do `def f(*args: *Ts)`, then we'll have `arg = '*Ts'`.
+        # Unfortunately, this isn't a valid expression on its own, so we
+        # do the unpacking manually.
+        return (
+            f"({arg},)[0]"  # E.g. (*Ts,)[0] or (*tuple[int, int],)[0]
+            if arg.startswith("*")
+            else arg
+        )
+
+    # mypy doesn't see `override` on a property that overrides an attribute
+    @property  # type: ignore[explicit-override]
+    def __forward_code__(self) -> types.CodeType:
+        """compiled lazily, as we don't use it"""
+        try:
+            return cast(types.CodeType, _forward_code_slot.__get__(self))
+        except AttributeError:
+            pass
+        try:
+            code = compile(
+                self._arg_to_compile(self.__forward_arg__), _FORWARD_CODE_FILENAME, "eval"
+            )
+        except SyntaxError:
+            code = compile("'un-representable callable type'", _FORWARD_CODE_FILENAME, "eval")
+        self.__forward_code__ = code
+        return code
+
+    @__forward_code__.setter
+    def __forward_code__(self, value: types.CodeType):
+        _forward_code_slot.__set__(self, value)
+
     if sys.version_info >= (3, 13):
 
         @override
@@ -687,9 +1738,7 @@ class ForwardRef(typing.ForwardRef, _root=True):  # type: ignore[call-arg,misc]
             *,
             recursive_guard: frozenset[str],
         ) -> object | None:
-            return transformer._eval_direct(
-                self, globalns, localns if localns is None else dict(localns)
-            )
+            return _eval_direct(self, globalns, localns if localns is None else dict(localns))
 
     elif sys.version_info >= (3, 12):
 
@@ -700,11 +1749,10 @@ class ForwardRef(typing.ForwardRef, _root=True):  # type: ignore[call-arg,misc]
             localns: Mapping[str, object] | None,
             type_params: tuple[TypeVar | typing.ParamSpec | typing.TypeVarTuple, ...] | None = None,
             *,
-            recursive_guard: frozenset[str],
+            # before 3.12.4, `typing._eval_type` passes it positionally (as `type_params`)
+            recursive_guard: frozenset[str] = frozenset(),
         ) -> object | None:
-            return transformer._eval_direct(
-                self, globalns, localns if localns is None else dict(localns)
-            )
+            return _eval_direct(self, globalns, localns if localns is None else dict(localns))
 
     else:
 
@@ -715,9 +1763,17 @@ class ForwardRef(typing.ForwardRef, _root=True):  # type: ignore[call-arg,misc]
             localns: Mapping[str, object] | None,
             recursive_guard: frozenset[str],
         ) -> object | None:
-            return transformer._eval_direct(
-                self, globalns, localns if localns is None else dict(localns)
-            )
+            return _eval_direct(self, globalns, localns if localns is None else dict(localns))
+
+
+def _eval_direct(
+    ref: ForwardRef, globalns: dict[str, object] | None, localns: dict[str, object] | None
+) -> object:
+    # the transformer is only imported once something needs to be evaluated, as it's
+    #  not needed for most usages, and it's slow to import
+    from basedtyping.transformer import _eval_direct
+
+    return _eval_direct(ref, globalns, localns)
 
 
 def _type_check(arg: object, msg: str) -> object:
@@ -748,9 +1804,123 @@ def _type_check(arg: object, msg: str) -> object:
     return arg
 
 
+if sys.version_info >= (3, 13):
+
+    def _eval_type(
+        value: object, globalns: dict[str, object], localns: dict[str, object]
+    ) -> object:
+        return typing._eval_type(value, globalns, localns, type_params=())  # type: ignore[attr-defined]
+
+else:
+
+    def _eval_type(
+        value: object, globalns: dict[str, object], localns: dict[str, object]
+    ) -> object:
+        return typing._eval_type(value, globalns, localns)  # type: ignore[attr-defined]
+
+
 _strip_annotations = typing._strip_annotations  # type: ignore[attr-defined]
 
 
+_eval_type_takes_type_params = "type_params" in inspect.signature(typing._eval_type).parameters  # type: ignore[attr-defined]
+"""``type_params`` were added to ``typing._eval_type`` in 3.12.4"""
+
+
+def _eval_type_params(
+    value: object, globalns: object, localns: object, type_params: tuple[object, ...]
+) -> object:
+    if _eval_type_takes_type_params:
+        return typing._eval_type(value, globalns, localns, type_params)  # type: ignore[attr-defined]
+    return typing._eval_type(value, globalns, localns)  # type: ignore[attr-defined]
+
+
+def _contains_enum_member(form: object) -> bool:
+    """whether an evaluated annotation has an enum member that isn't in a ``Literal``"""
+    if isinstance(form, enum.Enum):
+        return True
+    if isinstance(form, (list, tuple)):
+        return any(_contains_enum_member(arg) for arg in form)
+    kind = kind_of(form)
+    if kind is FormKind.LITERAL:
+        return False
+    if kind is FormKind.ANNOTATED:
+        return _contains_enum_member(_get_args(form)[0])
+    return kind is not FormKind.OTHER and _contains_enum_member(_get_args(form))
+
+
+def _eval_hint(
+    value: object,
+    globalns: object,
+    localns: object,
+    type_params: tuple[object, ...],
+    *,
+    is_argument: bool,
+    is_class: bool,
+    transformed: bool,
+) -> object:
+    """evaluates an annotation, strings are evaluated with the based transform, unless the
+    module was already transformed when it was imported (by ``basedtyping.importhook``)"""
+    if value is None:
+        value = type(None)
+    if not isinstance(value, str):
+        return _eval_type_params(value, globalns, localns, type_params)
+    if transformed:
+        try:
+            result = _eval_type_params(
+                typing.ForwardRef(value, is_argument=is_argument, is_class=is_class),
+                globalns,
+                localns,
+                type_params,
+            )
+        except TypeError:
+            pass
+        else:
+            # the enum members can only be transformed once they are evaluated
+            if not _contains_enum_member(result):
+                return result
+    return _eval_type_params(
+        ForwardRef(value, is_argument=is_argument, is_class=is_class),
+        globalns,
+        localns,
+        type_params,
+    )
+
+
+_hints_lookup: Callable[[object], dict[str, object] | None] | None = None
+"""set by ``basedtyping.precompute`` when it's imported, it finds the hints that were stored
+ahead of time (or warmed up)"""
+
+_has_hints_file: dict[str, bool] = {}
+
+
+def _hints_file(cached: str) -> str:
+    """where ``basedtyping.precompute`` stores the hints of a module, next to its bytecode"""
+    return f"{cached.rpartition('.')[0]}.basedhints"
+
+
+def _has_stored_hints(module_name: str) -> bool:
+    result = _has_hints_file.get(module_name)
+    if result is None:
+        spec = cast(object, getattr(sys.modules.get(module_name), "__spec__", None))
+        cached = cast(object, getattr(spec, "cached", None))
+        result = isinstance(cached, str) and os.path.exists(_hints_file(cached))  # noqa: PTH110
+        _has_hints_file[module_name] = result
+    return result
+
+
+def _precomputed_hints(obj: object) -> dict[str, object] | None:
+    if _hints_lookup is None:
+        # `basedtyping.precompute` is only imported once there are stored hints
+        if isinstance(obj, types.ModuleType):
+            module_name = cast(object, obj.__name__)
+        else:
+            module_name = cast(object, getattr(obj, "__module__", None))
+        if not isinstance(module_name, str) or not _has_stored_hints(module_name):
+            return None
+        importlib.import_module("basedtyping.precompute")
+    return cast("Callable[[object], dict[str, object] | None]", _hints_lookup)(obj)
+
+
 def get_type_hints(  # type: ignore[no-any-explicit]
     obj: object
     | Callable[..., object]
@@ -782,6 +1952,12 @@ def get_type_hints(  # type: ignore[no-any-explicit]
     """
     if getattr(obj, "__no_type_check__", None):  # type: ignore[no-any-expr]
         return {}
+    if globalns is None and localns is None:
+        precomputed = _precomputed_hints(cast(object, obj))
+        if precomputed is not None:
+            if include_extras:
+                return precomputed
+            return {k: _strip_annotations(t) for k, t in precomputed.items()}
     # Classes require a special treatment.
     if isinstance(obj, type):  # type: ignore[no-any-expr]
         hints = {}
@@ -790,6 +1966,8 @@ def get_type_hints(  # type: ignore[no-any-explicit]
                 base_globals = getattr(sys.modules.get(base.__module__, None), "__dict__", {})  # type: ignore[no-any-expr]
             else:
                 base_globals = globalns
+            # `basedtyping.importhook` marks the modules that it transformed
+            transformed = bool(base_globals.get("__basedtyping_transformed__"))  # type: ignore[no-any-expr]
             ann = base.__dict__.get("__annotations__", {})  # type: ignore[no-any-expr]
             if isinstance(ann, types.GetSetDescriptorType):  # type: ignore[no-any-expr]
                 ann = {}  # type: ignore[no-any-expr]
@@ -808,20 +1986,15 @@ def get_type_hints(  # type: ignore[no-any-explicit]
                 base_locals[obj.__name__] = obj  # type: ignore[no-any-expr]
             # end not copied section
             for name, value in ann.items():  # type: ignore[no-any-expr]
-                if value is None:  # type: ignore[no-any-expr]
-                    value = type(None)
-                if isinstance(value, str):  # type: ignore[no-any-expr]
-                    value = ForwardRef(value, is_argument=False, is_class=True)
-                if sys.version_info < (3, 12):
-                    value = typing._eval_type(value, base_globals, base_locals)  # type: ignore[attr-defined, no-any-expr]
-                else:
-                    value = typing._eval_type(  # type: ignore[attr-defined]
-                        value,  # type: ignore[no-any-expr]
-                        base_globals,  # type: ignore[no-any-expr]
-                        base_locals,  # type: ignore[no-any-expr]
-                        base.__type_params__,
-                    )
-                hints[name] = value  # type: ignore[no-any-expr]
+                hints[name] = _eval_hint(  # type: ignore[no-any-expr]
+                    value,  # type: ignore[no-any-expr]
+                    base_globals,  # type: ignore[no-any-expr]
+                    base_locals,  # type: ignore[no-any-expr]
+                    getattr(base, "__type_params__", ()),  # type: ignore[no-any-expr]
+                    is_argument=False,
+                    is_class=True,
+                    transformed=transformed,
+                )
         return hints if include_extras else {k: _strip_annotations(t) for k, t in hints.items()}  # type: ignore[no-any-expr]
 
     if globalns is None:
@@ -845,19 +2018,60 @@ def get_type_hints(  # type: ignore[no-any-explicit]
         raise TypeError(f"{obj!r} is not a module, class, method, or function.")
     hints = dict(hints)  # type: ignore[no-any-expr]
     type_params = getattr(obj, "__type_params__", ())  # type: ignore[no-any-expr]
-    for name, value in hints.items():  # type: ignore[no-any-expr]
-        if value is None:  # type: ignore[no-any-expr]
-            value = type(None)
-        if isinstance(value, str):  # type: ignore[no-any-expr]
-            # class-level forward refs were handled above, this must be either
-            # a module-level annotation or a function argument annotation
-            value = ForwardRef(
-                value,
-                is_argument=not isinstance(cast(object, obj), types.ModuleType),
-                is_class=False,
-            )
-        if sys.version_info >= (3, 12):
-            hints[name] = typing._eval_type(value, globalns, localns, type_params=type_params)  # type: ignore[no-any-expr, attr-defined]
-        else:
-            hints[name] = typing._eval_type(value, globalns, localns)  # type: ignore[no-any-expr, attr-defined]
+    transformed = bool(globalns.get("__basedtyping_transformed__"))  # type: ignore[no-any-expr]
+    for name, value in hints.items():
+        # class-level forward refs were handled above, this must be either
+        # a module-level annotation or a function argument annotation
+        hints[name] = _eval_hint(  # type: ignore[no-any-expr]
+            value,  # type: ignore[no-any-expr]
+            globalns,  # type: ignore[no-any-expr]
+            localns,  # type: ignore[no-any-expr]
+            type_params,  # type: ignore[no-any-expr]
+            is_argument=not isinstance(cast(object, obj), types.ModuleType),
+            is_class=False,
+            transformed=transformed,
+        )
     return hints if include_extras else {k: _strip_annotations(t) for k, t in hints.items()}  # type: ignore[no-any-expr]
+
+
+_lazy_attributes: Final[Mapping[str, str]] = {
+    "dispatch": "basedtyping.dispatching",
+    "checked": "basedtyping.validation",
+    "compile_validator": "basedtyping.validation",
+    "filter_instances": "basedtyping.validation",
+    "instance_mask": "basedtyping.validation",
+    "partition": "basedtyping.validation",
+    "validate_aiter": "basedtyping.validation",
+    "validate_iter": "basedtyping.validation",
+    "warmup": "basedtyping.precompute",
+    "awarmup": "basedtyping.precompute",
+}
+"""the attributes that are in other modules, they are imported when they are first used
+(by ``__getattr__``), so that ``import basedtyping`` is fast"""
+
+if TYPE_CHECKING:
+    # they are in `__all__`, but at runtime they are imported by `__getattr__`
+    from basedtyping.dispatching import dispatch  # noqa: TCH004
+    from basedtyping.precompute import awarmup, warmup  # noqa: TCH004
+    from basedtyping.validation import (  # noqa: TCH004
+        checked,
+        compile_validator,
+        filter_instances,
+        instance_mask,
+        partition,
+        validate_aiter,
+        validate_iter,
+    )
+
+
+def __getattr__(name: str) -> object:
+    module = _lazy_attributes.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = cast(object, getattr(importlib.import_module(module), name))
+    cast(Dict[str, object], globals())[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*cast(Dict[str, object], globals()), *_lazy_attributes})
@@ -0,0 +1,192 @@
+"""A ``functools.singledispatch`` that can dispatch on type forms"""
+
+from __future__ import annotations
+
+import abc
+import functools
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Generic, Mapping, TypeVar, cast, overload
+from weakref import WeakKeyDictionary
+
+from basedtyping import get_type_hints, issubform
+from basedtyping.runtime_only import FormKind, kind_of
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
+__all__ = ("dispatch", "Dispatcher")
+
+R = TypeVar("R")
+
+_class_kinds = (FormKind.CLASS, FormKind.REIFIED, FormKind.INTERSECTION)
+"""the forms that can be checked with ``issubclass``"""
+
+_Handler: TypeAlias = Callable[..., R]  # type: ignore[no-any-explicit]
+
+
+def _is_more_specific(form: object, other: object) -> bool:
+    try:
+        return issubform(form, other) and not issubform(other, form)  # type: ignore[arg-type]
+    except TypeError:
+        # these forms can't be compared
+        return False
+
+
+class Dispatcher(Generic[R]):
+    """Created by ``dispatch``"""
+
+    def __init__(self, default: _Handler[R]):
+        self.default = default
+        self._registry: dict[object, _Handler[R]] = {object: default}
+        # the values of `Literal`s are dispatched on before anything else
+        self._literals: dict[tuple[type, object], _Handler[R]] = {}
+        # everything else is resolved from the type of the value, and cached
+        self._forms: list[tuple[object, _Handler[R]]] = [(object, default)]
+        self._cache: WeakKeyDictionary[type, _Handler[R]] = WeakKeyDictionary()
+        self._cache_token = abc.get_cache_token()
+        self._lock = threading.Lock()
+        functools.update_wrapper(self, default)
+
+    @property
+    def registry(self) -> Mapping[object, _Handler[R]]:
+        """All of the registered forms and their handlers"""
+        return MappingProxyType(self._registry)
+
+    @overload
+    def register(self, form: type, func: None = ...) -> Callable[[_Handler[R]], _Handler[R]]:
+        ...
+
+    # the forms that aren't classes can be callable too, but they aren't handlers
+    @overload
+    def register(self, form: _Handler[R], func: None = ...) -> _Handler[R]:  # type: ignore[overload-overlap]
+        ...
+
+    @overload
+    def register(self, form: object, func: None = ...) -> Callable[[_Handler[R]], _Handler[R]]:
+        ...
+
+    @overload
+    def register(self, form: object, func: _Handler[R]) -> _Handler[R]:
+        ...
+
+    def register(
+        self, form: object, func: _Handler[R] | None = None
+    ) -> _Handler[R] | Callable[[_Handler[R]], _Handler[R]]:
+        """Registers ``func`` as the handler for values of ``form``.
+
+        Can be used as a decorator, with the form as an argument or taken from the
+        annotation of the first parameter (based denotations are supported):
+
+            @fn.register
+            def _(value: Foo[int] | 1 | 2): ...
+        """
+        if func is None:
+            if not _is_dispatchable(form):
+                func = cast(_Handler[R], form)
+                hints = get_type_hints(func)
+                hints.pop("return", None)
+                if not hints:
+                    raise TypeError(
+                        f"Invalid first argument to `register()`: {func!r}. Use either"
+                        " `@register(some_form)`, or plain `@register` on an annotated"
+                        " function."
+                    )
+                form = next(iter(hints.values()))
+            else:
+
+                def decorator(func: _Handler[R]) -> _Handler[R]:
+                    return self.register(form, func)
+
+                return decorator
+        with self._lock:
+            self._add(form, func)
+            self._registry[form] = func
+            self._cache.clear()
+        return func
+
+    def _add(self, form: object, func: _Handler[R]):
+        if form is None:
+            form = type(None)
+        kind = kind_of(form)
+        if kind is FormKind.UNION:
+            for arg in cast(tuple[object, ...], form.__args__):  # type: ignore[attr-defined]
+                self._add(arg, func)
+        elif kind is FormKind.LITERAL:
+            for value in cast(tuple[object, ...], form.__args__):  # type: ignore[attr-defined]
+                self._literals[(type(value), value)] = func
+        elif kind in _class_kinds:
+            self._forms.append((form, func))
+        else:
+            raise TypeError(f"{form!r} is not a form that can be dispatched on")
+
+    def dispatch(self, value: object) -> _Handler[R]:
+        """The handler that ``value`` would be dispatched to"""
+        if self._literals:
+            try:
+                return self._literals[(type(value), value)]
+            except (KeyError, TypeError):  # TypeError when the value isn't hashable
+                pass
+        cls = type(value)
+        if self._cache_token != abc.get_cache_token():
+            # an ABC has a new virtual subclass, which could change the results
+            with self._lock:
+                self._cache.clear()
+                self._cache_token = abc.get_cache_token()
+        try:
+            return self._cache[cls]
+        except KeyError:
+            pass
+        version = abc.get_cache_token()
+        # resolve it with the lock held, so a concurrent `register` can't leave a stale
+        #  handler in the cache
+        with self._lock:
+            handler = self._find(cls)
+            # or a virtual subclass being registered while it was resolved
+            if version == abc.get_cache_token():
+                self._cache[cls] = handler
+        return handler
+
+    def _find(self, cls: type) -> _Handler[R]:
+        candidates = [(form, func) for form, func in self._forms if issubclass(cls, form)]  # type: ignore[arg-type]
+        # the most specific forms, when they can't be compared the first registered wins
+        return next(
+            func
+            for form, func in candidates
+            if not any(_is_more_specific(other, form) for other, _ in candidates)
+        )
+
+    def __call__(self, value: object, /, *args: object, **kwargs: object) -> R:
+        return self.dispatch(value)(value, *args, **kwargs)
+
+
+def _is_dispatchable(form: object) -> bool:
+    return kind_of(form) in (*_class_kinds, FormKind.NONE, FormKind.UNION, FormKind.LITERAL)
+
+
+def dispatch(func: _Handler[R]) -> Dispatcher[R]:
+    """Like ``functools.singledispatch``, but handlers can also be registered for
+    ``ReifiedGeneric`` specializations, ``Intersection``s, unions and ``Literal``s:
+
+        @dispatch
+        def handle(value: object) -> str:
+            return "default"
+
+        @handle.register
+        def _(value: Foo[int] | Foo[str]) -> str: ...
+
+        @handle.register(Intersection[A, B])
+        def _(value: A) -> str: ...
+
+        @handle.register(Literal[1, 2])
+        def _(value: int) -> str: ...
+
+    ``Literal`` values are looked up first, then the handler is resolved from the type of
+    the value and cached, so the cost of a call doesn't grow with the amount of handlers.
+    (the reified generics of an instance are the ones on its class, so they are covered
+    by the type)
+
+    When multiple forms match, the most specific one is used (by ``issubform``), if they
+    can't be compared, the one that was registered first is used.
+    """
+    return Dispatcher(func)
@@ -0,0 +1,368 @@
+"""An import hook that applies the based transform to the annotations of modules when they
+are imported, so that ``get_type_hints`` doesn't need to at runtime:
+
+    from basedtyping import importhook
+
+    importhook.install("my_package")
+
+The transformed code is cached in ``__pycache__`` (next to the normal bytecode, with an
+``opt-based`` tag), so it's only done when the module changes.
+"""
+
+from __future__ import annotations
+
+import ast
+import contextlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import marshal
+import sys
+from typing import TYPE_CHECKING, Callable, Iterator, Mapping, Sequence, cast
+
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    import types
+    from importlib.machinery import ModuleSpec
+
+__all__ = ("install", "uninstall", "BasedFinder", "BasedLoader")
+
+_VERSION = 1
+"""changing the transform needs a new version, so that the cached bytecode is replaced"""
+
+_TYPING = "_basedtyping_hook_typing"
+_BASEDTYPING = "_basedtyping_hook"
+TRANSFORMED = "__basedtyping_transformed__"
+"""set in the modules that were transformed, ``get_type_hints`` checks it"""
+
+
+def _name_of(node: ast.expr) -> str | None:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+class AnnotationTransformer(ast.NodeTransformer):
+    """The parts of ``CringeTransformer`` that can be done without evaluating anything:
+    ``1 | 2``, ``A & B``, ``(int) -> str``, ``x is T``, tuples and string forward
+    references. Enum members (``E.a``) need to be evaluated, so they are left to
+    ``get_type_hints``
+    """
+
+    _implicit_tuple = False
+    typing_module = _TYPING
+    """the names that the transformed annotations refer to the modules by"""
+    basedtyping_module = _BASEDTYPING
+
+    def __init__(self) -> None:
+        self.modules_used = set[str]()
+
+    def _module(self, name: str, attr: str) -> ast.Attribute:
+        self.modules_used.add(name)
+        return ast.Attribute(value=ast.Name(id=name, ctx=ast.Load()), attr=attr, ctx=ast.Load())
+
+    def _typing(self, attr: str) -> ast.Attribute:
+        return self._module(self.typing_module, attr)
+
+    def _subscript(self, value: ast.expr, slice_: ast.expr) -> ast.Subscript:
+        return ast.Subscript(value=value, slice=slice_, ctx=ast.Load())
+
+    @contextlib.contextmanager
+    def implicit_tuple(self, *, value: bool = True) -> Iterator[None]:
+        implicit_tuple = self._implicit_tuple
+        self._implicit_tuple = value
+        try:
+            yield
+        finally:
+            self._implicit_tuple = implicit_tuple
+
+    def transform(self, node: ast.expr) -> ast.expr:
+        with self.implicit_tuple(value=False):
+            return cast(ast.expr, self.visit(node))
+
+    def transform_source(self, source: str) -> ast.expr:
+        """transforms a string annotation, it can be a ``(int) -> str``"""
+        try:
+            tree: ast.AST = ast.parse(source.strip(), mode="eval")
+        except SyntaxError:
+            arg = source.strip()
+            if arg.startswith(("def ", "def(")):
+                arg = arg[3:].lstrip()
+            tree = ast.parse(arg, mode="func_type")
+        if isinstance(tree, ast.FunctionType):
+            return self.transform(
+                self._subscript(
+                    self._typing("Callable"),
+                    ast.Tuple(
+                        [ast.List(tree.argtypes, ctx=ast.Load()), tree.returns], ctx=ast.Load()
+                    ),
+                )
+            )
+        return self.transform(tree.body)
+
+    @override
+    def visit_Subscript(self, node: ast.Subscript) -> ast.AST:
+        name = _name_of(node.value)
+        if name == "Literal":
+            return node
+        if name == "Annotated":
+            if isinstance(node.slice, ast.Tuple):
+                node.slice.elts[0] = self.transform(node.slice.elts[0])
+            else:
+                node.slice = self.transform(node.slice)
+            return node
+        node.value = self.transform(node.value)
+        with self.implicit_tuple():
+            node.slice = cast(ast.expr, self.visit(node.slice))
+        return node
+
+    @override
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        value = cast(object, node.value)
+        if isinstance(value, str):
+            # a forward reference
+            return self.transform_source(value)
+        if isinstance(value, int):
+            return self._subscript(self._typing("Literal"), node)
+        return node
+
+    @override
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        if isinstance(node.operand, ast.Constant) and isinstance(node.op, (ast.UAdd, ast.USub)):
+            return self._subscript(self._typing("Literal"), node)
+        return node
+
+    @override
+    def visit_Tuple(self, node: ast.Tuple) -> ast.AST:
+        implicit_tuple = self._implicit_tuple
+        with self.implicit_tuple(value=False):
+            node = cast(ast.Tuple, self.generic_visit(node))
+        if not implicit_tuple:
+            return self._subscript(self._typing("Tuple"), node)
+        return node
+
+    @override
+    def visit_List(self, node: ast.List) -> ast.AST:
+        # the parameters of a `Callable`
+        with self.implicit_tuple(value=False):
+            return self.generic_visit(node)
+
+    @override
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        if len(node.ops) == 1 and isinstance(node.ops[0], ast.Is):
+            return self._subscript(self._typing("TypeIs"), self.transform(node.comparators[0]))
+        return self.generic_visit(node)
+
+    @override
+    def visit_IfExp(self, node: ast.IfExp) -> ast.AST:
+        if (
+            isinstance(node.body, ast.Compare)
+            and len(node.body.comparators) == 1
+            and isinstance(node.body.ops[0], ast.Is)
+        ):
+            node.body = self._subscript(
+                self._typing("TypeGuard"), self.transform(node.body.comparators[0])
+            )
+            return node
+        return self.generic_visit(node)
+
+    @override
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        node.left = self.transform(node.left)
+        node.right = self.transform(node.right)
+        if isinstance(node.op, ast.BitAnd):
+            intersection = self._module(self.basedtyping_module, "Intersection")
+            return self._subscript(intersection, ast.Tuple([node.left, node.right], ctx=ast.Load()))
+        return node
+
+
+def _is_unchanged(source: str, transformed: ast.expr) -> bool:
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except SyntaxError:
+        return False
+    return ast.dump(tree.body) == ast.dump(transformed)
+
+
+class _StringAnnotationTransformer(ast.NodeTransformer):
+    """without ``from __future__ import annotations``, the annotations are evaluated when
+    the module is run, so only the strings in them can be transformed"""
+
+    def __init__(self, transformer: AnnotationTransformer):
+        self.transformer = transformer
+
+    @override
+    def visit_Subscript(self, node: ast.Subscript) -> ast.AST:
+        name = _name_of(node.value)
+        if name == "Literal":
+            return node
+        if name == "Annotated" and isinstance(node.slice, ast.Tuple):
+            node.slice.elts[0] = cast(ast.expr, self.visit(node.slice.elts[0]))
+            return node
+        return self.generic_visit(node)
+
+    @override
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        value = cast(object, node.value)
+        if not isinstance(value, str):
+            return node
+        try:
+            transformed = self.transformer.transform_source(value)
+        except SyntaxError:
+            # it could be something else, like the metadata of an `Annotated`
+            return node
+        if _is_unchanged(value, transformed):
+            return node
+        return ast.Constant(ast.unparse(transformed))
+
+
+def _has_future_annotations(tree: ast.Module) -> bool:
+    return any(
+        isinstance(statement, ast.ImportFrom)
+        and statement.module == "__future__"
+        and any(alias.name == "annotations" for alias in statement.names)
+        for statement in tree.body
+    )
+
+
+def _annotations(tree: ast.Module) -> Iterator[tuple[ast.AST, str]]:
+    """the nodes that have annotations, and the name of the field"""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.AnnAssign) or (isinstance(node, ast.arg) and node.annotation):
+            yield node, "annotation"
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.returns:
+            yield node, "returns"
+
+
+def _preamble_length(tree: ast.Module) -> int:
+    """the amount of statements that have to stay at the start, the docstring and the
+    ``__future__`` imports"""
+    length = 0
+    for index, statement in enumerate(tree.body):
+        is_docstring = (
+            index == 0
+            and isinstance(statement, ast.Expr)
+            and isinstance(statement.value, ast.Constant)
+            and isinstance(cast(object, statement.value.value), str)
+        )
+        is_future = isinstance(statement, ast.ImportFrom) and statement.module == "__future__"
+        if not (is_docstring or is_future):
+            break
+        length = index + 1
+    return length
+
+
+def transform_module(tree: ast.Module) -> ast.Module:
+    """Transforms the annotations in ``tree``, and adds the imports that they need"""
+    transformer = AnnotationTransformer()
+    visit: Callable[[ast.expr], ast.expr]
+    if _has_future_annotations(tree):
+        visit = transformer.transform
+    else:
+        visit = cast(
+            Callable[[ast.expr], ast.expr], _StringAnnotationTransformer(transformer).visit
+        )
+    for node, field in _annotations(tree):
+        annotation = cast(ast.expr, getattr(node, field))
+        try:
+            setattr(node, field, visit(annotation))
+        except SyntaxError:
+            # it's an invalid annotation, get_type_hints will raise the error
+            continue
+    index = _preamble_length(tree)
+    tree.body[index:index] = ast.parse(
+        f"import typing_extensions as {_TYPING}\n"
+        f"import basedtyping as {_BASEDTYPING}\n"
+        f"{TRANSFORMED} = True\n"
+    ).body
+    return ast.fix_missing_locations(tree)
+
+
+class BasedLoader(importlib.machinery.SourceFileLoader):
+    """A ``SourceFileLoader`` that transforms the annotations of the module, the result is
+    cached separately from the normal bytecode"""
+
+    @override
+    def source_to_code(  # type: ignore[override]
+        self, data: bytes, path: str, *, _optimize: int = -1
+    ) -> types.CodeType:
+        tree = cast(ast.Module, compile(data, path, "exec", ast.PyCF_ONLY_AST, dont_inherit=True))
+        return compile(transform_module(tree), path, "exec", dont_inherit=True, optimize=_optimize)
+
+    @override
+    def get_code(self, fullname: str) -> types.CodeType:
+        source_path = self.get_filename(fullname)
+        bytecode_path = importlib.util.cache_from_source(
+            source_path, optimization=f"based{_VERSION}{sys.flags.optimize or ''}"
+        )
+        stats = cast(Mapping[str, float], self.path_stats(source_path))
+        # the same header as the normal bytecode: the magic number, the flags, and the
+        #  modification time and size of the source
+        header = b"".join(
+            (
+                importlib.util.MAGIC_NUMBER,
+                (0).to_bytes(4, "little"),
+                (int(stats["mtime"]) & 0xFFFFFFFF).to_bytes(4, "little"),
+                (int(stats["size"]) & 0xFFFFFFFF).to_bytes(4, "little"),
+            )
+        )
+        try:
+            data = self.get_data(bytecode_path)
+        except OSError:
+            pass
+        else:
+            if data[:16] == header:
+                return cast("types.CodeType", marshal.loads(memoryview(data)[16:]))  # noqa: S302
+        code = self.source_to_code(self.get_data(source_path), source_path)
+        if not sys.dont_write_bytecode:
+            with contextlib.suppress(OSError, NotImplementedError):
+                self.set_data(bytecode_path, header + marshal.dumps(code))
+        return code
+
+
+class BasedFinder(importlib.abc.MetaPathFinder):
+    """Finds the modules in ``packages`` (and their submodules) with ``BasedLoader``"""
+
+    def __init__(self, packages: Sequence[str]):
+        self.packages = set(packages)
+
+    def _applies_to(self, fullname: str) -> bool:
+        return any(
+            fullname == package or fullname.startswith(f"{package}.") for package in self.packages
+        )
+
+    @override
+    def find_spec(
+        self, fullname: str, path: Sequence[str] | None, target: types.ModuleType | None = None
+    ) -> ModuleSpec | None:
+        if not self._applies_to(fullname):
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if spec is None or not isinstance(spec.loader, importlib.machinery.SourceFileLoader):
+            return spec
+        spec.loader = BasedLoader(spec.loader.name, spec.loader.path)
+        return spec
+
+
+def _finder() -> BasedFinder | None:
+    return next((finder for finder in sys.meta_path if isinstance(finder, BasedFinder)), None)
+
+
+def install(*packages: str) -> None:
+    """Transforms the annotations of ``packages`` (and their submodules) when they are
+    imported, it needs to be called before they are imported"""
+    finder = _finder()
+    if finder is None:
+        sys.meta_path.insert(0, BasedFinder(packages))
+    else:
+        finder.packages.update(packages)
+
+
+def uninstall() -> None:
+    """Removes the hook, the modules that were already imported stay transformed"""
+    finder = _finder()
+    if finder is not None:
+        sys.meta_path.remove(finder)
@@ -0,0 +1,383 @@
+"""Resolves the type hints of a package ahead of time, and stores them next to its bytecode,
+so that ``get_type_hints`` can load them instead of evaluating the annotations:
+
+    python -m basedtyping.precompute my_package
+
+The hints of each module are keyed by the hash of its source and the Python version, so
+changed modules are evaluated again. The hints are stored resolved, if they use an alias
+from another module that changed, then it needs to be run again (for example as part of
+the deployment).
+
+``warmup`` resolves the hints in memory instead, in the background when the program starts.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import importlib.util
+import os
+import pickle
+import pkgutil
+import sys
+import threading
+import types
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Mapping, Protocol, Tuple, Union, cast
+from weakref import WeakKeyDictionary
+
+import basedtyping
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+__all__ = ("precompute", "precomputed_hints", "warmup", "awarmup")
+
+_MAGIC = b"BTH1"
+"""changing the format needs a new magic, so that the stored hints are replaced"""
+
+_Dependencies = Tuple[Tuple[str, bytes], ...]
+"""the other modules that the hints depend on, and the hashes of their sources"""
+
+_Entry = Union[Tuple[_Dependencies, bytes], Dict[str, object], None]
+"""the stored hints, they are unpickled the first time that they are needed (and ``None``
+when they can't be)"""
+
+_modules: dict[str, tuple[object, dict[str, _Entry]]] = {}
+"""the hints of each module that were loaded, by the key of the object, with the spec of the
+module that they were loaded for (a reloaded module has a new one)"""
+
+_source_hashes: dict[str, tuple[object, bytes | None]] = {}
+
+_warmed: WeakKeyDictionary[object, tuple[object, dict[str, object]]] = WeakKeyDictionary()
+"""the hints that ``warmup`` resolved, they are kept for as long as the object is, with the
+spec of the module (when it's one), as a reloaded module is the same object with a new spec"""
+
+
+def _key(obj: object) -> tuple[str, str] | None:
+    """the module of ``obj``, and the key of its hints in that module"""
+    if isinstance(obj, types.ModuleType):
+        return obj.__name__, ""
+    if isinstance(obj, type):
+        qualname = obj.__qualname__
+    elif isinstance(obj, types.FunctionType):
+        if hasattr(obj, "__wrapped__"):
+            # wrappers have the name of the function that they wrap, but their code is shared
+            #  with the other wrappers, so nothing tells them apart
+            return None
+        code = obj.__code__
+        # the place of the code tells apart the functions that have the same name, like
+        #  overloads
+        qualname = f"{obj.__qualname__}:{code.co_filename}:{code.co_firstlineno}"
+    else:
+        return None
+    if "<locals>" in qualname:
+        return None
+    return obj.__module__, qualname
+
+
+def _spec(module_name: str) -> object:
+    return cast(object, getattr(sys.modules.get(module_name), "__spec__", None))
+
+
+def _source_file(module_name: str) -> str | None:
+    file = cast(Union[str, None], getattr(sys.modules.get(module_name), "__file__", None))
+    if file is None or not file.endswith(".py"):
+        return None
+    return file
+
+
+def _source_hash(module_name: str) -> bytes | None:
+    spec = _spec(module_name)
+    cached = _source_hashes.get(module_name)
+    if cached is not None and cached[0] is spec:
+        return cached[1]
+    file = _source_file(module_name)
+    source_hash = None
+    if file is not None:
+        with contextlib.suppress(OSError):
+            source_hash = importlib.util.source_hash(Path(file).read_bytes())
+    _source_hashes[module_name] = spec, source_hash
+    return source_hash
+
+
+def _hints_file(source_file: str) -> Path:
+    # `cache_from_source` has the Python version in the name, like the bytecode
+    return Path(basedtyping._hints_file(importlib.util.cache_from_source(source_file)))
+
+
+def _header(module_name: str) -> bytes | None:
+    source_hash = _source_hash(module_name)
+    if source_hash is None:
+        return None
+    return _MAGIC + importlib.util.MAGIC_NUMBER + source_hash
+
+
+def _load(module_name: str) -> dict[str, _Entry]:
+    file = _source_file(module_name)
+    if file is None:
+        return {}
+    try:
+        data = _hints_file(file).read_bytes()
+    except OSError:
+        return {}
+    header = _header(module_name)
+    if header is None or data[: len(header)] != header:
+        return {}
+    return cast(Dict[str, _Entry], pickle.loads(memoryview(data)[len(header) :]))  # noqa: S301
+
+
+def _unpickle(dependencies: _Dependencies, data: bytes) -> dict[str, object] | None:
+    if any(_source_hash(name) != source_hash for name, source_hash in dependencies):
+        return None
+    try:
+        return cast(Dict[str, object], pickle.loads(data))  # noqa: S301
+    except (pickle.UnpicklingError, AttributeError, ImportError):
+        # something that the hints refer to was changed
+        return None
+
+
+def _entries(module_name: str) -> dict[str, _Entry]:
+    spec = _spec(module_name)
+    loaded = _modules.get(module_name)
+    if loaded is None or loaded[0] is not spec:
+        loaded = _modules[module_name] = spec, _load(module_name)
+    return loaded[1]
+
+
+def _warmed_version(obj: object) -> object:
+    return cast(object, obj.__spec__) if isinstance(obj, types.ModuleType) else None
+
+
+def precomputed_hints(obj: object) -> dict[str, object] | None:
+    """the warmed up or stored hints of ``obj`` (with the extras), or ``None`` when there
+    aren't any"""
+    if isinstance(obj, (types.ModuleType, type, types.FunctionType)):
+        warmed = _warmed.get(obj)
+        if warmed is not None and warmed[0] is _warmed_version(obj):
+            return dict(warmed[1])
+    key = _key(obj)
+    if key is None:
+        return None
+    module_name, qualname = key
+    entries = _entries(module_name)
+    entry = entries.get(qualname)
+    if isinstance(entry, tuple):
+        entry = entries[qualname] = _unpickle(*entry)
+    return None if entry is None else dict(entry)
+
+
+basedtyping._hints_lookup = precomputed_hints
+
+
+def _members(owner: types.ModuleType | type) -> Iterator[object]:
+    """the classes and functions that are defined in ``owner``"""
+    module_name = owner.__name__ if isinstance(owner, types.ModuleType) else owner.__module__
+    seen = set[int]()
+    namespaces = [cast(Mapping[str, object], vars(owner))]
+    while namespaces:
+        for value in list(namespaces.pop().values()):
+            member = cast(object, getattr(value, "__func__", value))
+            if (
+                not isinstance(member, (type, types.FunctionType))
+                or member.__module__ != module_name
+                or id(member) in seen
+            ):
+                continue
+            seen.add(id(member))
+            yield member
+            if isinstance(member, type):
+                namespaces.append(cast(Mapping[str, object], vars(member)))
+
+
+def _dependencies(module: types.ModuleType, obj: object) -> _Dependencies | None:
+    """the inherited annotations of a class can come from other modules"""
+    names = {
+        base.__module__
+        for base in cast(Tuple[type, ...], getattr(obj, "__mro__", ()))
+        if "__annotations__" in cast(Mapping[str, object], vars(base))
+    } - {module.__name__}
+    dependencies = tuple((name, _source_hash(name)) for name in sorted(names))
+    if any(source_hash is None for _, source_hash in dependencies):
+        return None
+    return cast(_Dependencies, dependencies)
+
+
+def _pickle(hints: dict[str, object]) -> bytes | None:
+    try:
+        data = pickle.dumps(hints)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # it refers to something that can't be pickled, like a local class
+        return None
+    # some forms don't compare equal when they are unpickled
+    return data if cast(object, pickle.loads(data)) == hints else None  # noqa: S301
+
+
+def _store(module: types.ModuleType) -> bool:
+    """evaluates the hints of ``module`` and stores them, returns if it was stored"""
+    from basedtyping import get_type_hints
+
+    file = _source_file(module.__name__)
+    header = _header(module.__name__)
+    if file is None or header is None:
+        return False
+    # don't use the hints that are already stored
+    _modules[module.__name__] = _spec(module.__name__), {}
+    entries: dict[str, _Entry] = {}
+    for obj in (module, *_members(module)):
+        key = _key(obj)
+        dependencies = _dependencies(module, obj)
+        if key is None or dependencies is None:
+            continue
+        try:
+            hints = get_type_hints(obj, include_extras=True)
+        except Exception:  # noqa: BLE001, S112
+            # it will be evaluated (and raise the error) when it's used
+            continue
+        data = _pickle(hints)
+        if data is not None:
+            entries[key[1]] = (dependencies, data)
+    hints_file = _hints_file(file)
+    hints_file.parent.mkdir(parents=True, exist_ok=True)
+    temporary = hints_file.with_name(f"{hints_file.name}.{os.getpid()}")
+    temporary.write_bytes(header + pickle.dumps(entries))
+    temporary.replace(hints_file)
+    del _modules[module.__name__]
+    basedtyping._has_hints_file.pop(module.__name__, None)
+    return True
+
+
+def _import(name: str) -> types.ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError as error:
+        # an optional part of the package
+        print(f"skipping {name}: {error}", file=sys.stderr)  # noqa: T201
+        return None
+
+
+def _walk(package: str) -> Iterator[types.ModuleType]:
+    module = importlib.import_module(package)
+    yield module
+    path = cast(Union[list[str], None], getattr(module, "__path__", None))
+    if path is None:
+        return
+    for info in pkgutil.walk_packages(path, prefix=f"{package}."):
+        submodule = _import(info.name)
+        if submodule is not None:
+            yield submodule
+
+
+def precompute(*packages: str) -> int:
+    """Imports ``packages`` (and their submodules), and stores the hints that are in them,
+    returns the amount of modules that were stored"""
+    return sum(_store(module) for package in packages for module in _walk(package))
+
+
+def _remember(obj: object) -> bool:
+    """resolves the hints of ``obj``, so that ``get_type_hints`` doesn't need to"""
+    from basedtyping import get_type_hints
+
+    if not isinstance(obj, (types.ModuleType, type, types.FunctionType)):
+        return False
+    try:
+        hints = get_type_hints(obj, include_extras=True)
+    except Exception:  # noqa: BLE001
+        # it will be evaluated (and raise the error) when it's used
+        return False
+    _warmed[obj] = _warmed_version(obj), hints
+    return True
+
+
+def _objects(targets: Iterable[object]) -> Iterator[object]:
+    for target in targets:
+        yield target
+        if isinstance(target, (types.ModuleType, type)):
+            yield from _members(target)
+
+
+class _Generic(Protocol):
+    """a generic class or special form, like ``Intersection``"""
+
+    def __getitem__(self, parameters: object, /) -> object:
+        ...
+
+
+def _create(form: tuple[object, object]) -> None:
+    generic, parameters = form
+    # they are cached when they are created
+    cast(_Generic, generic)[parameters]
+
+
+def _warm(targets: list[object], forms: list[tuple[object, object]], workers: int) -> int:
+    for form in forms:
+        _create(form)
+    if workers <= 1:
+        return sum(map(_remember, _objects(targets)))
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(workers, thread_name_prefix="basedtyping-warmup") as executor:
+        return sum(executor.map(_remember, _objects(targets)))
+
+
+def warmup(
+    targets: Iterable[object], *, forms: Iterable[tuple[object, object]] = (), workers: int = 1
+) -> Future[int]:
+    """Resolves the hints of ``targets`` (modules, classes and functions, and the ones that
+    are defined in them) in a background thread, so that ``get_type_hints`` doesn't need to
+    evaluate them when they are first used.
+
+    ``forms`` are the ``(generic, parameters)`` to create, like ``(Intersection, (A, B))``
+    or ``(SomeReifiedGeneric, int)``. returns a future of the amount of objects whose hints
+    were resolved.
+
+    the hints are evaluated with the GIL, so ``workers`` mostly helps when it imports
+    modules
+    """
+    from concurrent.futures import Future
+
+    future = Future[int]()
+    target_list, form_list = list(targets), list(forms)
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(_warm(target_list, form_list, workers))
+        except BaseException as error:  # noqa: BLE001
+            future.set_exception(error)
+
+    threading.Thread(target=run, name="basedtyping-warmup", daemon=True).start()
+    return future
+
+
+async def awarmup(targets: Iterable[object], *, forms: Iterable[tuple[object, object]] = ()) -> int:
+    """Like ``warmup``, but in the event loop, it lets the other tasks run after each
+    object"""
+    import asyncio
+
+    for form in forms:
+        _create(form)
+        await asyncio.sleep(0)
+    count = 0
+    for obj in _objects(targets):
+        count += _remember(obj)
+        await asyncio.sleep(0)
+    return count
+
+
+def main(argv: list[str] | None = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m basedtyping.precompute",
+        description="stores the resolved type hints of packages, for get_type_hints",
+    )
+    parser.add_argument("packages", nargs="+", metavar="package")
+    arguments = parser.parse_args(argv)
+    packages = cast(list[str], arguments.packages)
+    print(f"stored the hints of {precompute(*packages)} modules")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""Rewrites the based annotations in source files to standard typing, so that they don't need
+to be transformed at runtime:
+
+    python -m basedtyping.rewrite src --jobs 8
+
+Only the annotations that change are rewritten, the rest of the source (and its formatting)
+is left as it is. Enum members (``E.a``) need to be evaluated, so they are left as they are.
+"""
+
+from __future__ import annotations
+
+import ast
+import difflib
+import hashlib
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, cast
+
+from typing_extensions import Protocol, override
+
+from basedtyping.importhook import (
+    _VERSION,
+    AnnotationTransformer,
+    _annotations,
+    _has_future_annotations,
+    _preamble_length,
+    _StringAnnotationTransformer,
+)
+
+__all__ = ("rewrite_source", "rewrite", "Result")
+
+_CACHE_VERSION = f"{_VERSION}"
+"""the cache is discarded when the transform changes"""
+
+
+class _RewriteTransformer(AnnotationTransformer):
+    typing_module = "typing_extensions"
+    basedtyping_module = "basedtyping"
+    union = False
+    """write ``1 | 2`` as ``Union[...]``, for the annotations that are evaluated before 3.10"""
+
+    def __init__(self, *, union: bool = False) -> None:
+        super().__init__()
+        self.union = union
+
+    @override
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        if not self.union or not isinstance(node.op, ast.BitOr):
+            return super().visit_BinOp(node)
+        return self._subscript(
+            self._typing("Union"),
+            ast.Tuple([self.transform(member) for member in _union_members(node)], ctx=ast.Load()),
+        )
+
+    @override
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        if isinstance(cast(object, node.value), str):
+            # forward references stay strings
+            return _StringAnnotationTransformer(self).visit_Constant(node)
+        return super().visit_Constant(node)
+
+
+def _union_members(node: ast.expr) -> Iterator[ast.expr]:
+    """the operands of ``a | b | c``, flattened"""
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        yield from _union_members(node.left)
+        yield from _union_members(node.right)
+    else:
+        yield node
+
+
+def _line_offsets(source: bytes) -> list[int]:
+    offsets = [0]
+    for line in source.splitlines(keepends=True):
+        offsets.append(offsets[-1] + len(line))
+    return offsets
+
+
+def _imports(tree: ast.Module) -> set[str]:
+    """the modules that are imported with ``import x``"""
+    return {
+        alias.name
+        for statement in tree.body
+        if isinstance(statement, ast.Import)
+        for alias in statement.names
+        if alias.asname is None
+    }
+
+
+def rewrite_source(source: str) -> str:
+    """Rewrites the based annotations in ``source``, and adds the imports that they need"""
+    tree = ast.parse(source)
+    visit: Callable[[ast.expr], ast.expr]
+    if _has_future_annotations(tree):
+        transformer = _RewriteTransformer()
+        visit = transformer.transform
+    else:
+        # without `from __future__ import annotations` only strings can be based, and they are
+        # evaluated by `get_type_hints`, where `X | Y` needs 3.10
+        transformer = _RewriteTransformer(union=True)
+        string_transformer = _StringAnnotationTransformer(transformer)
+
+        def visit(annotation: ast.expr) -> ast.expr:
+            return cast(ast.expr, string_transformer.visit(annotation))
+
+    encoded = source.encode()
+    lines = _line_offsets(encoded)
+    replacements: list[tuple[int, int, str]] = []
+    for node, field in _annotations(tree):
+        annotation = cast(ast.expr, getattr(node, field))
+        original = ast.dump(annotation)
+        try:
+            transformed = visit(annotation)
+        except SyntaxError:
+            continue
+        if ast.dump(transformed) == original:
+            continue
+        replacements.append(
+            (
+                lines[annotation.lineno - 1] + annotation.col_offset,
+                lines[cast(int, annotation.end_lineno) - 1] + cast(int, annotation.end_col_offset),
+                ast.unparse(transformed),
+            )
+        )
+    if not replacements:
+        return source
+    # the offsets are in bytes, so replace from the end
+    for start, end, text in sorted(replacements, reverse=True):
+        encoded = encoded[:start] + text.encode() + encoded[end:]
+    missing = sorted(transformer.modules_used - _imports(tree))
+    if missing:
+        preamble = tree.body[: _preamble_length(tree)]
+        # the offsets before the preamble's end are unchanged, annotations come after it
+        index = lines[cast(int, preamble[-1].end_lineno)] if preamble else 0
+        imports = "".join(f"import {name}\n" for name in missing).encode()
+        encoded = encoded[:index] + imports + encoded[index:]
+    return encoded.decode()
+
+
+class Result(NamedTuple):
+    """The result of rewriting a file"""
+
+    path: str
+    hash: str
+    """the hash of the file after it was rewritten"""
+    diff: str
+    """empty when the file didn't change"""
+    error: str | None = None
+
+
+def _hash(source: str) -> str:
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def _rewrite_file(path: str, *, dry_run: bool) -> Result:
+    source = Path(path).read_text(encoding="utf-8")
+    try:
+        rewritten = rewrite_source(source)
+    except SyntaxError as error:
+        return Result(path, _hash(source), "", str(error))
+    if rewritten == source:
+        return Result(path, _hash(source), "")
+    diff = "".join(
+        difflib.unified_diff(
+            source.splitlines(keepends=True),
+            rewritten.splitlines(keepends=True),
+            fromfile=path,
+            tofile=path,
+        )
+    )
+    if not dry_run:
+        Path(path).write_text(rewritten, encoding="utf-8")
+    return Result(path, _hash(rewritten), diff)
+
+
+def _rewrite_dry_run(path: str) -> Result:
+    return _rewrite_file(path, dry_run=True)
+
+
+def _rewrite_in_place(path: str) -> Result:
+    return _rewrite_file(path, dry_run=False)
+
+
+def _files(paths: Iterable[str]) -> Iterator[str]:
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(str(file) for file in path.rglob("*.py"))
+        else:
+            yield str(path)
+
+
+def _load_cache(cache: Path) -> dict[str, str]:
+    try:
+        data = cast(Dict[str, object], json.loads(cache.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != _CACHE_VERSION:
+        return {}
+    return cast(Dict[str, str], data.get("hashes", {}))
+
+
+def rewrite(
+    paths: Iterable[str], *, jobs: int = 1, dry_run: bool = False, cache: Path | None = None
+) -> list[Result]:
+    """Rewrites the files in ``paths`` (and the python files in the directories), with
+    ``jobs`` processes.
+
+    with ``cache``, the files that didn't change since the last time are skipped
+    """
+    files = list(_files(paths))
+    hashes = {} if cache is None else _load_cache(cache)
+    if hashes:
+        files = [
+            file
+            for file in files
+            if hashes.get(file) != _hash(Path(file).read_text(encoding="utf-8"))
+        ]
+    function = _rewrite_dry_run if dry_run else _rewrite_in_place
+    if jobs > 1 and len(files) > 1:
+        with ProcessPoolExecutor(jobs) as executor:
+            results = list(executor.map(function, files, chunksize=max(len(files) // jobs, 1)))
+    else:
+        results = list(map(function, files))
+    if cache is not None and not dry_run:
+        hashes.update((result.path, result.hash) for result in results if result.error is None)
+        data: dict[str, object] = {"version": _CACHE_VERSION, "hashes": hashes}
+        cache.write_text(json.dumps(data))
+    return results
+
+
+class _Arguments(Protocol):
+    paths: List[str]
+    jobs: int
+    incremental: Optional[str]
+    dry_run: bool
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m basedtyping.rewrite",
+        description="rewrites based annotations to standard typing",
+    )
+    parser.add_argument("paths", nargs="+", metavar="path")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="the amount of processes")
+    parser.add_argument(
+        "--incremental",
+        nargs="?",
+        const=".basedtyping_rewrite.json",
+        metavar="cache",
+        help="skip the files that are unchanged since the last run",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="show the changes instead of writing them"
+    )
+    arguments = cast(_Arguments, parser.parse_args(argv))
+    results = rewrite(
+        arguments.paths,
+        jobs=arguments.jobs,
+        dry_run=arguments.dry_run,
+        cache=None if arguments.incremental is None else Path(arguments.incremental),
+    )
+    for result in results:
+        if result.error is not None:
+            print(f"{result.path}: {result.error}", file=sys.stderr)  # noqa: T201
+        elif arguments.dry_run:
+            sys.stdout.write(result.diff)
+    changed = sum(bool(result.diff) for result in results)
+    print(  # noqa: T201
+        f"{'would rewrite' if arguments.dry_run else 'rewrote'} {changed} of {len(results)} files",
+        file=sys.stderr,
+    )
+    return 1 if any(result.error is not None for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,14 @@ This is the similar to the ``types`` module.
 
 from __future__ import annotations
 
-from typing import Final, Final as Final_ext, Literal, Union
+import collections.abc
+import sys
+import types
+import typing
+from enum import Enum, auto
+from typing import Final, Final as Final_ext, Literal, Union, cast
+
+import typing_extensions
 
 LiteralType: Final = type(Literal[1])
 """A type that can be used to check if type hints are a ``typing.Literal`` instance"""
@@ -15,3 +22,143 @@ LiteralType: Final = type(Literal[1])
 #  https://github.com/KotlinIsland/basedtyping/issues/53
 OldUnionType: Final_ext[type[object]] = type(Union[str, int])
 """A type that can be used to check if type hints are a ``typing.Union`` instance."""
+
+
+class FormKind(Enum):
+    """What kind of type form something is, see ``kind_of``"""
+
+    CLASS = auto()
+    """a class, including the generic ones when they aren't parameterized"""
+    REIFIED = auto()
+    """a ``ReifiedGeneric`` (the metaclass is registered by ``basedtyping``)"""
+    GENERIC = auto()
+    """a generic alias, like ``list[int]`` or ``typing.List``"""
+    CALLABLE = auto()
+    UNION = auto()
+    INTERSECTION = auto()
+    LITERAL = auto()
+    ANNOTATED = auto()
+    TYPE_FORM = auto()
+    TYPEVAR = auto()
+    PARAM_SPEC = auto()
+    TYPEVAR_TUPLE = auto()
+    NEW_TYPE = auto()
+    FORWARD_REF = auto()
+    """a ``ForwardRef`` or a ``str``"""
+    ANY = auto()
+    NEVER = auto()
+    NONE = auto()
+    SPECIAL_FORM = auto()
+    """any other special form, like ``ClassVar[int]`` or an unparameterized ``Union``"""
+    OTHER = auto()
+    """not a type form"""
+
+
+def _types(*names: str) -> tuple[type, ...]:
+    """the types with these names in ``typing`` and ``typing_extensions``, the ones that
+    don't exist in this version of Python are skipped"""
+    return tuple(
+        {
+            cast(type, getattr(module, name))
+            for module in (typing, typing_extensions)
+            for name in names
+            if isinstance(cast(object, getattr(module, name, None)), type)
+        }
+    )
+
+
+_type_kinds: dict[type, FormKind | None] = {
+    type: FormKind.CLASS,
+    OldUnionType: FormKind.UNION,
+    LiteralType: FormKind.LITERAL,
+    types.GenericAlias: FormKind.GENERIC,
+    type(collections.abc.Callable[[int], str]): FormKind.CALLABLE,
+    str: FormKind.FORWARD_REF,
+    **dict.fromkeys(_types("_SpecialGenericAlias"), FormKind.GENERIC),
+    **dict.fromkeys(_types("_CallableGenericAlias", "_CallableType"), FormKind.CALLABLE),
+    **dict.fromkeys(_types("_AnnotatedAlias"), FormKind.ANNOTATED),
+    **dict.fromkeys(_types("TypeVar"), FormKind.TYPEVAR),
+    **dict.fromkeys(_types("ParamSpec"), FormKind.PARAM_SPEC),
+    **dict.fromkeys(_types("TypeVarTuple"), FormKind.TYPEVAR_TUPLE),
+    **dict.fromkeys(_types("NewType"), FormKind.NEW_TYPE),
+    **dict.fromkeys(_types("ForwardRef"), FormKind.FORWARD_REF),
+    **dict.fromkeys(
+        _types("_SpecialForm", "_ConcatenateGenericAlias", "_UnpackAlias"), FormKind.SPECIAL_FORM
+    ),
+    # these are used for lots of different things, so they are looked up by the origin
+    **{form_type: None for form_type in _types("_GenericAlias")},
+}
+"""the kinds of forms by their type, when the type is unknown its MRO is used, and then
+it's added here. ``None`` is for the types that are looked up by the origin instead"""
+
+if sys.version_info >= (3, 10):
+    _type_kinds[types.UnionType] = FormKind.UNION
+
+_origin_kinds: dict[object, FormKind] = {
+    collections.abc.Callable: FormKind.CALLABLE,
+    Union: FormKind.UNION,
+    Literal: FormKind.LITERAL,
+    **{
+        cast(object, getattr(module, name)): FormKind.SPECIAL_FORM
+        for module in (typing, typing_extensions)
+        for name in (
+            "ClassVar",
+            "Final",
+            "Unpack",
+            "Required",
+            "NotRequired",
+            "ReadOnly",
+            "TypeGuard",
+            "TypeIs",
+            "Concatenate",
+        )
+        if hasattr(module, name)
+    },
+}
+"""the kinds of the ``_GenericAlias``\\es by their ``__origin__``, anything else is a
+``GENERIC``"""
+
+_identity_kinds: dict[int, FormKind] = {
+    id(None): FormKind.NONE,
+    id(typing.Any): FormKind.ANY,
+    id(typing_extensions.Any): FormKind.ANY,
+    id(typing.NoReturn): FormKind.NEVER,
+    id(typing_extensions.Never): FormKind.NEVER,
+}
+"""the forms that are their own kind, by ``id``, so that forms don't need to be hashed"""
+
+
+def _kind_of_type(form_type: type) -> FormKind | None:
+    for base in form_type.__mro__:
+        if base in _type_kinds:
+            kind = _type_kinds[form_type] = _type_kinds[base]
+            return kind
+    _type_kinds[form_type] = FormKind.OTHER
+    return FormKind.OTHER
+
+
+def kind_of(form: object) -> FormKind:
+    """The ``FormKind`` of ``form``, for example:
+
+    >>> kind_of(int | str)
+    FormKind.UNION
+    >>> kind_of(Literal[1])
+    FormKind.LITERAL
+
+    It's a dict lookup on the type of ``form`` (or its origin), so it's cheap enough to
+    ``match``/branch on instead of a chain of ``isinstance`` checks.
+    """
+    kind = _identity_kinds.get(id(form))
+    if kind is not None:
+        return kind
+    form_type = type(form)
+    try:
+        kind = _type_kinds[form_type]
+    except KeyError:
+        kind = _kind_of_type(form_type)
+    if kind is None:
+        return _origin_kinds.get(form.__origin__, FormKind.GENERIC)  # type: ignore[attr-defined]
+    if kind is FormKind.OTHER and hasattr(form, "__supertype__"):
+        # before 3.10 a `NewType` is a function
+        return FormKind.NEW_TYPE
+    return kind
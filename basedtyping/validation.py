@@ -0,0 +1,812 @@
+"""Compiles type forms into functions that check if a value is an instance of them"""
+
+from __future__ import annotations
+
+import collections.abc
+import functools
+import inspect
+import itertools
+import random
+import sys
+import typing
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    FrozenSet,
+    Generator,
+    Iterable,
+    Iterator,
+    NoReturn,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+    overload,
+)
+
+import typing_extensions
+from typing_extensions import ParamSpec, override
+
+from basedtyping import (
+    FunctionType,
+    TypeForm,
+    _get_args,
+    _get_origin,
+    _is_callable_instance,
+    _issubform,
+    _literal_index,
+    as_functiontype,
+    get_type_hints,
+)
+from basedtyping.runtime_only import FormKind, kind_of
+
+__all__ = (
+    "compile_validator",
+    "checked",
+    "validate_iter",
+    "validate_aiter",
+    "instance_mask",
+    "filter_instances",
+    "partition",
+)
+
+Validator = Callable[[object], bool]
+
+T = TypeVar("T")
+R = TypeVar("R")
+P = ParamSpec("P")
+
+_class_kinds = (FormKind.CLASS, FormKind.REIFIED)
+"""the forms that can be checked with a single ``isinstance``, and can be put in a tuple
+for ``isinstance``"""
+
+_unwrapped_origins: set[object] = {
+    cast(object, getattr(module, name))
+    for module in (typing, typing_extensions)
+    for name in ("ClassVar", "Final", "Required", "NotRequired", "ReadOnly")
+    if hasattr(module, name)
+}
+"""qualifiers that don't affect what the value is"""
+
+_guard_origins: set[object] = {
+    cast(object, getattr(typing_extensions, name))
+    for name in ("TypeGuard", "TypeIs")
+    if hasattr(typing_extensions, name)
+}
+
+_literal_strings: set[object] = {
+    cast(object, module.LiteralString)
+    for module in (typing, typing_extensions)
+    if hasattr(module, "LiteralString")
+}
+
+_item_typed_modules = {"builtins", "collections", "collections.abc"}
+"""the items of the generic collections from these modules are their first argument (or the
+keys and the values of mappings), the items of other collections can be anything"""
+
+_unpack_origins: set[object] = {
+    cast(object, module.Unpack)
+    for module in (typing, typing_extensions)
+    if hasattr(module, "Unpack")
+}
+
+_unchecked_kinds = (FormKind.PARAM_SPEC, FormKind.TYPEVAR_TUPLE, FormKind.SPECIAL_FORM)
+"""forms that can't be checked at runtime, like ``Self`` and ``Unpack[Ts]``, the values of
+them aren't checked"""
+
+_param_spec_components: tuple[type, ...] = tuple(
+    {
+        cast(type, getattr(module, name))
+        for module in (typing, typing_extensions)
+        for name in ("ParamSpecArgs", "ParamSpecKwargs")
+        if hasattr(module, name)
+    }
+)
+"""the types of ``P.args`` and ``P.kwargs``"""
+
+
+def _sample(collection: Iterable[object]) -> Iterable[object]:
+    """one random item of a sequence, or the first item of any other collection"""
+    if isinstance(collection, (list, tuple, collections.abc.Sequence)):
+        return (collection[random.randrange(len(collection))],) if collection else ()  # noqa: S311
+    return itertools.islice(collection, 1)
+
+
+def _is_type_form(value: object, form: object) -> bool:
+    if kind_of(value) is FormKind.OTHER:
+        return False
+    try:
+        return _issubform(value, form)
+    except TypeError:
+        # forms that can't be compared, like `TypeVar`s
+        return False
+
+
+class _Compiler:
+    """Generates the source of the expression that checks a value, the objects that it
+    refers to are put in ``namespace``"""
+
+    def __init__(self, *, sample: bool = False) -> None:
+        self.namespace: dict[str, object] = {
+            "_is_type_form": _is_type_form,
+            "_is_callable_instance": _is_callable_instance,
+            "_sample": _sample,
+        }
+        self._names: dict[int, str] = {}
+        self._depth = 0
+        self._sample = sample
+
+    def constant(self, value: object) -> str:
+        name = self._names.get(id(value))
+        if name is None:
+            name = self._names[id(value)] = f"_{len(self._names)}"
+            self.namespace[name] = value
+        return name
+
+    def check(self, form: object, value: str) -> str:
+        """the expression that checks that ``value`` is an instance of ``form``"""
+        if form is None:
+            return f"{value} is None"
+        kind = kind_of(form)
+        if kind is FormKind.ANY or form is object:
+            return "True"
+        if kind is FormKind.NEVER:
+            return "False"
+        if kind in _class_kinds:
+            form = cast(type, form)
+            if typing_extensions.is_typeddict(form):
+                return self._typed_dict(form, value)
+            if _is_static_protocol(form):
+                raise TypeError(
+                    f"{form!r} is a Protocol that isn't runtime_checkable, so it can't be"
+                    " validated"
+                )
+            return f"isinstance({value}, {self.constant(form)})"
+        if kind is FormKind.INTERSECTION:
+            # the `Intersection` has a cached check for the whole type
+            return f"isinstance({value}, {self.constant(form)})"
+        if kind is FormKind.UNION:
+            return self._union(_get_args(form), value)
+        if kind is FormKind.LITERAL:
+            return self._literals(_literal_index(form), value)
+        if kind is FormKind.ANNOTATED:
+            return self.check(_get_args(form)[0], value)
+        if kind is FormKind.NEW_TYPE:
+            return self.check(cast(object, form.__supertype__), value)  # type: ignore[attr-defined]
+        if kind is FormKind.TYPEVAR:
+            constraints = cast(Tuple[object, ...], cast(TypeVar, form).__constraints__)
+            if constraints:
+                return self._union(constraints, value)
+            return self.check(cast(object, cast(TypeVar, form).__bound__) or object, value)
+        if kind is FormKind.TYPE_FORM:
+            if form is TypeForm:
+                return f"_is_type_form({value}, object)"
+            (arg,) = _get_args(form)
+            return f"_is_type_form({value}, {self.constant(arg)})"
+        if kind is FormKind.CALLABLE:
+            if cast(object, getattr(form, "__args__", None)):
+                # the signatures of functions are checked
+                return f"_is_callable_instance({value}, {self.constant(form)})"
+            origin = _get_origin(form) or form
+            if origin is collections.abc.Callable:
+                return f"callable({value})"
+            return f"isinstance({value}, {self.constant(origin)})"
+        if kind is FormKind.GENERIC:
+            return self._generic(form, value)
+        if kind is FormKind.SPECIAL_FORM:
+            origin = _get_origin(form)
+            if origin in _unwrapped_origins:
+                return self.check(_get_args(form)[0], value)
+            if origin in _guard_origins:
+                return f"isinstance({value}, bool)"
+            if form in _literal_strings:
+                return f"isinstance({value}, str)"
+        if kind is FormKind.FORWARD_REF:
+            raise TypeError(
+                f"{form!r} is a forward reference, resolve it first (with `get_type_hints`)"
+            )
+        if kind in _unchecked_kinds or isinstance(form, _param_spec_components):
+            return "True"
+        raise TypeError(f"{form!r} is not a form that can be validated")
+
+    def _union(self, args: tuple[object, ...], value: str) -> str:
+        # the classes are checked with one `isinstance`, and the `Literal`s with one lookup
+        classes = tuple(arg for arg in args if _is_plain_class(arg))
+        literals = tuple(arg for arg in args if kind_of(arg) is FormKind.LITERAL)
+        checks = [
+            self.check(arg, value) for arg in args if arg not in classes and arg not in literals
+        ]
+        if literals:
+            index = frozenset[Tuple[type, object]]().union(
+                *(_literal_index(literal) for literal in literals)
+            )
+            checks.insert(0, self._literals(index, value))
+        if classes:
+            target = classes[0] if len(classes) == 1 else classes
+            checks.insert(0, f"isinstance({value}, {self.constant(target)})")
+        if "True" in checks:
+            return "True"
+        return "(" + " or ".join(checks) + ")" if checks else "False"
+
+    def _literals(self, index: frozenset[tuple[type, object]], value: str) -> str:
+        # the values are grouped by their type, so `True` doesn't match `1`, and values
+        #  that aren't hashable can't be looked up
+        by_type: dict[type, set[object]] = {}
+        for value_type, literal in index:
+            by_type.setdefault(value_type, set()).add(literal)
+        values = {value_type: frozenset(literals) for value_type, literals in by_type.items()}
+        return f"{value} in {self.constant(values)}.get(type({value}), ())"
+
+    def _typed_dict(self, form: type, value: str) -> str:
+        # only the keys that are declared are checked, like `isinstance` for other classes
+        #  doesn't care about extra attributes
+        required = cast(FrozenSet[str], form.__required_keys__)  # type: ignore[attr-defined]
+        checks = [f"isinstance({value}, dict)"]
+        for key, hint in get_type_hints(form).items():
+            item_check = self.check(hint, f"{value}[{key!r}]")
+            if key in required:
+                checks.append(f"{key!r} in {value}")
+                if item_check != "True":
+                    checks.append(item_check)
+            elif item_check != "True":
+                checks.append(f"({key!r} not in {value} or {item_check})")
+        return " and ".join(checks)
+
+    def _generic(self, form: object, value: str) -> str:
+        origin = _get_origin(form) or form
+        args = _get_args(form)
+        instance = f"isinstance({value}, {self.constant(origin)})"
+        if origin is tuple and hasattr(form, "__args__"):
+            # `tuple[()]` has no args after 3.11
+            return self._tuple(args or ((),), value)
+        if not args:
+            return instance
+        if origin is type:
+            (arg,) = args
+            if kind_of(arg) is FormKind.ANY or arg is object:
+                return f"isinstance({value}, type)"
+            return f"isinstance({value}, type) and _is_type_form({value}, {self.constant(arg)})"
+        if (
+            not isinstance(origin, type)
+            or not issubclass(origin, collections.abc.Collection)
+            or origin.__module__ not in _item_typed_modules
+        ):
+            # other generics are erased at runtime (and iterators can't be consumed)
+            return instance
+        item = self._variable()
+        is_items_view = issubclass(origin, collections.abc.ItemsView)
+        if (is_items_view or issubclass(origin, collections.abc.Mapping)) and len(args) == 2:
+            key = self._variable()
+            key_check = self.check(args[0], key)
+            item_check = self.check(args[1], item)
+            checks = " and ".join(check for check in (key_check, item_check) if check != "True")
+            if not checks:
+                return instance
+            items = self._items(value if is_items_view else f"{value}.items()")
+            return f"{instance} and all({checks} for {key}, {item} in {items})"
+        item_check = self.check(args[0], item)
+        if item_check == "True":
+            return instance
+        return f"{instance} and all({item_check} for {item} in {self._items(value)})"
+
+    def _tuple(self, args: tuple[object, ...], value: str) -> str:
+        instance = f"isinstance({value}, tuple)"
+        if args == ((),):
+            return f"{instance} and not {value}"
+        if any(_get_origin(arg) in _unpack_origins for arg in args):
+            # the length isn't known
+            return instance
+        if len(args) == 2 and args[1] is ...:
+            item = self._variable()
+            item_check = self.check(args[0], item)
+            if item_check == "True":
+                return instance
+            return f"{instance} and all({item_check} for {item} in {self._items(value)})"
+        checks = [self.check(arg, f"{value}[{index}]") for index, arg in enumerate(args)]
+        return " and ".join(
+            [instance, f"len({value}) == {len(args)}", *(c for c in checks if c != "True")]
+        )
+
+    def _items(self, collection: str) -> str:
+        return f"_sample({collection})" if self._sample else collection
+
+    def _variable(self) -> str:
+        self._depth += 1
+        return f"v{self._depth}"
+
+
+def _is_static_protocol(form: type) -> bool:
+    """a ``Protocol`` that ``isinstance`` can't be used with"""
+    return typing_extensions.is_protocol(form) and not cast(
+        bool, getattr(form, "_is_runtime_protocol", False)
+    )
+
+
+def _is_plain_class(form: object) -> bool:
+    """a class that can be checked with ``isinstance``"""
+    return (
+        kind_of(form) in _class_kinds
+        and not typing_extensions.is_typeddict(form)
+        and not _is_static_protocol(cast(type, form))
+    )
+
+
+def _any(_value: object) -> bool:
+    return True
+
+
+def _compile(form: object, *, sample: bool = False) -> Validator:
+    compiler = _Compiler(sample=sample)
+    expression = compiler.check(form, "value")
+    if expression == "True":
+        # so that `checked` can tell that there is nothing to check
+        return _any
+    source = (
+        f"def validate(value):\n    return {expression}\n"
+        'validate.__qualname__ = "compile_validator.<locals>.validate"\n'
+        f"validate.__doc__ = {f'checks that the value is a ``{form!r}``'!r}\n"
+    )
+    exec(compile(source, f"<validator of {form!r}>", "exec"), compiler.namespace)  # noqa: S102
+    return cast(Validator, compiler.namespace["validate"])
+
+
+_cached_compile = functools.lru_cache(maxsize=1024)(_compile)
+
+
+def compile_validator(form: object, *, sample: bool = False) -> Validator:
+    """Compiles ``form`` into a function that checks if a value is an instance of it:
+
+    >>> validate = compile_validator(dict[str, list[Literal[1, 2]]])
+    >>> validate({"a": [1, 2]})
+    True
+    >>> validate({"a": [3]})
+    False
+
+    The check is generated as Python source, with the ``isinstance`` calls and the
+    ``Literal`` values inlined, so none of the form needs to be looked at when it's
+    called. The validators are cached by the form.
+
+    Supports the forms from ``get_type_hints`` (so the based denotations too), unions,
+    ``Intersection``s, ``Literal``s, ``ReifiedGeneric`` specializations, ``TypeForm``s
+    the items of tuples, collections and mappings, the declared keys of ``TypedDict``s,
+    and the signatures of functions for ``Callable``s. Iterators aren't consumed, and the
+    arguments of other generics aren't checked, as they are erased. Forms that can't be
+    checked at runtime, like ``Self``, ``P.args`` and ``Unpack[Ts]``, accept any value,
+    but a ``Protocol`` that isn't ``runtime_checkable`` is a ``TypeError``.
+
+    With ``sample``, only one item of each collection is checked (a random one from
+    sequences, and the first one from anything else), so the cost doesn't depend on the
+    size of the value.
+    """
+    try:
+        hash(form)
+    except TypeError:
+        return _compile(form, sample=sample)
+    return _cached_compile(form, sample=sample)
+
+
+def _fail_item(form: object, index: int, item: object) -> NoReturn:
+    raise TypeError(f"item {index} must be {_type_repr(form)}, not {type(item).__qualname__}")
+
+
+def _validate_iter(
+    iterator: Iterator[T], validate: Validator, form: object, every: int
+) -> Iterator[T]:
+    for index, item in enumerate(iterator):
+        if not index % every and not validate(item):
+            _fail_item(form, index, item)
+        yield item
+
+
+def _validate_generator(
+    generator: Generator[T, object, object], validate: Validator, form: object, every: int
+) -> Generator[T, object, object]:
+    """``_validate_iter`` that passes on ``send`` and ``throw``, and the return value"""
+    index = 0
+    method, argument = cast(Callable[[object], T], generator.send), cast(object, None)
+    while True:
+        try:
+            item = method(argument)
+        except StopIteration as stop:
+            return cast(object, stop.value)
+        if not index % every and not validate(item):
+            _fail_item(form, index, item)
+        index += 1
+        try:
+            argument = yield item
+        except GeneratorExit:
+            generator.close()
+            raise
+        except BaseException as error:  # noqa: BLE001
+            method, argument = cast(Callable[[object], T], generator.throw), error
+        else:
+            method = generator.send
+
+
+def validate_iter(
+    iterable: Iterable[T], form: object, *, every: int = 1, sample: bool = False
+) -> Iterator[T]:
+    """Checks that the items of ``iterable`` are instances of ``form`` as they are
+    consumed, a ``TypeError`` is raised on the first one that isn't:
+
+        for row in validate_iter(read_rows(), Row):
+            ...
+
+    Nothing is buffered, so it can be used on streams of any size. Only every ``every``
+    item is checked, and ``sample`` is passed to ``compile_validator``. When it's a
+    generator, ``send`` and ``throw`` are passed on to it.
+    """
+    if every < 1:
+        raise ValueError(f"every must be at least 1, not {every}")
+    validate = compile_validator(form, sample=sample)
+    if isinstance(iterable, collections.abc.Generator):
+        return _validate_generator(iterable, validate, form, every)
+    return _validate_iter(iter(iterable), validate, form, every)
+
+
+async def _validate_aiter(
+    iterable: AsyncIterable[T], validate: Validator, form: object, every: int
+) -> AsyncIterator[T]:
+    index = 0
+    async for item in iterable:
+        if not index % every and not validate(item):
+            _fail_item(form, index, item)
+        index += 1
+        yield item
+
+
+async def _validate_agenerator(
+    generator: AsyncGenerator[T, object], validate: Validator, form: object, every: int
+) -> AsyncGenerator[T, object]:
+    """``_validate_aiter`` that passes on ``asend`` and ``athrow``"""
+    method = cast(Callable[[object], Awaitable[T]], generator.asend)
+    argument: object = None
+    for index in itertools.count():
+        try:
+            item = await method(argument)
+        except StopAsyncIteration:
+            return
+        if not index % every and not validate(item):
+            _fail_item(form, index, item)
+        try:
+            argument = yield item
+        except GeneratorExit:
+            await cast(Awaitable[None], generator.aclose())
+            raise
+        except BaseException as error:  # noqa: BLE001
+            method, argument = cast(Callable[[object], Awaitable[T]], generator.athrow), error
+        else:
+            method = generator.asend
+
+
+def validate_aiter(
+    iterable: AsyncIterable[T], form: object, *, every: int = 1, sample: bool = False
+) -> AsyncIterator[T]:
+    """``validate_iter`` for async iterables"""
+    if every < 1:
+        raise ValueError(f"every must be at least 1, not {every}")
+    validate = compile_validator(form, sample=sample)
+    if isinstance(iterable, collections.abc.AsyncGenerator):
+        return _validate_agenerator(iterable, validate, form, every)
+    return _validate_aiter(iterable, validate, form, every)
+
+
+_type_decided_kinds = (
+    FormKind.CLASS,
+    FormKind.REIFIED,
+    FormKind.INTERSECTION,
+    FormKind.NONE,
+    FormKind.ANY,
+    FormKind.NEVER,
+)
+
+
+def _is_decided_by_type(form: object) -> bool:
+    """whether the instances of ``form`` can be decided from only their type"""
+    if form is None:
+        return True
+    kind = kind_of(form)
+    if kind in _type_decided_kinds:
+        return True
+    if kind is FormKind.UNION:
+        return all(map(_is_decided_by_type, _get_args(form)))
+    if kind is FormKind.ANNOTATED:
+        return _is_decided_by_type(_get_args(form)[0])
+    if kind is FormKind.NEW_TYPE:
+        return _is_decided_by_type(form.__supertype__)  # type: ignore[attr-defined]
+    if kind is FormKind.TYPEVAR:
+        form = cast(TypeVar, form)
+        constraints = cast(Tuple[object, ...], form.__constraints__)
+        return all(map(_is_decided_by_type, constraints or (cast(object, form.__bound__),)))
+    # unparameterized generics, like `typing.List`
+    return kind is FormKind.GENERIC and not hasattr(form, "__args__")
+
+
+def _instance_check(form: object) -> Validator:
+    """a validator for ``form`` that remembers the result for each type, when it only
+    depends on the type"""
+    validate = compile_validator(form)
+    if not _is_decided_by_type(form):
+        return validate
+    results: dict[type, bool] = {}
+
+    def check(item: object) -> bool:
+        cls = type(item)
+        result = results.get(cls)
+        if result is None:
+            result = results[cls] = validate(item)
+        return result
+
+    return check
+
+
+def instance_mask(items: Iterable[object], form: object) -> Sequence[bool]:
+    """Whether each of the ``items`` is an instance of ``form``.
+
+    The items are grouped by their type, and each type is only checked once when that's
+    enough to decide it (so for classes, ``ReifiedGeneric`` specializations,
+    ``Intersection``s and unions of them). Other forms, like ``Literal``s and
+    ``list[int]``, are checked with ``compile_validator`` for each item.
+
+    When ``items`` is a NumPy ``ndarray``, a boolean ``ndarray`` of the same shape is
+    returned.
+    """
+    check = _instance_check(form)
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(items, numpy.ndarray):  # type: ignore[no-any-expr]
+        return cast(Sequence[bool], _instance_mask_ndarray(numpy, items, check))  # type: ignore[no-any-expr]
+    return list(map(check, items))
+
+
+def _instance_mask_ndarray(numpy: Any, items: Any, check: Validator) -> Any:  # type: ignore[no-any-explicit]
+    return numpy.fromiter(  # type: ignore[no-any-expr]
+        map(check, items.flat),  # type: ignore[no-any-expr]
+        dtype=bool,
+        count=items.size,  # type: ignore[no-any-expr]
+    ).reshape(items.shape)  # type: ignore[no-any-expr]
+
+
+def filter_instances(items: Iterable[T], form: object) -> list[T]:
+    """The ``items`` that are instances of ``form``, it's checked like ``instance_mask``"""
+    return list(filter(_instance_check(form), items))
+
+
+def partition(items: Iterable[T], *forms: object) -> tuple[list[T], ...]:
+    """Splits the ``items`` by the first of the ``forms`` that they are an instance of,
+    there is one more list at the end for the ones that aren't an instance of any:
+
+        ints, strs, rest = partition(items, int, str)
+
+    Like ``instance_mask``, each type is only checked once when it's enough to decide it.
+    """
+    checks = [_instance_check(form) for form in forms]
+    groups: tuple[list[T], ...] = tuple([] for _ in range(len(forms) + 1))
+    rest = len(forms)
+
+    def find(item: object) -> int:
+        return next((index for index, check in enumerate(checks) if check(item)), rest)
+
+    if not all(map(_is_decided_by_type, forms)):
+        for item in items:
+            groups[find(item)].append(item)
+        return groups
+    indexes: dict[type, int] = {}
+    for item in items:
+        cls = type(item)
+        index = indexes.get(cls)
+        if index is None:
+            index = indexes[cls] = find(item)
+        groups[index].append(item)
+    return groups
+
+
+_type_repr = cast(Callable[[object], str], typing._type_repr)
+
+
+class _Missing:
+    """the default value of the parameters in ``_compile_arguments_check``, so that the
+    defaults of the function aren't checked"""
+
+    @override
+    def __repr__(self) -> str:
+        return "__missing"
+
+
+_missing = _Missing()
+
+
+def _qualname(func: object) -> str:
+    return cast(str, getattr(func, "__qualname__", repr(func)))
+
+
+def _fail(qualname: str, name: str, form: object, value: object) -> NoReturn:
+    raise TypeError(
+        f"{qualname}() argument {name!r} must be {_type_repr(form)}, not"
+        f" {type(value).__qualname__}"
+    )
+
+
+def _compile_arguments_check(
+    func: Callable[P, object], hints: dict[str, object], *, sample: bool
+) -> Callable[P, None] | None:
+    """a function with the same parameters (and name) as ``func`` that checks the
+    arguments, so Python does the binding"""
+    signature = inspect.signature(func)
+    qualname = _qualname(func)
+    namespace: dict[str, object] = {"__missing": _missing, "__fail": _fail, "__qualname": qualname}
+    lines = []
+    parameters = []
+    for index, parameter in enumerate(signature.parameters.values()):
+        name = parameter.name
+        default = cast(object, parameter.default)
+        parameters.append(
+            parameter.replace(
+                annotation=inspect.Parameter.empty,
+                default=inspect.Parameter.empty if default is parameter.empty else _missing,
+            )
+        )
+        if name not in hints or name == "return":
+            continue
+        form = hints[name]
+        validator = compile_validator(form, sample=sample)
+        if validator is _any:
+            continue
+        namespace[f"__validate{index}"] = validator
+        namespace[f"__form{index}"] = form
+        fail = f"__fail(__qualname, {name!r}, __form{index}, {{0}})"
+        if parameter.kind is parameter.VAR_POSITIONAL:
+            lines += [
+                f"for __value in {name}:",
+                f"    if not __validate{index}(__value): {fail.format('__value')}",
+            ]
+        elif parameter.kind is parameter.VAR_KEYWORD:
+            lines += [
+                f"for __value in {name}.values():",
+                f"    if not __validate{index}(__value): {fail.format('__value')}",
+            ]
+        elif default is not parameter.empty:
+            lines.append(
+                f"if {name} is not __missing and not __validate{index}({name}):"
+                f" {fail.format(name)}"
+            )
+        else:
+            lines.append(f"if not __validate{index}({name}): {fail.format(name)}")
+    if not lines:
+        return None
+    body = "\n".join(f"    {line}" for line in lines)
+    namespace["__name"] = cast(object, getattr(func, "__name__", qualname))
+    # named after ``func``, so that binding errors are reported against it (before 3.10
+    # they use the name of the code)
+    source = (
+        f"def check_arguments{signature.replace(parameters=parameters)}:\n{body}\n"
+        "check_arguments.__code__ = check_arguments.__code__.replace(co_name=__name)\n"
+        "check_arguments.__name__ = __name\n"
+        "check_arguments.__qualname__ = __qualname\n"
+    )
+    exec(compile(source, f"<arguments check of {qualname}>", "exec"), namespace)  # noqa: S102
+    return cast(Callable[P, None], namespace["check_arguments"])
+
+
+_lazy_iterators: dict[object, bool] = {
+    collections.abc.Iterator: False,
+    collections.abc.Generator: False,
+    collections.abc.AsyncIterator: True,
+    collections.abc.AsyncGenerator: True,
+}
+"""the return types that are validated as they are consumed by ``checked`` (the items are
+the first argument), and whether they are async"""
+
+
+def _compile_return_check(
+    func: Callable[P, object], hints: dict[str, object], *, sample: bool
+) -> Callable[[object], object] | None:
+    if "return" not in hints:
+        return None
+    form = hints["return"]
+    validator = compile_validator(form, sample=sample)
+    if validator is _any:
+        return None
+    is_async = _lazy_iterators.get(_get_origin(form))
+    item_form = _get_args(form)[0] if is_async is not None else None
+
+    def check_return(result: object) -> object:
+        if not validator(result):
+            raise TypeError(
+                f"{_qualname(func)}() must return {_type_repr(form)}, not"
+                f" {type(result).__qualname__}"
+            )
+        # `validator` has checked that it's an iterator
+        if is_async:
+            return validate_aiter(cast(AsyncIterator[object], result), item_form, sample=sample)
+        if is_async is not None:
+            return validate_iter(cast(Iterator[object], result), item_form, sample=sample)
+        return result
+
+    return check_return
+
+
+_Checks = Tuple[Optional[Callable[P, None]], Optional[Callable[[object], object]]]
+
+
+def _compile_checks(func: Callable[P, object], *, sample: bool) -> _Checks[P]:
+    hints = get_type_hints(func)
+    return (
+        _compile_arguments_check(func, hints, sample=sample),
+        _compile_return_check(func, hints, sample=sample),
+    )
+
+
+@overload
+def checked(func: Callable[P, R], /, *, sample: bool = ...) -> FunctionType[P, R]:
+    ...
+
+
+@overload
+def checked(*, sample: bool = ...) -> Callable[[Callable[P, R]], FunctionType[P, R]]:
+    ...
+
+
+def checked(
+    func: Callable[P, R] | None = None, /, *, sample: bool = False
+) -> FunctionType[P, R] | Callable[[Callable[P, R]], FunctionType[P, R]]:
+    """Checks the arguments and the return value of ``func`` against its annotations on
+    every call, a ``TypeError`` is raised when they don't match:
+
+        @checked
+        def f(a: 1 | 2, b: A & B) -> list[str]: ...
+
+    The annotations are read (with ``get_type_hints``, so based denotations are
+    supported) and compiled with ``compile_validator`` on the first call, so they can
+    refer to things that are defined after the function. After that, only the compiled
+    checks are run. Default values aren't checked.
+
+    With ``sample``, only one item of each collection is checked, so the cost of each
+    call is fixed, no matter how big the arguments are.
+
+    When it returns an ``Iterator[T]``, a ``Generator[T, ...]`` or the async versions of
+    them, the items are checked as they are consumed (see ``validate_iter``).
+    """
+    if func is None:
+
+        def decorator(func: Callable[P, R]) -> FunctionType[P, R]:
+            return checked(func, sample=sample)
+
+        return decorator
+    checks: _Checks[P] | None = None
+
+    def get_checks() -> _Checks[P]:
+        nonlocal checks
+        if checks is None:
+            checks = _compile_checks(func, sample=sample)
+        return checks
+
+    if inspect.iscoroutinefunction(func):
+
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> object:
+            check_arguments, check_return = get_checks()
+            if check_arguments is not None:
+                check_arguments(*args, **kwargs)
+            result = await cast(Awaitable[object], func(*args, **kwargs))
+            if check_return is not None:
+                result = check_return(result)
+            return result
+
+        # the type of a coroutine function has `Any`s
+        return cast(FunctionType[P, R], functools.wraps(func)(async_wrapper))  # type: ignore[no-any-expr]
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        check_arguments, check_return = get_checks()
+        if check_arguments is not None:
+            check_arguments(*args, **kwargs)
+        result = func(*args, **kwargs)
+        if check_return is not None:
+            return cast(R, check_return(result))
+        return result
+
+    return as_functiontype(wrapper)
@@ -0,0 +1,4 @@
+"""Benchmarks for the runtime parts of ``basedtyping``.
+
+Run them as modules, for example ``python -m benchmarks.instantiation``
+"""
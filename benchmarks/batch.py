@@ -0,0 +1,51 @@
+"""Compares ``filter_instances`` with calling ``isinstance`` on every item of a list"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Union
+
+from basedtyping import Intersection, ReifiedGeneric, T, filter_instances
+
+ITEMS = 100_000
+
+
+class A:
+    pass
+
+
+class B:
+    pass
+
+
+class AB(A, B):
+    pass
+
+
+class Reified(ReifiedGeneric[T]):
+    pass
+
+
+items = [AB(), A(), Reified[int](), Reified[str](), 1, "a"] * (ITEMS // 6)
+
+
+def bench(name: str, form: object) -> None:
+    start = perf_counter()
+    expected = [item for item in items if isinstance(item, form)]  # type: ignore[arg-type]
+    loop = perf_counter() - start
+    start = perf_counter()
+    result = filter_instances(items, form)
+    batch = perf_counter() - start
+    assert result == expected
+    print(f"{name:<32}{loop * 1e3:>8.1f} ms{batch * 1e3:>8.1f} ms" f"{loop / batch:>8.1f}x faster")
+
+
+def main():
+    print(f"{'':<32}{'isinstance':>11}{'batch':>11}")
+    bench("Reified[int]", Reified[int])
+    bench("Intersection[A, B]", Intersection[A, B])
+    bench("Union[Reified[int], A, str]", Union[Reified[int], A, str])
+
+
+if __name__ == "__main__":
+    main()
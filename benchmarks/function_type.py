@@ -0,0 +1,44 @@
+"""Compares checking the callbacks of a plugin registry against a ``FunctionType``, with
+the signatures cached per code object, and with parsing them on every check
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Callable
+
+from basedtyping import FunctionType, _function_signatures
+
+CALLBACKS = 2_000
+
+
+def make_callback() -> Callable[[int, str], bool]:
+    def callback(event: int, name: str) -> bool:
+        return bool(event and name)
+
+    return callback
+
+
+callbacks = [make_callback() for _ in range(CALLBACKS)]
+form = FunctionType[[int, str], bool]
+
+
+def bench(name: str, *, cached: bool) -> float:
+    start = perf_counter()
+    for callback in callbacks:
+        if not cached:
+            _function_signatures.clear()
+        assert isinstance(callback, form)
+    result = (perf_counter() - start) / CALLBACKS * 1e6
+    print(f"{name:<40}{result:>10.1f} µs")
+    return result
+
+
+def main():
+    slow = bench("parsing the signature every time", cached=False)
+    fast = bench("cached by the code", cached=True)
+    print(f"\nchecking a callback is {slow / fast:.1f}x faster with the cache")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compares ``get_type_hints`` of a module that uses based annotations, imported normally
+and imported with ``basedtyping.importhook``
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+from time import perf_counter
+
+from basedtyping import get_type_hints, importhook
+
+FUNCTIONS = 200
+
+_source = """
+    from __future__ import annotations
+
+    class A: ...
+    class B: ...
+"""
+
+_function = """
+    def f{}(a: 1 | 2, b: A & B, c: (int, str)) -> "(int) -> str": ...
+"""
+
+
+def bench(name: str, directory: Path, *, hooked: bool) -> float:
+    sys.modules.pop("hooked_benchmark", None)
+    importlib.invalidate_caches()
+    if hooked:
+        importhook.install("hooked_benchmark")
+    sys.path.insert(0, str(directory))
+    try:
+        module = importlib.import_module("hooked_benchmark")
+    finally:
+        sys.path.remove(str(directory))
+        importhook.uninstall()
+    functions = [getattr(module, f"f{index}") for index in range(FUNCTIONS)]
+    start = perf_counter()
+    for function in functions:
+        get_type_hints(function)
+    result = (perf_counter() - start) / FUNCTIONS * 1e6
+    print(f"{name:<40}{result:>10.1f} µs")
+    return result
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        Path(directory, "hooked_benchmark.py").write_text(
+            textwrap.dedent(_source)
+            + "".join(textwrap.dedent(_function).format(index) for index in range(FUNCTIONS))
+        )
+        slow = bench("transformed by get_type_hints", Path(directory), hooked=False)
+        fast = bench("transformed when imported", Path(directory), hooked=True)
+    print(f"\nget_type_hints is {slow / fast:.1f}x faster with the import hook")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Measures how long ``import basedtyping`` takes (with ``-X importtime``), on top of the
+modules that it can't do without (``typing`` and ``typing_extensions``).
+
+Fails when one of the lazily imported modules is imported at startup, or when it takes
+longer than ``--max-ms`` (``MAX_MS`` by default)::
+
+    python -m benchmarks.importtime --max-ms 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+RUNS = 10
+
+MAX_MS = 100.0
+"""the default budget of ``basedtyping`` itself, it's about 40 ms on a fast machine, so
+there's plenty of room for slow CI runners"""
+
+LAZY_MODULES = ("basedtyping.transformer", "basedtyping.validation", "basedtyping.dispatching")
+"""the modules that are only imported when they are used"""
+
+
+def import_times(code: str) -> dict[str, int]:
+    """the cumulative import time of each module in µs"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, check=True, text=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--max-ms", type=float, default=MAX_MS, help="fail when the import takes longer"
+    )
+    args = parser.parse_args()
+    runs = [import_times("import basedtyping") for _ in range(RUNS)]
+    imported = [module for module in LAZY_MODULES if module in runs[0]]
+    if imported:
+        print(f"these modules shouldn't be imported at startup: {', '.join(imported)}")
+        sys.exit(1)
+    total = min(times["basedtyping"] for times in runs) / 1000
+    dependencies = (
+        min(times.get("typing", 0) + times.get("typing_extensions", 0) for times in runs) / 1000
+    )
+    print(f"{'import basedtyping':<40}{total:>10.1f} ms")
+    print(f"{'typing and typing_extensions':<40}{dependencies:>10.1f} ms")
+    print(f"{'basedtyping itself':<40}{total - dependencies:>10.1f} ms")
+    if total - dependencies > args.max_ms:
+        print(f"\nthat's more than the {args.max_ms} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
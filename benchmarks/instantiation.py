@@ -0,0 +1,38 @@
+"""Compares instantiating a ``ReifiedGeneric`` with instantiating a normal class"""
+
+from __future__ import annotations
+
+from timeit import repeat
+
+from basedtyping import ReifiedGeneric, T
+
+NUMBER = 1_000_000
+
+
+class Reified(ReifiedGeneric[T]):
+    pass
+
+
+class Normal:
+    pass
+
+
+ReifiedInt = Reified[int]
+
+
+def bench(name: str, stmt: str) -> float:
+    result = min(repeat(stmt, globals=globals(), number=NUMBER, repeat=5)) / NUMBER * 1e9
+    print(f"{name:<24}{result:>8.1f} ns")
+    return result
+
+
+def main():
+    normal = bench("Normal()", "Normal()")
+    specialized = bench("ReifiedInt()", "ReifiedInt()")
+    subscripted = bench("Reified[int]()", "Reified[int]()")
+    print(f"\nReifiedInt() is {specialized / normal:.2f}x Normal()")
+    print(f"Reified[int]() is {subscripted / normal:.2f}x Normal()")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Round-trip throughput of pickling ``ReifiedGeneric`` instances, compared with normal
+instances, and sending them through a ``ProcessPoolExecutor``
+"""
+
+from __future__ import annotations
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+from basedtyping import ReifiedGeneric, T
+
+COUNT = 100_000
+
+
+class Reified(ReifiedGeneric[T]):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Normal:
+    def __init__(self, value: int):
+        self.value = value
+
+
+def identity(value: object) -> object:
+    return value
+
+
+def round_trip(name: str, cls: type[object]) -> float:
+    instances = [cls(i) for i in range(COUNT)]  # type: ignore[call-arg]
+    start = perf_counter()
+    pickled = pickle.dumps(instances)
+    pickle.loads(pickled)
+    result = COUNT / (perf_counter() - start)
+    print(f"{name:<16}{result:>12,.0f} instances/s{len(pickled) / COUNT:>8.1f} bytes/instance")
+    return result
+
+
+def process_pool(name: str, cls: type[object]) -> None:
+    instances = [cls(i) for i in range(COUNT)]  # type: ignore[call-arg]
+    with ProcessPoolExecutor(2) as pool:
+        # warm up the workers
+        list(pool.map(identity, instances[:2]))
+        start = perf_counter()
+        list(pool.map(identity, instances, chunksize=1_000))
+        result = COUNT / (perf_counter() - start)
+    print(f"{name:<16}{result:>12,.0f} instances/s")
+
+
+def main():
+    print("pickle round trip:")
+    normal = round_trip("Normal", Normal)
+    reified = round_trip("Reified[int]", Reified[int])
+    print(f"\nReified[int] has {reified / normal:.2f}x the throughput of Normal\n")
+    print("ProcessPoolExecutor round trip:")
+    process_pool("Normal", Normal)
+    process_pool("Reified[int]", Reified[int])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compares ``get_type_hints`` of a module that uses based annotations, evaluated and loaded
+from the hints that were stored by ``python -m basedtyping.precompute``
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+from time import perf_counter
+
+from basedtyping import get_type_hints, precompute
+
+FUNCTIONS = 200
+
+_source = """
+    from __future__ import annotations
+
+    class A: ...
+    class B: ...
+"""
+
+_function = """
+    def f{}(a: 1 | 2, b: A & B, c: (int, str)) -> "(int) -> str": ...
+"""
+
+
+def bench(name: str, *, stored: bool) -> float:
+    module = sys.modules["precomputed_benchmark"]
+    functions = [getattr(module, f"f{index}") for index in range(FUNCTIONS)]
+    # loading the stored hints is part of it
+    precompute._modules.clear()
+    precompute._source_hashes.clear()
+    if not stored:
+        precompute._modules[module.__name__] = module.__spec__, {}
+    start = perf_counter()
+    for function in functions:
+        get_type_hints(function)
+    result = (perf_counter() - start) / FUNCTIONS * 1e6
+    print(f"{name:<40}{result:>10.1f} µs")
+    return result
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        Path(directory, "precomputed_benchmark.py").write_text(
+            textwrap.dedent(_source)
+            + "".join(textwrap.dedent(_function).format(index) for index in range(FUNCTIONS))
+        )
+        sys.path.insert(0, directory)
+        try:
+            importlib.import_module("precomputed_benchmark")
+            precompute.precompute("precomputed_benchmark")
+            slow = bench("evaluated", stored=False)
+            fast = bench("precomputed", stored=True)
+        finally:
+            sys.path.remove(directory)
+    print(f"\nget_type_hints is {slow / fast:.1f}x faster with the precomputed hints")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compares rewriting a tree of files with one process, with several processes, and again
+with the incremental cache (where none of them changed)
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import textwrap
+from pathlib import Path
+from time import perf_counter
+
+from basedtyping.rewrite import rewrite
+
+FILES = 100
+JOBS = min(os.cpu_count() or 1, 8)
+
+_source = textwrap.dedent(
+    """\
+    from __future__ import annotations
+
+    class A: ...
+    class B: ...
+    """
+) + "".join(
+    f"\ndef f{index}(a: 1 | 2, b: A & B, c: (int, str)) -> '(int) -> str': ...\n"
+    for index in range(50)
+)
+
+
+def bench(name: str, directory: Path, *, jobs: int, cache: Path | None = None) -> float:
+    for index in range(FILES):
+        file = directory / f"module{index}.py"
+        if cache is None or not file.exists():
+            file.write_text(_source)
+    start = perf_counter()
+    rewrite([str(directory)], jobs=jobs, cache=cache)
+    result = perf_counter() - start
+    print(f"{name:<40}{result * 1e3:>10.1f} ms")
+    return result
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        serial = bench("one process", Path(directory), jobs=1)
+        parallel = bench(f"{JOBS} processes", Path(directory), jobs=JOBS)
+        cache = Path(directory, "cache.json")
+        bench("filling the incremental cache", Path(directory), jobs=JOBS, cache=cache)
+        incremental = bench("incremental, unchanged", Path(directory), jobs=JOBS, cache=cache)
+    print(f"\n{JOBS} processes are {serial / parallel:.1f}x faster")
+    print(f"an incremental run is {serial / incremental:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Measures how the throughput of the cached paths (specializing, instantiating, instance
+checks and dispatching) scales with the number of threads.
+
+On a GIL build the total throughput stays about the same, on a free-threaded build it
+should grow with the number of threads.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from basedtyping import ReifiedGeneric, T, dispatch, out_T
+
+OPERATIONS = 200_000
+
+
+class Reified(ReifiedGeneric[T]):
+    pass
+
+
+# https://github.com/KotlinIsland/basedtyping/issues/70
+class Covariant(ReifiedGeneric[out_T]):  # type:ignore[type-var]
+    pass
+
+
+@dispatch
+def handle(_value: object) -> str:
+    return "default"
+
+
+@handle.register
+def _(_value: Reified[int]) -> str:
+    return "Reified[int]"
+
+
+def work(operations: int):
+    for _ in range(operations):
+        value = Reified[int]()
+        isinstance(Covariant[bool](), Covariant[int])  # type: ignore[misc]
+        handle(value)
+
+
+def run(threads: int) -> float:
+    """the total operations per second with ``threads`` threads"""
+    barrier = threading.Barrier(threads + 1)
+    operations = OPERATIONS // threads
+
+    def thread():
+        barrier.wait()
+        work(operations)
+
+    with ThreadPoolExecutor(threads) as executor:
+        futures = [executor.submit(thread) for _ in range(threads)]
+        barrier.wait()
+        start = perf_counter()
+        for future in futures:
+            future.result()
+        return operations * threads / (perf_counter() - start)
+
+
+def main():
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}\n")
+    # warm the caches
+    work(1_000)
+    single = run(1)
+    # at least a few, to show the contention on machines with fewer cores
+    for threads in range(1, min(max(os.cpu_count() or 1, 4), 8) + 1):
+        result = single if threads == 1 else run(threads)
+        print(f"{threads:>2} threads {result:>12,.0f} ops/s {result / single:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
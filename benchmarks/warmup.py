@@ -0,0 +1,62 @@
+"""Compares the first ``get_type_hints`` of the functions of a module that uses based
+annotations, evaluated on demand, and after ``warmup`` resolved them in the background
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+from time import perf_counter
+
+from basedtyping import get_type_hints, precompute, warmup
+
+FUNCTIONS = 200
+
+_source = """
+    from __future__ import annotations
+
+    class A: ...
+    class B: ...
+"""
+
+_function = """
+    def f{}(a: 1 | 2, b: A & B, c: (int, str)) -> "(int) -> str": ...
+"""
+
+
+def bench(name: str, *, warm: bool) -> float:
+    module = sys.modules["warmup_benchmark"]
+    precompute._warmed.clear()
+    if warm:
+        # the server would start serving while this runs
+        warmup([module]).result()
+    functions = [getattr(module, f"f{index}") for index in range(FUNCTIONS)]
+    start = perf_counter()
+    for function in functions:
+        get_type_hints(function)
+    result = (perf_counter() - start) / FUNCTIONS * 1e6
+    print(f"{name:<40}{result:>10.1f} µs")
+    return result
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        Path(directory, "warmup_benchmark.py").write_text(
+            textwrap.dedent(_source)
+            + "".join(textwrap.dedent(_function).format(index) for index in range(FUNCTIONS))
+        )
+        sys.path.insert(0, directory)
+        try:
+            importlib.import_module("warmup_benchmark")
+            slow = bench("on demand", warm=False)
+            fast = bench("warmed up", warm=True)
+        finally:
+            sys.path.remove(directory)
+    print(f"\nthe first get_type_hints is {slow / fast:.1f}x faster after the warm up")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import sys
+import threading
+from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal, Union
+from unittest import skipIf
+
+from pytest import raises
+
+from basedtyping import Intersection, ReifiedGeneric, T, dispatch
+
+
+class A:
+    pass
+
+
+class B:
+    pass
+
+
+class AB(A, B):
+    pass
+
+
+class Reified(ReifiedGeneric[T]):
+    pass
+
+
+@dispatch
+def handle(_value: object) -> str:
+    return "default"
+
+
+@handle.register(A)
+def _(_value: A) -> str:
+    return "A"
+
+
+@handle.register(Intersection[A, B])
+def _(_value: A) -> str:
+    return "A & B"
+
+
+@handle.register
+def _(_value: Union[Reified[int], Reified[str]]) -> str:
+    return "Reified[int | str]"
+
+
+@handle.register(Literal[1, "a"])
+def _(_value: object) -> str:
+    return "literal"
+
+
+@handle.register(None)
+def _(_value: None) -> str:
+    return "None"
+
+
+def test_default():
+    assert handle(object()) == "default"
+    assert handle(B()) == "default"
+
+
+def test_class():
+    assert handle(A()) == "A"
+
+
+def test_intersection():
+    assert handle(AB()) == "A & B"
+
+
+def test_reified():
+    assert handle(Reified[int]()) == "Reified[int | str]"
+    assert handle(Reified[str]()) == "Reified[int | str]"
+    assert handle(Reified[bytes]()) == "default"
+
+
+def test_literal():
+    assert handle(1) == "literal"
+    assert handle("a") == "literal"
+    assert handle(2) == "default"
+    # `True == 1`, but it's a different type
+    assert handle(True) == "default"  # noqa: FBT003
+    assert handle([]) == "default"
+
+
+def test_none():
+    assert handle(None) == "None"
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+def test_based():
+    @dispatch
+    def f(_value: object) -> str:
+        return "default"
+
+    @f.register
+    def _(_value: Reified[int] | 1 | 2) -> str:
+        return "based"
+
+    assert f(Reified[int]()) == "based"
+    assert f(2) == "based"
+    assert f(Reified[str]()) == "default"
+    assert f(3) == "default"
+
+
+def test_extra_arguments():
+    @dispatch
+    def f(_value: object, other: int) -> int:
+        return other
+
+    @f.register
+    def _(value: int, other: int) -> int:
+        return value + other
+
+    assert f("", 1) == 1
+    assert f(1, other=2) == 3
+
+
+def test_registration_order():
+    @dispatch
+    def f(_value: object) -> str:
+        return "default"
+
+    f.register(A, lambda _: "A")
+    f.register(B, lambda _: "B")
+    assert f(AB()) == "A"
+
+
+def test_register_invalidates():
+    @dispatch
+    def f(_value: object) -> str:
+        return "default"
+
+    assert f(A()) == "default"
+    f.register(A, lambda _: "A")
+    assert f(A()) == "A"
+
+
+def test_abc_register():
+    class Base(ABC):  # noqa: B024
+        pass
+
+    @dispatch
+    def f(_value: object) -> str:
+        return "default"
+
+    f.register(Base, lambda _: "Base")
+
+    class C:
+        pass
+
+    assert f(C()) == "default"
+    Base.register(C)
+    assert f(C()) == "Base"
+
+
+def test_registry():
+    assert handle.registry[object] is handle.default
+    assert handle.registry[Union[Reified[int], Reified[str]]] is handle.dispatch(Reified[int]())
+
+
+def test_invalid():
+    with raises(TypeError):
+        handle.register(list[int])
+    with raises(TypeError):
+
+        @handle.register  # type: ignore[no-any-expr]
+        def _(_value):  # type: ignore[no-untyped-def]
+            pass
+
+
+def test_threads():
+    @dispatch
+    def f(_value: object) -> str:
+        return "default"
+
+    barrier = threading.Barrier(8)
+
+    def run(i: int) -> None:
+        class C:
+            pass
+
+        barrier.wait()
+        assert f(C()) == "default"
+        f.register(C, lambda _: str(i))
+        assert f(C()) == str(i)
+
+    with ThreadPoolExecutor(8) as executor:
+        for future in [executor.submit(run, i) for i in range(8)]:
+            future.result()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import sys
+from typing import TYPE_CHECKING, Callable, Literal
+from unittest import skipIf
 
 if TYPE_CHECKING:
     # these are just type-time tests, not real life pytest tests. they are only run by mypy
@@ -36,3 +38,71 @@ if TYPE_CHECKING:
 
     def test_class_method_descriptor():
         assert_function(dict.fromkeys)
+
+
+def test_isinstance():
+    from basedtyping import FunctionType
+
+    def f(a: int, b: str = "") -> bool:
+        return bool(a and b)
+
+    def g(*args: object) -> None:
+        del args
+
+    assert isinstance(f, FunctionType[[int], bool])  # type: ignore[arg-type]
+    assert isinstance(f, FunctionType[[bool, str], object])  # type: ignore[arg-type]
+    assert not isinstance(f, FunctionType[[object], bool])  # type: ignore[arg-type]
+    assert not isinstance(f, FunctionType[[int], str])  # type: ignore[arg-type]
+    assert not isinstance(f, FunctionType[[], bool])  # type: ignore[arg-type]
+    assert not isinstance(f, FunctionType[[int, str, str], bool])  # type: ignore[arg-type]
+    assert isinstance(f, FunctionType[..., bool])  # type: ignore[arg-type]
+    assert isinstance(g, FunctionType[[int, str], None])  # type: ignore[arg-type]
+    assert not isinstance(len, FunctionType[..., int])  # type: ignore[arg-type]
+    assert not isinstance(f, FunctionType[[int], Callable[[], None]])  # type: ignore[arg-type]
+
+
+def test_isinstance_keyword_only():
+    from basedtyping import FunctionType
+
+    def f(a: int, *, b: str) -> None:
+        del a, b
+
+    def g(a: int, *, b: str = "") -> None:
+        del a, b
+
+    assert not isinstance(f, FunctionType[[int], None])  # type: ignore[arg-type]
+    assert isinstance(g, FunctionType[[int], None])  # type: ignore[arg-type]
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+def test_isinstance_based():
+    from basedtyping import FunctionType
+
+    def f(a: 1 | 2) -> int & str:  # type: ignore[empty-body]  # noqa: ARG001
+        ...
+
+    assert isinstance(f, FunctionType[[Literal[1]], int])  # type: ignore[arg-type]
+    assert not isinstance(f, FunctionType[[int], int])  # type: ignore[arg-type]
+
+
+def test_isinstance_cached():
+    from basedtyping import FunctionType, _function_signatures
+
+    def make() -> FunctionType[[int], None]:
+        def f(a: int) -> None:
+            del a
+
+        return f
+
+    first, second = make(), make()
+    assert isinstance(first, FunctionType[[int], None])  # type: ignore[arg-type]
+    signature = _function_signatures[first.__code__]
+    assert isinstance(second, FunctionType[[int], None])  # type: ignore[arg-type]
+    assert _function_signatures[second.__code__] is signature
+
+
+def test_repr():
+    from basedtyping import FunctionType
+
+    assert repr(FunctionType[[int], str]) == "basedtyping.FunctionType[[int], str]"
+    assert repr(FunctionType[..., str]) == "basedtyping.FunctionType[..., str]"
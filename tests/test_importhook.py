@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import importlib
+import sys
+import textwrap
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, NoReturn, Tuple, Union, cast
+from unittest import skipIf
+
+import pytest
+from typing_extensions import Literal, Protocol, TypeGuard, TypeIs
+
+import basedtyping
+from basedtyping import Intersection, get_type_hints, importhook
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_future_module = """
+    '''a docstring'''
+    from __future__ import annotations
+
+    from enum import Enum
+
+    class A: ...
+    class B: ...
+
+    class E(Enum):
+        a = 1
+
+    class C:
+        a: 1 | 2
+        b: A & B
+        c: (int, str)
+
+    def f(a: "(int) -> str", b: -1) -> b is A if True else False: ...
+
+    def g(a: E.a) -> object is int: ...
+"""
+
+_eager_module = """
+    from typing import List
+
+    class A: ...
+    class B: ...
+
+    def f(a: "1 | 2", b: List["A & B"]) -> "(int) -> str": ...
+"""
+
+
+@pytest.fixture  # type: ignore[no-any-expr]
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    package = tmp_path / "hooked"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "future.py").write_text(textwrap.dedent(_future_module))
+    (package / "eager.py").write_text(textwrap.dedent(_eager_module))
+    monkeypatch.syspath_prepend(str(tmp_path))  # type: ignore[no-untyped-call]
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    importhook.install("hooked")
+    yield package
+    importhook.uninstall()
+    for name in [name for name in sys.modules if name.split(".")[0] == "hooked"]:
+        del sys.modules[name]
+
+
+class _Function(Protocol):
+    __annotations__: dict[str, object]
+
+
+class _Subscriptable(Protocol):
+    def __getitem__(self, item: object) -> object:
+        ...
+
+
+class _E(Protocol):
+    a: Enum
+
+
+class _Module(Protocol):
+    """the attributes of the modules above"""
+
+    __basedtyping_transformed__: bool
+    A: type
+    B: type
+    C: type
+    E: _E
+    List: _Subscriptable
+    f: _Function
+    g: _Function
+
+
+def _import(name: str) -> _Module:
+    return cast(_Module, importlib.import_module(f"hooked.{name}"))
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+def test_transformed(package: Path):
+    module = _import("future")
+    assert module.__basedtyping_transformed__
+    assert module.__doc__ == "a docstring"
+    assert get_type_hints(module.C) == {
+        "a": Union[Literal[1], Literal[2]],  # noqa: PYI030
+        "b": Intersection[module.A, module.B],
+        "c": Tuple[int, str],
+    }
+    assert get_type_hints(module.f) == {
+        "a": Callable[[int], str],
+        "b": Literal[-1],
+        "return": TypeGuard[module.A],
+    }
+    assert any(package.joinpath("__pycache__").glob("future.*.opt-based1.pyc"))
+
+
+def test_same_as_transformer(package: Path):
+    module = _import("future")
+    hints = get_type_hints(module.f)
+    del module.__basedtyping_transformed__
+    source_module = importlib.util.module_from_spec(
+        importlib.util.spec_from_file_location("hooked_source", package / "future.py")  # type: ignore[arg-type]
+    )
+    namespace = cast(Dict[str, object], source_module.__dict__)
+    exec(compile((package / "future.py").read_text(), "future.py", "exec"), namespace)
+    source_hints = get_type_hints(namespace["f"])
+    assert hints.keys() == source_hints.keys()
+    assert repr(hints).replace("hooked.future.", "") == repr(source_hints).replace(
+        "hooked_source.", ""
+    )
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+@pytest.mark.usefixtures("package")
+def test_transformer_not_used(monkeypatch: pytest.MonkeyPatch):
+    module = _import("future")
+
+    def eval_direct(*_: object) -> object:
+        raise AssertionError("transformer was used")
+
+    monkeypatch.setattr(basedtyping, "_eval_direct", eval_direct)
+    get_type_hints(module.C)
+    get_type_hints(module.f)
+
+
+@pytest.mark.usefixtures("package")
+def test_enum_member_falls_back():
+    module = _import("future")
+    assert get_type_hints(module.g) == {"a": Literal[module.E.a], "return": TypeIs[int]}
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+@pytest.mark.usefixtures("package")
+def test_eager():
+    module = _import("eager")
+    assert module.f.__annotations__["a"] == (
+        "_basedtyping_hook_typing.Literal[1] | _basedtyping_hook_typing.Literal[2]"
+    )
+    assert get_type_hints(module.f) == {
+        "a": Union[Literal[1], Literal[2]],  # noqa: PYI030
+        "b": module.List[Intersection[module.A, module.B]],
+        "return": Callable[[int], str],
+    }
+
+
+@pytest.mark.usefixtures("package")
+def test_cached(monkeypatch: pytest.MonkeyPatch):
+    _import("future")
+    del sys.modules["hooked.future"]
+
+    def source_to_code(*_: object) -> NoReturn:
+        pytest.fail("not cached")
+
+    monkeypatch.setattr(importhook.BasedLoader, "source_to_code", source_to_code)
+    module = _import("future")
+    assert module.__basedtyping_transformed__
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+@pytest.mark.usefixtures("package")
+def test_not_installed():
+    importhook.uninstall()
+    module = _import("future")
+    assert not hasattr(module, "__basedtyping_transformed__")
+    assert get_type_hints(module.C)["a"] == Union[Literal[1], Literal[2]]  # noqa: PYI030
+
+
+@skipIf(sys.version_info < (3, 11), "unsupported")  # type: ignore[no-any-expr]
+def test_enum_member_outside_literal():
+    class E(Enum):
+        a = 1
+
+    assert basedtyping._contains_enum_member(Union[E.a, int])
+    assert not basedtyping._contains_enum_member(Literal[E.a])
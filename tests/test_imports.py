@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from unittest import skipIf
+
+import basedtyping
+
+_lazy_modules = ("basedtyping.transformer", "basedtyping.validation", "basedtyping.dispatching")
+
+
+def _modules_after(code: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_import_is_lazy():
+    modules = _modules_after("import basedtyping")
+    assert not modules.intersection(_lazy_modules)
+
+
+def test_lazy_attributes():
+    modules = _modules_after("from basedtyping import dispatch")
+    assert "basedtyping.dispatching" in modules
+    assert "basedtyping.validation" not in modules
+    assert basedtyping.compile_validator is basedtyping.validation.compile_validator
+    assert set(basedtyping.__all__) <= set(dir(basedtyping))
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+def test_transformer_is_imported_when_needed():
+    modules = _modules_after(
+        "from basedtyping import get_type_hints\n" "def f(a: '1 | 2'): ...\n" "get_type_hints(f)"
+    )
+    assert "basedtyping.transformer" in modules
+
+
+def test_missing_attribute():
+    assert not hasattr(basedtyping, "missing")
+
+
+def test_precompute_is_imported_when_there_are_stored_hints():
+    modules = _modules_after(
+        "from basedtyping import get_type_hints\n" "def f(a: int): ...\n" "get_type_hints(f)"
+    )
+    assert "basedtyping.precompute" not in modules
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import pickle
+from abc import ABC
+from typing import Protocol, Sized, runtime_checkable
+
+from pytest import raises
 
 from basedtyping import Intersection
 
@@ -55,3 +59,81 @@ def test_intersection_reduce():
     loaded = pickle.loads(pickled)  # type: ignore[no-any-expr]
     assert loaded is value  # type: ignore[no-any-expr]
     assert loaded is not other  # type: ignore[no-any-expr]
+
+
+def test_intersection_cache():
+    assert issubclass(C, value)  # type: ignore[misc, arg-type, misc]
+    assert not issubclass(A, value)  # type: ignore[misc, arg-type, misc]
+    assert value._subclass_check_cache.get(C) is True  # type: ignore[attr-defined]
+    assert value._subclass_check_cache.get(A) is False  # type: ignore[attr-defined]
+
+
+def test_intersection_cache_invalidated_by_register():
+    class Base(ABC):  # noqa: B024
+        pass
+
+    class D(A):
+        pass
+
+    intersection = Intersection[A, Base]
+    assert not isinstance(D(), intersection)  # type: ignore[arg-type]
+    Base.register(D)
+    assert isinstance(D(), intersection)  # type: ignore[arg-type]
+
+
+def test_intersection_subclasscheck_not_a_class():
+    with raises(TypeError):
+        issubclass(1, value)  # type: ignore[misc, arg-type, misc]
+
+
+def test_intersection_eq_hash_order():
+    assert Intersection[A, B] == Intersection[B, A]
+    assert hash(Intersection[A, B]) == hash(Intersection[B, A])
+    assert {Intersection[A, B]: 1}[Intersection[B, A]] == 1
+
+
+@runtime_checkable
+class Readable(Protocol):
+    def read(self) -> bytes:
+        ...
+
+
+@runtime_checkable
+class Closeable(Protocol):
+    def close(self) -> None:
+        ...
+
+
+class File:
+    def read(self) -> bytes:
+        return b""
+
+    def close(self) -> None:
+        pass
+
+
+class NotCloseable(File):
+    close = None  # type: ignore[assignment]
+
+
+class Registered:
+    pass
+
+
+def test_intersection_protocols():
+    readable_closeable = Intersection[Readable, Closeable, Sized]
+    assert readable_closeable._protocol_members == {"read", "close"}  # type: ignore[attr-defined]
+
+    class SizedFile(File):
+        def __len__(self) -> int:
+            return 0
+
+    assert isinstance(SizedFile(), readable_closeable)  # type: ignore[arg-type]
+    assert not isinstance(File(), readable_closeable)  # type: ignore[arg-type]
+    assert not isinstance(NotCloseable(), Intersection[Readable, Closeable])  # type: ignore[arg-type]
+
+
+def test_intersection_protocols_registered():
+    Closeable.register(Registered)
+    Readable.register(Registered)
+    assert isinstance(Registered(), Intersection[Readable, Closeable])  # type: ignore[arg-type]
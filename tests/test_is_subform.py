@@ -1,9 +1,30 @@
 from __future__ import annotations
 
 import sys
-from typing import Union
+from abc import ABC
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Counter,
+    Dict,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    NoReturn,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
-from basedtyping import issubform
+from typing_extensions import Annotated, Never
+
+from basedtyping import FunctionType, Intersection, T, TypeForm, in_T, issubform, out_T
 
 
 def test_normal():
@@ -28,3 +49,149 @@ def test_old_union():
             Union[int, str],
             int | str,  # type: ignore[unused-ignore, arg-type]
         )
+
+
+def test_never():
+    assert issubform(Never, int)
+    assert not issubform(int, Never)
+    assert issubform(NoReturn, Never)
+
+
+def test_top():
+    assert issubform(Union[int, str], object)
+    assert issubform(Literal[1], Any)
+    assert not issubform(Any, int)
+
+
+def test_literal():
+    assert issubform(Literal[1, 2], int)
+    assert issubform(Literal[1, 2], Literal[1, 2, 3])
+    assert not issubform(Literal[1, 4], Literal[1, 2, 3])
+    assert not issubform(Literal[True], Literal[1])
+    assert not issubform(Literal[1], bool)
+    assert issubform(bool, Literal[True, False])
+    assert not issubform(int, Literal[1])
+    assert issubform(Literal[1, 2], Union[Literal[1], Literal[2]])  # noqa: PYI030
+    assert issubform(Literal[1, "a"], Union[Literal[1], str])
+
+
+def test_enum_literal():
+    class E(Enum):
+        a = 1
+        b = 2
+
+    assert issubform(Literal[E.a], E)
+    assert issubform(E, Literal[E.a, E.b])
+    assert not issubform(E, Literal[E.a])
+
+
+class A:
+    pass
+
+
+class B:
+    pass
+
+
+class AB(A, B):
+    pass
+
+
+def test_intersection():
+    assert issubform(Intersection[A, B], A)  # type: ignore[arg-type]
+    assert not issubform(A, Intersection[A, B])  # type: ignore[arg-type]
+    assert issubform(AB, Intersection[A, B])  # type: ignore[arg-type]
+    assert issubform(Intersection[AB, int], Intersection[A, B])  # type: ignore[arg-type]
+    assert issubform(Intersection[A, B], Union[A, int])  # type: ignore[arg-type]
+
+
+def test_generic_variance():
+    assert issubform(List[bool], Sequence[int])
+    assert not issubform(List[bool], List[int])
+    assert issubform(Dict[str, bool], Mapping[str, int])
+    assert not issubform(Dict[bool, int], Mapping[int, int])
+    assert issubform(Dict[str, int], Iterable[str])
+    assert issubform(Generator[bool, None, None], Iterator[int])
+    assert issubform(List[int], list)
+    assert not issubform(list, List[int])
+
+
+def test_stdlib_bases():
+    assert issubform(str, Sequence[str])
+    assert not issubform(str, Sequence[int])
+    assert issubform(bytes, Iterable[int])
+    assert issubform(Counter[str], Mapping[str, int])
+    assert not issubform(Counter[str], Mapping[str, str])
+
+
+def test_numeric_tower():
+    assert issubform(int, float)
+    assert issubform(bool, complex)
+    assert not issubform(float, int)
+    assert issubform(List[int], Sequence[float])
+
+
+def test_user_generic_variance():
+    class Box(Generic[out_T]):
+        pass
+
+    class Sink(Generic[in_T]):
+        pass
+
+    class StrMap(Dict[str, T]):
+        pass
+
+    assert issubform(Box[bool], Box[int])
+    assert not issubform(Box[int], Box[bool])
+    assert issubform(Sink[int], Sink[bool])
+    assert not issubform(Sink[bool], Sink[int])
+    assert issubform(StrMap[bool], Mapping[str, int])
+    assert not issubform(StrMap[bool], Mapping[int, int])
+
+
+def test_tuple():
+    assert issubform(Tuple[bool, int], Tuple[int, ...])
+    assert issubform(Tuple[bool, int], Tuple[int, int])
+    assert not issubform(Tuple[int, ...], Tuple[int])
+    assert issubform(Tuple[bool, int], Sequence[int])
+    assert not issubform(Tuple[bool, str], Sequence[int])
+
+
+def test_callable():
+    assert issubform(Callable[[object], bool], Callable[[int], int])
+    assert not issubform(Callable[[int], bool], Callable[[object], int])
+    assert not issubform(Callable[[int], str], Callable[[int], int])
+    assert issubform(Callable[[int], bool], Callable[..., int])
+    assert not issubform(Callable[[int, int], int], Callable[[int], int])
+    assert issubform(FunctionType[[int], str], Callable[[int], str])
+    assert not issubform(Callable[[int], str], FunctionType[[int], str])
+
+
+def test_type_form():
+    assert issubform(TypeForm[bool], TypeForm[int])  # type: ignore[arg-type]
+    assert not issubform(TypeForm[int], TypeForm[bool])  # type: ignore[arg-type]
+    assert issubform(Type[bool], TypeForm[int])  # type: ignore[arg-type]
+    assert issubform(Type[bool], Type[int])
+    assert not issubform(TypeForm[int], Type[int])  # type: ignore[arg-type]
+    assert issubform(TypeForm[int], TypeForm)  # type: ignore[arg-type]
+
+
+def test_annotated():
+    assert issubform(Annotated[bool, 1], int)  # type: ignore[arg-type]
+    assert issubform(bool, Annotated[int, 1])  # type: ignore[arg-type]
+
+
+def test_memoized():
+    class Base(ABC):  # noqa: B024
+        pass
+
+    class C:
+        pass
+
+    assert not issubform(List[C], Sequence[Base])
+    Base.register(C)
+    assert issubform(List[C], Sequence[Base])
+
+
+def test_unhashable():
+    assert issubform(Literal[[]], list)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import sys
+from enum import Enum
+from typing import Iterable, List, Literal, Optional, Union, cast
+from unittest import skipIf
+
+from pytest import importorskip, raises
+from typing_extensions import Annotated, Protocol
+
+from basedtyping import are_literal_members, get_type_hints, is_literal_member, literal_values
+
+
+class E(Enum):
+    a = 1
+    b = 2
+
+
+def test_literal_values():
+    assert literal_values(Literal[1, 2]) == {1, 2}
+    assert literal_values(Union[Literal[1], Literal["a"], None]) == {1, "a", None}  # noqa: PYI030
+    assert literal_values(Annotated[Literal[1], "metadata"]) == {1}
+    assert literal_values(Optional[bool]) == {True, False, None}
+    assert literal_values(Union[E, Literal[3]]) == {E.a, E.b, 3}
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+def test_literal_values_based():
+    class A:
+        a: 1 | 2 | 3
+
+    assert literal_values(get_type_hints(A)["a"]) == {1, 2, 3}
+
+
+def test_literal_values_cached():
+    assert literal_values(Literal[1, 2]) is literal_values(Literal[1, 2])
+
+
+def test_not_a_literal():
+    with raises(TypeError):
+        literal_values(Union[Literal[1], int])  # noqa: PYI051
+
+
+def test_is_literal_member():
+    assert is_literal_member(1, Literal[1, 2])
+    assert not is_literal_member(3, Literal[1, 2])
+    assert is_literal_member(None, Optional[Literal[1]])
+    assert is_literal_member(E.a, E)
+    # `True == 1`, but it's a different type
+    assert not is_literal_member(True, Literal[1])  # noqa: FBT003
+    assert not is_literal_member(1, Literal[True])
+    assert not is_literal_member([], Literal[1])
+
+
+def test_are_literal_members():
+    assert are_literal_members([1, True, 3, "a"], Literal[1, "a"]) == [True, False, False, True]
+    assert are_literal_members(iter(()), Literal[1]) == []
+    assert are_literal_members([[], 1], Literal[1]) == [False, True]
+
+
+class _NDArray(Iterable[object], Protocol):
+    def tolist(self) -> List[object]:
+        ...
+
+
+class _NumPy(Protocol):
+    def array(self, values: List[object], dtype: type | None = ...) -> _NDArray:
+        ...
+
+
+def test_are_literal_members_ndarray():
+    numpy = cast(_NumPy, importorskip("numpy"))
+
+    def members(values: _NDArray, form: object) -> list[object]:
+        return cast(_NDArray, cast(object, are_literal_members(values, form))).tolist()
+
+    assert members(numpy.array([[1, 2], [3, 1]]), Literal[1, 2, True]) == [
+        [True, True],
+        [False, True],
+    ]
+    assert members(numpy.array([True, False]), Literal[1, True]) == [True, False]
+    assert members(numpy.array(["a", "b"]), Literal["a"]) == [True, False]
+    assert members(numpy.array([E.a, 1], dtype=object), Literal[E.a]) == [True, False]
+    assert members(numpy.array([[], 1], dtype=object), Literal[1]) == [False, True]
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import os
+import subprocess
+import sys
+import textwrap
+from typing import TYPE_CHECKING, Callable, Iterator, Union, cast
+from unittest import skipIf
+
+import pytest
+from typing_extensions import Annotated, Literal, Protocol
+
+import basedtyping
+from basedtyping import FunctionType, Intersection, awarmup, get_type_hints, precompute, warmup
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_module = """
+    from __future__ import annotations
+
+    import functools
+    from typing import Annotated
+
+    from basedtyping import FunctionType
+
+    class A: ...
+    class B: ...
+
+    a: 1 | 2
+
+    class C:
+        b: A & B
+
+        def method(self, c: "(int) -> str") -> Annotated[int, "meta"]: ...
+
+    def f(d: FunctionType[[int], str]): ...
+
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    @decorate
+    def wrapped(x: int): ...
+
+    first_wrapped = wrapped
+
+    @decorate
+    def wrapped(x: str): ...
+"""
+
+
+@pytest.fixture  # type: ignore[no-any-expr]
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    package = tmp_path / "precomputed"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "module.py").write_text(textwrap.dedent(_module))
+    monkeypatch.syspath_prepend(str(tmp_path))  # type: ignore[no-untyped-call]
+    yield package
+    for name in [name for name in sys.modules if name.split(".")[0] == "precomputed"]:
+        del sys.modules[name]
+        precompute._modules.pop(name, None)
+        precompute._source_hashes.pop(name, None)
+
+
+def _transformer_not_used(monkeypatch: pytest.MonkeyPatch):
+    def eval_direct(*_: object) -> object:
+        raise AssertionError("transformer was used")
+
+    monkeypatch.setattr(basedtyping, "_eval_direct", eval_direct)
+
+
+class _C(Protocol):
+    method: object
+
+
+class _Module(Protocol):
+    """the attributes of the module above"""
+
+    A: type
+    B: type
+    C: _C
+    f: object
+    wrapped: object
+    first_wrapped: object
+
+
+def _import() -> _Module:
+    return cast(_Module, importlib.import_module("precomputed.module"))
+
+
+def _module_hints(module: _Module) -> list[dict[str, object]]:
+    return [
+        get_type_hints(module),
+        get_type_hints(module.C),
+        get_type_hints(module.C.method, include_extras=True),
+        get_type_hints(module.C.method),
+    ]
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+def test_precomputed(package: Path, monkeypatch: pytest.MonkeyPatch):
+    assert precompute.precompute("precomputed") == 2
+    assert any(package.joinpath("__pycache__").glob("module.*.basedhints"))
+    module = _import()
+    evaluated = _module_hints(module)
+    precompute._modules.clear()
+    _transformer_not_used(monkeypatch)
+    assert _module_hints(module) == evaluated
+    assert evaluated == [
+        {"a": Union[Literal[1], Literal[2]]},  # noqa: PYI030
+        {"b": Intersection[module.A, module.B]},
+        {"c": Callable[[int], str], "return": Annotated[int, "meta"]},
+        {"c": Callable[[int], str], "return": int},
+    ]
+
+
+@pytest.mark.usefixtures("package")
+def test_wrappers_with_the_same_name():
+    precompute.precompute("precomputed")
+    module = _import()
+    precompute._modules.clear()
+    assert get_type_hints(module.first_wrapped) == {"x": int}
+    assert get_type_hints(module.wrapped) == {"x": str}
+
+
+def test_found_without_importing_precompute(package: Path):
+    precompute.precompute("precomputed")
+    code = (
+        "import sys\n"
+        "import basedtyping\n"
+        "from precomputed import module\n"
+        "def fail(*_): raise AssertionError\n"
+        "basedtyping._eval_direct = fail\n"
+        "assert 'basedtyping.precompute' not in sys.modules\n"
+        "print(basedtyping.get_type_hints(module.C))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join((str(package.parent), *sys.path))},
+    )
+    assert (
+        result.stdout
+        == "{'b': basedtyping.Intersection[precomputed.module.A, precomputed.module.B]}\n"
+    )
+
+
+@pytest.mark.usefixtures("package")
+def test_not_picklable():
+    precompute.precompute("precomputed")
+    module = _import()
+    assert precompute.precomputed_hints(module.f) is None
+    assert get_type_hints(module.f) == {"d": FunctionType[[int], str]}
+
+
+def test_changed(package: Path):
+    precompute.precompute("precomputed")
+    module = importlib.import_module("precomputed.module")
+    (package / "module.py").write_text(textwrap.dedent(_module).replace("1 | 2", "3"))
+    precompute._modules.clear()
+    precompute._source_hashes.clear()
+    assert precompute.precomputed_hints(module) is None
+
+
+def test_returns_a_copy():
+    def f(a: int):
+        del a
+
+    precompute._warmed[f] = None, {"a": int}
+    result = precompute.precomputed_hints(f)
+    assert result == {"a": int}
+    assert result is not precompute._warmed[f][1]
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+def test_changed_and_reloaded(package: Path):
+    precompute.precompute("precomputed")
+    module = importlib.import_module("precomputed.module")
+    assert precompute.precomputed_hints(module) is not None
+    (package / "module.py").write_text(textwrap.dedent(_module).replace("1 | 2", "3"))
+    importlib.reload(module)
+    assert precompute.precomputed_hints(module) is None
+    assert get_type_hints(module) == {"a": Literal[3]}
+
+
+@pytest.mark.usefixtures("package")
+def test_main(capsys: pytest.CaptureFixture[str]):
+    precompute.main(["precomputed"])
+    assert capsys.readouterr().out == "stored the hints of 2 modules\n"
+
+
+@pytest.mark.usefixtures("package")
+@pytest.mark.parametrize("workers", [1, 2])
+def test_warmup(monkeypatch: pytest.MonkeyPatch, workers: int):
+    module = _import()
+    # `a: 1 | 2` can't be evaluated before 3.10, so the module's hints aren't precomputed
+    assert warmup([module], workers=workers).result() == (9 if sys.version_info >= (3, 10) else 8)
+    _transformer_not_used(monkeypatch)
+    assert get_type_hints(module.C) == {"b": Intersection[module.A, module.B]}
+    assert get_type_hints(module.f) == {"d": FunctionType[[int], str]}
+
+
+@pytest.mark.usefixtures("package")
+def test_warmup_wrappers_with_the_same_name():
+    module = _import()
+    warmup([module]).result()
+    assert get_type_hints(module.first_wrapped) == {"x": int}
+    assert get_type_hints(module.wrapped) == {"x": str}
+
+
+def test_warmup_reloaded(package: Path):
+    module = importlib.import_module("precomputed.module")
+    warmup([module]).result()
+    (package / "module.py").write_text(textwrap.dedent(_module).replace("1 | 2", "3"))
+    importlib.reload(module)
+    assert precompute.precomputed_hints(module) is None
+    assert get_type_hints(module) == {"a": Literal[3]}
+
+
+def test_warmup_forms():
+    assert warmup([], forms=[(Intersection, (int, str))]).result() == 0
+    with pytest.raises(TypeError):
+        warmup([], forms=[(int, int)]).result()
+
+
+@pytest.mark.usefixtures("package")
+def test_awarmup(monkeypatch: pytest.MonkeyPatch):
+    module = _import()
+    order: list[object] = []
+
+    async def other():
+        order.append("other")
+
+    async def warm():
+        task = asyncio.ensure_future(other())
+        order.append(await awarmup([module.C]))
+        await task
+
+    asyncio.run(warm())
+    assert order == ["other", 2]
+    _transformer_not_used(monkeypatch)
+    assert get_type_hints(module.C.method)["c"] == Callable[[int], str]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import gc
+from typing import Sized
+
+from basedtyping import ReifiedGeneric, T, out_T
+
+
+class Reified(ReifiedGeneric[T]):
+    pass
+
+
+# https://github.com/KotlinIsland/basedtyping/issues/70
+class Covariant(ReifiedGeneric[out_T]):  # type:ignore[type-var]
+    pass
+
+
+def test_cached():
+    assert isinstance(Reified[int](), Reified)
+    assert not isinstance(Reified[str](), Reified[int])  # type: ignore[misc]
+    assert Reified._subclass_check_cache.get(Reified[int]) is True
+    assert Reified[int]._subclass_check_cache.get(Reified[str]) is False
+    assert isinstance(Reified[int](), Reified)
+    assert not isinstance(Reified[str](), Reified[int])  # type: ignore[misc]
+
+
+def test_invalidated_by_register():
+    class A:
+        pass
+
+    assert not isinstance(Covariant[A](), Covariant[Sized])  # type: ignore[misc]
+    assert not issubclass(Covariant[A], Covariant[Sized])  # type: ignore[misc]
+    Sized.register(A)
+    assert isinstance(Covariant[A](), Covariant[Sized])  # type: ignore[misc]
+    assert issubclass(Covariant[A], Covariant[Sized])  # type: ignore[misc]
+
+
+def test_doesnt_keep_classes_alive():
+    class Local(ReifiedGeneric[T]):
+        pass
+
+    class Sub(Local[int]):
+        pass
+
+    assert isinstance(Sub(), Local[int])  # type: ignore[misc]
+    assert len(Local[int]._subclass_check_cache.results) == 1
+    del Sub
+    gc.collect()
+    assert not Local[int]._subclass_check_cache.results
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import sys
+from typing import List, Union
+from unittest import skipIf
+
+from typing_extensions import Literal
+
+from basedtyping import ReifiedGeneric, T, out_T
+
+
+class Reified(ReifiedGeneric[T]):
+    pass
+
+
+# https://github.com/KotlinIsland/basedtyping/issues/70
+class Covariant(ReifiedGeneric[out_T]):  # type:ignore[type-var]
+    pass
+
+
+class Bar:
+    pass
+
+
+def test_forward_ref():
+    assert isinstance(Reified["Bar"](), Reified[Bar])  # type: ignore[misc]
+    assert isinstance(Reified[Bar](), Reified["Bar"])  # type: ignore[misc]
+    assert not isinstance(Reified["int"](), Reified[Bar])  # type: ignore[misc]
+    assert Reified["Bar"].__reified_generics__ == (Bar,)
+
+
+def test_nested():
+    assert Reified[List["Bar"]]().__reified_generics__ == (List[Bar],)
+    assert Reified[list["Bar"]]().__reified_generics__ == (list[Bar],)
+    assert Reified[List[List["Bar"]]]().__reified_generics__ == (List[List[Bar]],)
+
+
+def test_caller_namespace():
+    class Local:
+        pass
+
+    assert Reified["Local"]().__reified_generics__ == (Local,)
+
+
+def test_caller_globals():
+    class Other(ReifiedGeneric[T]):
+        pass
+
+    # from a module that doesn't have `Bar`
+    Other.__module__ = "other"
+    assert Other["Bar"]().__reified_generics__ == (Bar,)
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+def test_based():
+    assert Reified["1 | 2"]().__reified_generics__ == (  # type: ignore[valid-type, comparison-overlap]
+        Union[Literal[1], Literal[2]],  # noqa: PYI030
+    )
+
+
+def test_variance():
+    assert isinstance(Covariant["bool"](), Covariant["int"])  # type: ignore[misc]
+    assert not isinstance(Covariant["int"](), Covariant["bool"])  # type: ignore[misc]
+
+
+def test_self_reference():
+    assert Reified["Reified[int]"]().__reified_generics__ == (Reified[int],)
+
+
+def test_subclass():
+    class Sub(Reified["Bar"]):
+        pass
+
+    assert isinstance(Sub(), Reified[Bar])  # type: ignore[misc]
+    assert Sub.__reified_generics__ == (Bar,)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Tuple, TypeVar
+from typing import Generic, List, Tuple, TypeVar
 
 from basedtyping import ReifiedGeneric, T
 
@@ -19,3 +19,22 @@ def test_false() -> None:
     assert (
         Reified[int, bool] is not Reified[int, str]  # type: ignore[comparison-overlap]
     )
+
+
+class SubReified(Reified[T, int]):
+    pass
+
+
+class TestPartialSpecialization(Generic[T, U]):
+    def test_partial_specialization(self):
+        assert Reified[int, U][str] is Reified[int, str]
+        assert Reified[T, int][str] is Reified[str, int]
+        assert Reified[T, U][int, str] is Reified[int, str]
+        assert Reified[T, U][U, int][str] is Reified[str, int]  # type: ignore[misc]
+
+    def test_partial_specialization_nested(self):
+        assert Reified[List[T], U][int, str] is Reified[List[int], str]
+
+    def test_subclass_partial_specialization(self):
+        assert SubReified[str].__reified_generics__ == (str, int)
+        assert SubReified[T][str] is SubReified[str]
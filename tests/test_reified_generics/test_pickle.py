@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pickle
+from typing import Generic, List, Tuple, TypeVar, cast
+
+from basedtyping import ReifiedGeneric, T
+
+T2 = TypeVar("T2")
+
+
+class Reified(ReifiedGeneric[Tuple[T, T2]]):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class SubReified(Reified[int, T2]):
+    pass
+
+
+def _round_trip(value: T) -> T:
+    return cast(T, pickle.loads(pickle.dumps(value)))
+
+
+class TestPickle(Generic[T2]):
+    def test_pickle_class(self):
+        assert _round_trip(Reified) is Reified
+        assert _round_trip(Reified[int, str]) is Reified[int, str]
+        assert _round_trip(Reified[int, T2]) is Reified[int, T2]
+        assert _round_trip(SubReified[str]) is SubReified[str]
+
+
+def test_pickle_instance():
+    loaded = _round_trip(Reified[int, str](1))
+    assert type(loaded) is Reified[int, str]
+    assert loaded.value == 1
+
+
+def test_pickle_instances_share_class():
+    instances = [Reified[int, str](i) for i in range(10)]
+    pickled = pickle.dumps(instances)
+    assert pickled.count(b"Reified") == 1
+    loaded = cast(List[Reified[int, str]], pickle.loads(pickled))
+    assert [it.value for it in loaded] == list(range(10))
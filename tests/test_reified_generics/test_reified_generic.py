@@ -94,3 +94,17 @@ if TYPE_CHECKING:
             pass
 
         assert_type(Subtype(), Subtype)
+
+
+def test_not_reified_subclass_of_reified_specialization():
+    class A(ReifiedGeneric[T]):
+        pass
+
+    class B(ReifiedGeneric[T2]):
+        pass
+
+    class C(B[T2], A[int]):
+        pass
+
+    with raises(NotReifiedError, match="Cannot instantiate ReifiedGeneric "):
+        C()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import sys
+import tracemalloc
+
+from basedtyping import ReifiedGeneric, T
+
+
+class Slotted(ReifiedGeneric[T]):
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
+        self.value = value
+
+
+class SubSlotted(Slotted[int]):
+    __slots__ = ()
+
+
+class Normal:
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
+        self.value = value
+
+
+def bytes_per_instance(cls: type[object]) -> float:
+    count = 10_000
+    instances: list[object] = [None] * count
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(count):
+            instances[i] = cls(1)  # type: ignore[call-arg]
+        return (tracemalloc.get_traced_memory()[0] - before) / count
+    finally:
+        tracemalloc.stop()
+
+
+def test_no_dict():
+    assert not hasattr(Slotted[int](1), "__dict__")
+    assert not hasattr(SubSlotted(1), "__dict__")
+
+
+def test_size():
+    assert sys.getsizeof(Slotted[int](1)) == sys.getsizeof(Normal(1))
+
+
+def test_bytes_per_instance():
+    assert bytes_per_instance(Slotted[int]) <= bytes_per_instance(Normal)
+
+
+def test_not_slotted():
+    class NotSlotted(ReifiedGeneric[T]):
+        pass
+
+    NotSlotted[int]().value = 1  # type: ignore[attr-defined]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import sys
+import threading
+from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, TypeVar
+from unittest import skipIf
+
+from pytest import fixture
+
+from basedtyping import ForwardRef, ReifiedGeneric, T, get_type_hints, out_T
+
+R = TypeVar("R")
+
+THREADS = 8
+
+
+@fixture(autouse=True)
+def _switch_often() -> Iterator[None]:
+    # make the threads interleave as much as possible
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        yield
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def run_concurrently(fn: Callable[[], R]) -> list[R]:
+    """runs ``fn`` in ``THREADS`` threads that all start at the same time, and re-raises
+    any of their exceptions"""
+    barrier = threading.Barrier(THREADS)
+
+    def run() -> R:
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        futures = [executor.submit(run) for _ in range(THREADS)]
+        return [future.result() for future in futures]
+
+
+# https://github.com/KotlinIsland/basedtyping/issues/70
+class Covariant(ReifiedGeneric[out_T]):  # type:ignore[type-var]
+    pass
+
+
+def test_specialization_identity():
+    for _ in range(20):
+
+        class Reified(ReifiedGeneric[T]):
+            pass
+
+        results = run_concurrently(lambda: Reified[int])
+        assert all(result is results[0] for result in results)
+
+
+def test_forward_ref_resolution():
+    for _ in range(20):
+
+        class Reified(ReifiedGeneric[T]):
+            pass
+
+        specialization = Reified["int"]
+        run_concurrently(specialization)
+        assert specialization.__reified_generics__ == (int,)
+
+
+def test_instance_checks_while_registering():
+    class Base(ABC):  # noqa: B024
+        pass
+
+    def check() -> None:
+        for _ in range(100):
+
+            class A:
+                pass
+
+            assert not isinstance(Covariant[A](), Covariant[Base])  # type: ignore[misc]
+            Base.register(A)
+            assert isinstance(Covariant[A](), Covariant[Base])  # type: ignore[misc]
+
+    run_concurrently(check)
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+def test_forward_refs():
+    class A:
+        a: 1 | 2
+        b: int & str
+
+    expected = get_type_hints(A)
+
+    def evaluate() -> dict[str, object]:
+        for _ in range(100):
+            ForwardRef("(int) -> str")
+            assert get_type_hints(A) == expected
+        return get_type_hints(A)
+
+    assert run_concurrently(evaluate) == [expected] * THREADS
+
+
+def test_forward_code():
+    def compile_code() -> tuple[str, ...]:
+        # the compiler warns about this one
+        return ForwardRef("1(a)").__forward_code__.co_names
+
+    assert run_concurrently(compile_code) == [("a",)] * THREADS
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import Tuple, Union
 
 from basedtyping import ReifiedGeneric, T, in_T, out_T
 
@@ -31,3 +31,24 @@ def test_invariant():
 
     assert not isinstance(Foo[int](), Foo[Union[int, str]])  # type: ignore[misc]
     assert not isinstance(Foo[Union[int, str]](), Foo[int])  # type: ignore[misc]
+
+
+def test_mixed():
+    class Foo(ReifiedGeneric[Tuple[T, out_T]]):
+        pass
+
+    assert isinstance(Foo[int, bool](), Foo[int, int])  # type: ignore[misc]
+    assert not isinstance(Foo[bool, bool](), Foo[int, int])  # type: ignore[misc]
+    assert not isinstance(Foo[int, str](), Foo[int, int])  # type: ignore[misc]
+
+
+def test_subclass_of_specialization():
+    class Foo(ReifiedGeneric[Tuple[T, out_T]]):
+        pass
+
+    class Sub(Foo[int, out_T]):
+        pass
+
+    assert isinstance(Sub[bool](), Foo[int, int])  # type: ignore[misc]
+    assert isinstance(Sub[bool](), Sub[int])  # type: ignore[misc]
+    assert not isinstance(Sub[int](), Sub[bool])  # type: ignore[misc]
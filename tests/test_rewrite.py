@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import textwrap
+from typing import TYPE_CHECKING
+
+import pytest
+
+from basedtyping.rewrite import main, rewrite, rewrite_source
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_source = textwrap.dedent(
+    '''\
+    """a docstring"""
+
+    from __future__ import annotations
+
+    import enum  # a comment
+
+
+    v: 1 | 2  # another comment
+
+
+    def f(b: "(int) -> str",  c=1) -> x is int:
+        return isinstance(x, int)
+
+
+    y: A & B
+    z: "List[int]"
+    w: E.a
+    '''
+)
+
+_rewritten = textwrap.dedent(
+    '''\
+    """a docstring"""
+
+    from __future__ import annotations
+    import basedtyping
+    import typing_extensions
+
+    import enum  # a comment
+
+
+    v: typing_extensions.Literal[1] | typing_extensions.Literal[2]  # another comment
+
+
+    def f(b: 'typing_extensions.Callable[[int], str]',  c=1) -> typing_extensions.TypeIs[int]:
+        return isinstance(x, int)
+
+
+    y: basedtyping.Intersection[A, B]
+    z: "List[int]"
+    w: E.a
+    '''
+)
+
+
+def test_rewrite_source():
+    assert rewrite_source(_source) == _rewritten
+
+
+def test_rewrite_source_is_idempotent():
+    assert rewrite_source(_rewritten) == _rewritten
+
+
+def test_rewrite_source_unchanged():
+    source = "def f(a: int, b: 'List[ int ]') -> None: ...\n"
+    assert rewrite_source(source) is source
+
+
+def test_rewrite_source_without_future_annotations():
+    source = "import typing_extensions\n\ndef f(a: '1 | 2 | None', b: (int, str)): ...\n"
+    assert rewrite_source(source) == (
+        "import typing_extensions\n\n"
+        "def f(a: 'typing_extensions.Union[typing_extensions.Literal[1], "
+        "typing_extensions.Literal[2], None]', b: (int, str)): ...\n"
+    )
+
+
+@pytest.fixture  # type: ignore[no-any-expr]
+def files(tmp_path: Path) -> list[Path]:
+    result = [tmp_path / "a.py", tmp_path / "b" / "c.py", tmp_path / "b" / "d.py"]
+    for file in result:
+        file.parent.mkdir(exist_ok=True)
+        file.write_text(_source)
+    result[2].write_text("x: int\n")
+    return result
+
+
+def test_rewrite(tmp_path: Path, files: list[Path]):
+    results = rewrite([str(tmp_path)], jobs=2)
+    assert [result.path for result in results] == [str(file) for file in files]
+    assert [bool(result.diff) for result in results] == [True, True, False]
+    assert files[0].read_text() == _rewritten
+
+
+def test_dry_run(files: list[Path], capsys: pytest.CaptureFixture[str]):
+    assert main([str(files[0]), "--dry-run"]) == 0
+    assert files[0].read_text() == _source
+    output = capsys.readouterr()
+    assert "+y: basedtyping.Intersection[A, B]\n" in output.out
+    assert output.err == "would rewrite 1 of 1 files\n"
+
+
+def test_incremental(tmp_path: Path, files: list[Path]):
+    cache = tmp_path / "cache.json"
+    assert len(rewrite([str(tmp_path / "b")], cache=cache)) == 2
+    assert rewrite([str(tmp_path / "b")], cache=cache) == []
+    files[2].write_text("x: 1\n")
+    assert [result.path for result in rewrite([str(tmp_path / "b")], cache=cache)] == [
+        str(files[2])
+    ]
+
+
+def test_syntax_error(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    file = tmp_path / "a.py"
+    file.write_text("def f(:\n")
+    assert main([str(file)]) == 1
+    assert capsys.readouterr().err.startswith(f"{file}: ")
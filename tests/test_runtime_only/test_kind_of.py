@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import collections.abc
+import sys
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    List,
+    Literal,
+    NewType,
+    NoReturn,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from typing_extensions import Annotated, Never, ParamSpec, TypeVarTuple
+
+from basedtyping import ForwardRef, FunctionType, Intersection, ReifiedGeneric, T, TypeForm
+from basedtyping.runtime_only import FormKind, kind_of
+
+
+class Reified(ReifiedGeneric[T]):
+    pass
+
+
+def test_class():
+    assert kind_of(int) is FormKind.CLASS
+    assert kind_of(type(None)) is FormKind.CLASS
+    assert kind_of(collections.abc.Sized) is FormKind.CLASS
+
+
+def test_reified():
+    assert kind_of(Reified) is FormKind.REIFIED
+    assert kind_of(Reified[int]) is FormKind.REIFIED
+
+
+def test_generic():
+    assert kind_of(List[int]) is FormKind.GENERIC
+    assert kind_of(list[int]) is FormKind.GENERIC
+    assert kind_of(List) is FormKind.GENERIC
+
+
+def test_callable():
+    assert kind_of(Callable[[int], str]) is FormKind.CALLABLE
+    assert kind_of(collections.abc.Callable[[int], str]) is FormKind.CALLABLE
+    assert kind_of(FunctionType[[int], str]) is FormKind.CALLABLE
+    assert kind_of(Callable) is FormKind.CALLABLE
+
+
+def test_union():
+    assert kind_of(Union[int, str]) is FormKind.UNION
+    assert kind_of(Optional[int]) is FormKind.UNION
+    if sys.version_info >= (3, 10):
+        assert kind_of(int | str) is FormKind.UNION
+
+
+def test_based_forms():
+    assert kind_of(Intersection[int, str]) is FormKind.INTERSECTION
+    assert kind_of(TypeForm[int]) is FormKind.TYPE_FORM
+    assert kind_of(TypeForm) is FormKind.TYPE_FORM
+
+
+def test_others():
+    assert kind_of(Literal[1, 2]) is FormKind.LITERAL
+    assert kind_of(Annotated[int, 1]) is FormKind.ANNOTATED
+    assert kind_of(TypeVar("T")) is FormKind.TYPEVAR
+    assert kind_of(ParamSpec("P")) is FormKind.PARAM_SPEC
+    assert kind_of(TypeVarTuple("Ts")) is FormKind.TYPEVAR_TUPLE
+    assert kind_of(cast(object, NewType("N", int))) is FormKind.NEW_TYPE
+    assert kind_of("int") is FormKind.FORWARD_REF
+    assert kind_of(ForwardRef("int")) is FormKind.FORWARD_REF
+    assert kind_of(Any) is FormKind.ANY
+    assert kind_of(Never) is FormKind.NEVER
+    assert kind_of(NoReturn) is FormKind.NEVER
+    assert kind_of(None) is FormKind.NONE
+    assert kind_of(ClassVar[int]) is FormKind.SPECIAL_FORM
+    assert kind_of(Union) is FormKind.SPECIAL_FORM
+    assert kind_of(1) is FormKind.OTHER
+    assert kind_of(lambda: 1) is FormKind.OTHER
+
+
+def test_metaclass():
+    class Meta(type):
+        pass
+
+    class C(metaclass=Meta):
+        pass
+
+    assert kind_of(C) is FormKind.CLASS
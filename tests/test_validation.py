@@ -0,0 +1,553 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import sys
+from enum import Enum
+from typing import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Counter,
+    Dict,
+    Generator,
+    Generic,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    Literal,
+    NewType,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    ValuesView,
+    cast,
+)
+from unittest import skipIf
+
+from pytest import importorskip, raises
+from typing_extensions import (
+    Annotated,
+    LiteralString,
+    NotRequired,
+    ParamSpec,
+    Protocol,
+    Self,
+    TypedDict,
+    TypeIs,
+    TypeVarTuple,
+    Unpack,
+    override,
+    runtime_checkable,
+)
+
+from basedtyping import (
+    ForwardRef,
+    Intersection,
+    ReifiedGeneric,
+    T,
+    TypeForm,
+    checked,
+    compile_validator,
+    filter_instances,
+    get_type_hints,
+    instance_mask,
+    partition,
+    validate_aiter,
+    validate_iter,
+)
+from basedtyping.validation import _any
+
+
+class A:
+    pass
+
+
+class B:
+    pass
+
+
+class AB(A, B):
+    pass
+
+
+class Reified(ReifiedGeneric[T]):
+    pass
+
+
+class E(Enum):
+    a = 1
+
+
+def test_classes():
+    validate = compile_validator(int)
+    assert validate(1)
+    assert validate(True)  # noqa: FBT003
+    assert not validate("1")
+    assert compile_validator(object)(None)
+    assert compile_validator(None)(None)
+    assert not compile_validator(None)(0)
+
+
+def test_union():
+    validate = compile_validator(Union[int, str, Literal[b"a"], None, List[int]])
+    assert validate(1)
+    assert validate("a")
+    assert validate(b"a")
+    assert not validate(b"b")
+    assert validate(None)
+    assert validate([1])
+    assert not validate(["a"])
+    assert not validate(1.0)
+
+
+def test_literal():
+    validate = compile_validator(Union[Literal[1, "a"], Literal[E.a]])  # noqa: PYI030
+    assert validate(1)
+    assert validate("a")
+    assert validate(E.a)
+    assert not validate(True)  # noqa: FBT003
+    assert not validate(2)
+    assert not validate([1])
+
+
+def test_nested():
+    validate = compile_validator(Dict[str, List[Literal[1, 2]]])
+    assert validate({"a": [1, 2], "b": []})
+    assert not validate({"a": [3]})
+    assert not validate({1: [1]})
+    assert not validate([])
+
+
+def test_tuple():
+    assert compile_validator(Tuple[int, str])((1, "a"))
+    assert not compile_validator(Tuple[int, str])((1, 2))
+    assert not compile_validator(Tuple[int, str])((1,))
+    assert compile_validator(Tuple[int, ...])((1, 2, 3))
+    assert not compile_validator(Tuple[int, ...])((1, "a"))
+    assert compile_validator(Tuple[()])(())
+    assert not compile_validator(Tuple[()])((1,))
+
+
+def test_views():
+    assert compile_validator(ItemsView[str, int])({"a": 1}.items())
+    assert not compile_validator(ItemsView[str, int])({"a": "b"}.items())
+    assert compile_validator(KeysView[str])({"a": 1}.keys())
+    assert not compile_validator(ValuesView[str])({"a": 1}.values())
+    assert not compile_validator(Counter[str])(Counter([1]))
+
+
+class Bag(Collection[str], Generic[T]):
+    @override
+    def __contains__(self, item: object) -> bool:
+        return item == "a"
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        return iter("a")
+
+    @override
+    def __len__(self) -> int:
+        return 1
+
+
+def test_other_collection():
+    assert compile_validator(Bag[int])(Bag())
+
+
+def test_reified():
+    validate = compile_validator(Reified[int])
+    assert validate(Reified[int]())
+    assert not validate(Reified[str]())
+
+
+def test_intersection():
+    validate = compile_validator(Intersection[A, B])
+    assert validate(AB())
+    assert not validate(A())
+
+
+def test_type_and_type_form():
+    assert compile_validator(type[A])(AB)
+    assert not compile_validator(type[A])(B)
+    assert not compile_validator(type[A])(A())
+    assert compile_validator(TypeForm[int])(Literal[1])
+    assert not compile_validator(TypeForm[int])(1)
+    assert compile_validator(TypeForm)(Union[int, str])
+
+
+def test_unwrapped():
+    assert compile_validator(Annotated[int, "metadata"])(1)
+    assert compile_validator(cast(object, NewType("N", int)))(1)
+    assert compile_validator(TypeVar("U", bound=int))(1)
+    assert not compile_validator(TypeVar("U", int, str))(1.0)
+    assert compile_validator(Optional[TypeIs[int]])(True)  # noqa: FBT003
+
+
+# not the class syntax, as `NotRequired` isn't found in the string annotations
+Movie = TypedDict("Movie", {"title": str, "year": NotRequired[int]})  # noqa: UP013
+
+
+def test_typed_dict():
+    validate = compile_validator(Movie)
+    assert validate({"title": "a"})
+    assert validate({"title": "a", "year": 1, "other": None})
+    assert not validate({"title": 1})
+    assert not validate({"year": 1})
+    assert not validate({"title": "a", "year": "1"})
+    assert not validate([])
+    assert compile_validator(Union[Movie, int])(1)
+    assert not compile_validator(Union[Movie, int])({})
+
+
+class Closeable(Protocol):
+    def close(self) -> None:
+        ...
+
+
+@runtime_checkable
+class RuntimeCloseable(Protocol):
+    def close(self) -> None:
+        ...
+
+
+def test_protocol():
+    assert compile_validator(RuntimeCloseable)(io.StringIO())
+    assert not compile_validator(RuntimeCloseable)(1)
+    with raises(TypeError, match="runtime_checkable"):
+        compile_validator(Closeable)
+    with raises(TypeError, match="runtime_checkable"):
+        compile_validator(Union[Closeable, int])
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+def test_based():
+    class Based:
+        a: dict[str, list[1 | 2]]
+        b: A & B
+        c: "(int) -> str"  # noqa: F722
+
+    hints = get_type_hints(Based)
+    assert compile_validator(hints["a"])({"a": [1]})
+    assert not compile_validator(hints["a"])({"a": [3]})
+    assert compile_validator(hints["b"])(AB())
+    assert compile_validator(hints["c"])(str)
+    assert not compile_validator(hints["c"])(1)
+
+
+def test_cached():
+    assert compile_validator(List[int]) is compile_validator(List[int])
+
+
+def test_unhashable():
+    assert compile_validator(Annotated[int, []])(1)
+
+
+def test_forward_ref():
+    with raises(TypeError, match="forward reference"):
+        compile_validator(ForwardRef("int"))
+
+
+def test_sample():
+    validate = compile_validator(Dict[str, List[int]], sample=True)
+    assert validate({"a": [1] * 100})
+    assert not validate({"a": ["a"] * 100})
+    assert validate({})
+    assert validate({"a": []})
+    assert compile_validator(Tuple[int, ...], sample=True)((1, 2))
+    assert not compile_validator(Tuple[int, ...], sample=True)(("a",))
+
+
+@checked
+def checked_function(
+    a: 1 | 2,
+    b: str = None,  # type: ignore[assignment]
+    /,
+    *args: int,
+    c: A & B,
+    **kwargs: str,
+) -> str:
+    del b, args, c, kwargs
+    return str(a)
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+def test_checked():
+    assert checked_function(1, "b", 1, 2, c=AB(), d="d") == "1"
+    assert checked_function(2, c=AB()) == "2"
+    with raises(TypeError, match="argument 'a' must be"):
+        checked_function(3, c=AB())  # type: ignore[arg-type]
+    with raises(TypeError, match="argument 'b' must be"):
+        checked_function(1, 2, c=AB())  # type: ignore[arg-type]
+    with raises(TypeError, match="argument 'args' must be"):
+        checked_function(1, "b", "c", c=AB())  # type: ignore[arg-type]
+    with raises(TypeError, match="argument 'c' must be"):
+        checked_function(1, c=A())  # type: ignore[arg-type]
+    with raises(TypeError, match="argument 'kwargs' must be"):
+        checked_function(1, c=AB(), d=1)  # type: ignore[arg-type]
+    with raises(TypeError, match=r"^checked_function\(\) missing 1 required keyword-only argument"):
+        checked_function(1)  # type: ignore[call-arg]
+
+
+@skipIf(sys.version_info <= (3, 10), "unsupported")  # type: ignore[no-any-expr]
+def test_checked_return():
+    @checked
+    def f(a: object) -> int | None:
+        return a  # type: ignore[return-value]
+
+    assert f(1) == 1
+    assert f(None) is None
+    with raises(TypeError, match="must return"):
+        f("a")
+
+
+@checked
+def checked_forward_reference(a: Later) -> Later:
+    return a
+
+
+class Later:
+    @checked
+    def method(self, a: int) -> Later:
+        assert a
+        return self
+
+
+def test_checked_forward_reference():
+    assert isinstance(checked_forward_reference(Later()), Later)
+    with raises(TypeError):
+        checked_forward_reference(1)  # type: ignore[arg-type]
+
+
+def test_checked_method():
+    Later().method(1)
+    with raises(TypeError):
+        Later().method("a")  # type: ignore[arg-type]
+
+
+P = ParamSpec("P")
+Ts = TypeVarTuple("Ts")
+
+
+class Fluent:
+    @checked
+    def method(self, a: int) -> Self:
+        assert a
+        return self
+
+
+@checked
+def checked_literal_string(a: LiteralString) -> LiteralString:
+    return a
+
+
+@checked
+def checked_param_spec(*args: P.args, **kwargs: P.kwargs) -> int:
+    return len(args) + len(kwargs)
+
+
+@checked
+def checked_unpack(*args: Unpack[Ts]) -> tuple[Unpack[Ts]]:
+    return args
+
+
+def test_checked_self():
+    fluent = Fluent()
+    assert fluent.method(1) is fluent
+    with raises(TypeError):
+        fluent.method("a")  # type: ignore[arg-type]
+
+
+def test_checked_literal_string():
+    assert checked_literal_string("a") == "a"
+    with raises(TypeError):
+        checked_literal_string(1)  # type: ignore[arg-type]
+
+
+def test_checked_param_spec():
+    assert checked_param_spec(1, "a", b=None) == 3
+
+
+def test_checked_unpack():
+    assert checked_unpack(1, "a") == (1, "a")
+    assert checked_unpack() == ()
+
+
+def test_unchecked_forms():
+    for form in (Self, P, P.args, P.kwargs, Ts, Unpack[Ts]):  # type: ignore[attr-defined]
+        assert compile_validator(form) is _any
+    assert compile_validator(Tuple[int, Unpack[Ts]])(("a", "b"))
+    assert not compile_validator(Tuple[int, Unpack[Ts]])(["a"])
+    with raises(TypeError, match="not a form"):
+        compile_validator(1)
+
+
+def test_checked_async():
+    @checked(sample=True)
+    async def f(a: list[int]) -> int:
+        return len(a)
+
+    assert asyncio.run(f([1] * 10)) == 10
+    with raises(TypeError):
+        asyncio.run(f(["a"] * 10))  # type: ignore[list-item]
+
+
+def test_validate_iter():
+    iterator = validate_iter(iter([1, 2, "a", 3]), int)
+    assert next(iterator) == 1
+    assert next(iterator) == 2
+    with raises(TypeError, match="item 2 must be int, not str"):
+        next(iterator)
+
+
+def test_validate_iter_every():
+    assert list(validate_iter([1, "a", 2, "b"], int, every=2)) == [1, "a", 2, "b"]
+    with raises(ValueError, match="every"):
+        validate_iter([], int, every=0)
+
+
+def test_validate_aiter():
+    async def numbers() -> AsyncIterator[object]:
+        for item in (1, 2, "a"):
+            yield item
+
+    async def consume() -> list[object]:
+        return [item async for item in validate_aiter(numbers(), int)]
+
+    with raises(TypeError, match="item 2"):
+        asyncio.run(consume())
+
+
+def test_checked_iterator():
+    @checked
+    def f(items: list[object]) -> Iterator[int]:
+        return iter(items)  # type: ignore[arg-type]
+
+    @checked
+    async def g(items: list[object]) -> AsyncIterator[int]:
+        for item in items:
+            yield item  # type: ignore[misc]
+
+    assert list(f([1, 2])) == [1, 2]
+    iterator = f([1, "a"])
+    assert next(iterator) == 1
+    with raises(TypeError, match="item 1"):
+        next(iterator)
+
+    async def consume() -> list[object]:
+        return [item async for item in g([1, "a"])]
+
+    with raises(TypeError, match="item 1"):
+        asyncio.run(consume())
+
+
+def test_checked_generator():
+    @checked
+    def f(items: list[object]) -> Generator[int, int, str]:
+        total = 0
+        for item in items:
+            total += yield item  # type: ignore[misc]
+        return str(total)
+
+    generator = f([1, 2])
+    assert next(generator) == 1
+    assert generator.send(10) == 2
+    with raises(StopIteration) as stop:
+        generator.send(20)
+    assert cast(object, stop.value.value) == "30"
+    generator = f([1, "a"])
+    next(generator)
+    with raises(TypeError, match="item 1"):
+        generator.send(0)
+    generator = f([1, 2])
+    next(generator)
+    with raises(ValueError, match="thrown"):
+        generator.throw(ValueError("thrown"))
+
+
+def test_checked_async_generator():
+    @checked
+    async def g(items: list[object]) -> AsyncGenerator[int, int]:
+        for item in items:
+            assert (yield item) == 0  # type: ignore[misc]
+
+    async def consume(items: list[object]) -> list[int]:
+        generator = g(items)
+        result = [await cast(Awaitable[int], generator.__anext__())]
+        try:
+            while True:
+                result.append(await cast(Awaitable[int], generator.asend(0)))
+        except StopAsyncIteration:
+            return result
+
+    assert asyncio.run(consume([1, 2])) == [1, 2]
+    with raises(TypeError, match="item 1"):
+        asyncio.run(consume([1, "a"]))
+
+
+def test_instance_mask():
+    items = [AB(), A(), Reified[int](), Reified[str](), 1, AB()]
+    assert instance_mask(items, Intersection[A, B]) == [True, False, False, False, False, True]
+    assert instance_mask(items, Union[Reified[int], int]) == [
+        False,
+        False,
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert instance_mask([1, 2, True], Literal[1]) == [True, False, False]
+
+
+class _NDArray(Iterable[object], Protocol):
+    def tolist(self) -> List[object]:
+        ...
+
+
+class _NumPy(Protocol):
+    def array(self, values: List[object], dtype: type | None = ...) -> _NDArray:
+        ...
+
+
+def test_instance_mask_ndarray():
+    numpy = cast(_NumPy, importorskip("numpy"))
+    items = numpy.array([[AB(), A()], [B(), AB()]], dtype=object)
+    mask = cast(_NDArray, cast(object, instance_mask(items, Intersection[A, B])))
+    assert mask.tolist() == [[True, False], [False, True]]
+
+
+def test_filter_instances():
+    ab = AB()
+    assert filter_instances(iter([ab, A(), 1]), Intersection[A, B]) == [ab]
+    assert filter_instances([[1], ["a"], 1], List[int]) == [[1]]
+
+
+def test_partition():
+    ab = AB()
+    a = A()
+    ints, strs, abs_, rest = partition([1, "a", ab, 2, a, None], int, str, Intersection[A, B])
+    assert ints == [1, 2]
+    assert strs == ["a"]
+    assert abs_ == [ab]
+    assert rest == [a, None]
+    ones, rest = partition([1, 2, 1], Literal[1])
+    assert ones == [1, 1]
+    assert rest == [2]
+    assert partition([1]) == ([1],)
+
+
+def test_callable():
+    def f(a: int) -> str:
+        return str(a)
+
+    validate = compile_validator(Callable[[int], str])
+    assert validate(f)
+    assert not validate(compile_validator)
+    assert validate(str)
+    assert not validate(1)
+    assert compile_validator(Callable[..., object])(len)